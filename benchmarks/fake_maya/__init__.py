@@ -0,0 +1,45 @@
+"""Headless stand-in for the parts of Maya used by the core helpers.
+
+install() registers fake maya, maya.cmds, maya.OpenMaya, maya.api.OpenMaya
+and maya.api.OpenMayaAnim modules backed by an in-memory scene, so core.* can be
+imported and benchmarked with a plain Python interpreter. Every fake Maya
+call is counted; see counts and reset_counts.
+
+The fake models scene state, not Maya's performance: timings measured with it
+are useful to compare implementations of the same helper, while call counts
+show how many round trips a helper would make into Maya.
+"""
+
+import sys
+import types
+
+from benchmarks.fake_maya import anim, api, cmds, openmaya, scene
+from benchmarks.fake_maya.scene import counts, current, new_scene
+
+
+def install():
+    """Register the fake modules in sys.modules, replacing any real Maya modules."""
+    maya = types.ModuleType("maya")
+    maya_api = types.ModuleType("maya.api")
+    maya.cmds = cmds
+    maya.OpenMaya = openmaya
+    maya.api = maya_api
+    maya_api.OpenMaya = api
+    maya_api.OpenMayaAnim = anim
+
+    sys.modules.update({
+        "maya": maya,
+        "maya.cmds": cmds,
+        "maya.OpenMaya": openmaya,
+        "maya.api": maya_api,
+        "maya.api.OpenMaya": api,
+        "maya.api.OpenMayaAnim": anim,
+    })
+
+
+def reset_counts():
+    """Clear the call counters."""
+    counts.clear()
+
+
+__all__ = ["install", "reset_counts", "counts", "current", "new_scene", "scene"]
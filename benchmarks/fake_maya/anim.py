@@ -0,0 +1,5 @@
+"""Fake maya.api.OpenMayaAnim.
+
+Skinning is not modeled: the module only exists so helpers that bind skins
+(core.proxy) can be imported and their NumPy parts benchmarked.
+"""
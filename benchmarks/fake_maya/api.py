@@ -0,0 +1,660 @@
+"""Fake maya.api.OpenMaya (Python API 2.0) backed by the in-memory scene.
+
+Implements the classes and methods used by core.attribute, core.joint,
+core.scene, core.selection and core.control: selection lists, DAG paths,
+dependency/DAG function sets, plugs, DG/DAG modifiers, curve and matrix data,
+the DAG iterator, message callbacks and plug-in registration.
+"""
+
+import math
+
+from benchmarks.fake_maya import scene as scene_module
+from benchmarks.fake_maya.scene import ATTRIBUTES, counted
+
+
+def matches_type(node, type_name):
+    """Return True if a node matches a node type filter such as "joint" or "shape"."""
+    if type_name in (None, "dependNode", "dagNode"):
+        return True
+    if type_name == "shape":
+        return node.is_shape
+    if type_name == "transform":
+        return node.is_transform
+    return node.type == type_name
+
+
+class MFn:
+    kInvalid = 0
+    kDependencyNode = 1
+    kDagNode = 2
+    kTransform = 3
+    kJoint = 4
+    kShape = 5
+    kMesh = 6
+    kNurbsCurve = 7
+    kLocator = 8
+    kAttribute = 100
+    kNumericAttribute = 101
+    kUnitAttribute = 102
+    kCompoundAttribute = 103
+
+
+_NODE_FUNCTIONS = {
+    MFn.kDependencyNode: lambda node: True,
+    MFn.kDagNode: lambda node: True,
+    MFn.kTransform: lambda node: node.is_transform,
+    MFn.kJoint: lambda node: node.type == "joint",
+    MFn.kShape: lambda node: node.is_shape,
+    MFn.kMesh: lambda node: node.type == "mesh",
+    MFn.kNurbsCurve: lambda node: node.type == "nurbsCurve",
+    MFn.kLocator: lambda node: node.type == "locator",
+}
+
+
+class _Attribute:
+    """Attribute definition wrapped by MObject for plugs' attribute()."""
+
+    def __init__(self, name, kind, compound):
+        self.name = name
+        self.kind = kind
+        self.compound = compound
+
+
+class _Data:
+    """Typed attribute value (matrix or curve data) wrapped by MObject."""
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+class _PendingNode:
+    """Node queued on an MDagModifier; replaced by the real node on doIt."""
+
+    def __init__(self, node_type, parent):
+        self.type = node_type
+        self.name = None
+        self.parent = parent
+
+
+class MObject:
+    kNullObj = None
+
+    def __init__(self, item=None):
+        self._item = item
+
+    def isNull(self):
+        return self._item is None
+
+    def hasFn(self, fn):
+        item = self._item
+        if item is None:
+            return False
+        if isinstance(item, _Attribute):
+            if fn == MFn.kAttribute:
+                return True
+            if fn == MFn.kCompoundAttribute:
+                return item.compound
+            if fn == MFn.kUnitAttribute:
+                return not item.compound and item.kind in ("angle", "distance")
+            if fn == MFn.kNumericAttribute:
+                return item.compound or item.kind in ("bool", "int", "float", "double")
+            return False
+        check = _NODE_FUNCTIONS.get(fn)
+        return bool(check and check(item))
+
+    def __eq__(self, other):
+        return isinstance(other, MObject) and other._item is self._item
+
+    def __hash__(self):
+        return id(self._item)
+
+
+MObject.kNullObj = MObject()
+
+
+class MObjectHandle:
+    def __init__(self, obj):
+        self._obj = obj
+
+    def object(self):
+        return self._obj
+
+    def isValid(self):
+        return self._obj._item is not None and self._obj._item.alive
+
+    def isAlive(self):
+        return self.isValid()
+
+    def hashCode(self):
+        return self._obj._item.id if self._obj._item is not None else 0
+
+    def __eq__(self, other):
+        return isinstance(other, MObjectHandle) and self._obj._item is other._obj._item
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class MMatrix:
+    """Row-major 4x4 matrix supporting the sequence protocol (16 values)."""
+
+    def __init__(self, values=None):
+        self._values = [float(value) for value in values] if values is not None else \
+            [1.0 if row == column else 0.0 for row in range(4) for column in range(4)]
+
+    def __len__(self):
+        return 16
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def getElement(self, row, column):
+        return self._values[row * 4 + column]
+
+
+class MDagPath:
+    def __init__(self, node=None):
+        self._node = node
+
+    def node(self):
+        return MObject(self._node)
+
+    def fullPathName(self):
+        return self._node.full_path()
+
+    def partialPathName(self):
+        return self._node.name
+
+    def isValid(self):
+        return self._node is not None and self._node.alive
+
+    @counted("om2.MDagPath.inclusiveMatrix")
+    def inclusiveMatrix(self):
+        return MMatrix(self._node.world_matrix().ravel())
+
+    @counted("om2.MDagPath.exclusiveMatrix")
+    def exclusiveMatrix(self):
+        return MMatrix(self._node.parent_matrix().ravel())
+
+    def length(self):
+        return self._node.depth() + 1
+
+
+class MSelectionList:
+    def __init__(self):
+        self._nodes = []
+
+    @counted("om2.MSelectionList.add")
+    def add(self, name):
+        node = name._node if isinstance(name, MDagPath) else scene_module.current().find(name)
+        if node is None:
+            raise RuntimeError(f"(kInvalidParameter): Object does not exist: {name}")
+        self._nodes.append(node)
+        return self
+
+    def clear(self):
+        self._nodes = []
+        return self
+
+    def length(self):
+        return len(self._nodes)
+
+    def isEmpty(self):
+        return not self._nodes
+
+    def getDependNode(self, index):
+        return MObject(self._nodes[index])
+
+    def getDagPath(self, index):
+        return MDagPath(self._nodes[index])
+
+
+class MAngle:
+    kInvalid, kRadians, kDegrees = 0, 1, 2
+
+    def __init__(self, value=0.0, unit=kRadians):
+        self._degrees = value if unit == MAngle.kDegrees else math.degrees(value)
+
+    @staticmethod
+    def uiUnit():
+        return MAngle.kDegrees
+
+    def asDegrees(self):
+        return self._degrees
+
+    def asRadians(self):
+        return math.radians(self._degrees)
+
+    def asUnits(self, unit):
+        return self._degrees if unit == MAngle.kDegrees else math.radians(self._degrees)
+
+
+class MDistance:
+    kInvalid, kInches, kFeet, kYards, kMiles, kMillimeters, kCentimeters = range(7)
+
+    def __init__(self, value=0.0, unit=kCentimeters):
+        self._value = value
+
+    @staticmethod
+    def uiUnit():
+        return MDistance.kCentimeters
+
+    def asCentimeters(self):
+        return self._value
+
+    def asUnits(self, unit):
+        return self._value
+
+
+class MFnNumericData:
+    kInvalid, kBoolean, kByte, kChar, kShort, kInt, kFloat, kDouble = range(8)
+    k3Float, k3Double = 20, 21
+
+
+class MFnUnitAttribute:
+    kInvalid, kAngle, kDistance, kTime = range(4)
+
+    def __init__(self, obj):
+        self._attribute = obj._item
+
+    def unitType(self):
+        return MFnUnitAttribute.kAngle if self._attribute.kind == "angle" else MFnUnitAttribute.kDistance
+
+
+class MFnNumericAttribute:
+    _TYPES = {"bool": MFnNumericData.kBoolean, "int": MFnNumericData.kShort,
+              "float": MFnNumericData.kFloat, "double": MFnNumericData.kDouble}
+
+    def __init__(self, obj):
+        self._attribute = obj._item
+
+    def numericType(self):
+        if self._attribute.compound:
+            return MFnNumericData.k3Double
+        return self._TYPES[self._attribute.kind]
+
+
+class MPlug:
+    def __init__(self, node=None, attribute=None, index=None):
+        self._node = node
+        self._attribute = attribute
+        self._index = index
+
+    @property
+    def isNull(self):
+        return self._node is None
+
+    @property
+    def isCompound(self):
+        return self._index is None and ATTRIBUTES[self._attribute][1] > 1
+
+    @property
+    def isLocked(self):
+        return False
+
+    @property
+    def isDestination(self):
+        return False
+
+    def numChildren(self):
+        return ATTRIBUTES[self._attribute][1] if self.isCompound else 0
+
+    def child(self, index):
+        return MPlug(self._node, self._attribute, index)
+
+    def node(self):
+        return MObject(self._node)
+
+    def name(self):
+        kind, size, suffixes = ATTRIBUTES[self._attribute]
+        suffix = suffixes[self._index] if self._index is not None else ""
+        return f"{self._node.name}.{self._attribute}{suffix}"
+
+    def attribute(self):
+        kind = ATTRIBUTES[self._attribute][0]
+        return MObject(_Attribute(self._attribute, kind, self.isCompound))
+
+    def _value(self):
+        return self._node.get(self._attribute, self._index)
+
+    def asDouble(self):
+        value = self._value()
+        return math.radians(value) if ATTRIBUTES[self._attribute][0] == "angle" else float(value)
+
+    def asFloat(self):
+        return self.asDouble()
+
+    def asInt(self):
+        return int(self._value())
+
+    def asShort(self):
+        return int(self._value())
+
+    def asBool(self):
+        return bool(self._value())
+
+    def asMAngle(self):
+        return MAngle(self._value(), MAngle.kDegrees)
+
+    def asMDistance(self):
+        return MDistance(self._value())
+
+
+class MFnDependencyNode:
+    def __init__(self, obj=None):
+        self._node = obj._item if obj is not None else None
+
+    def name(self):
+        return self._node.name
+
+    def typeName(self):
+        return self._node.type
+
+    @counted("om2.MFnDependencyNode.findPlug")
+    def findPlug(self, attribute, want_networked_plug=False):
+        if attribute in self._node.values:
+            return MPlug(self._node, attribute)
+        for name, (kind, size, suffixes) in ATTRIBUTES.items():
+            if size > 1 and attribute.startswith(name) and attribute[len(name):] in suffixes \
+                    and name in self._node.values and len(attribute) == len(name) + 1:
+                return MPlug(self._node, name, suffixes.index(attribute[-1]))
+        raise RuntimeError(f"(kInvalidParameter): No plug named {attribute} on {self._node.name}")
+
+    def setDoNotWrite(self, flag):
+        self._node.do_not_write = flag
+
+
+class MFnDagNode(MFnDependencyNode):
+    def fullPathName(self):
+        return self._node.full_path()
+
+    def partialPathName(self):
+        return self._node.name
+
+    def childCount(self):
+        return len(self._node.children)
+
+    def child(self, index):
+        return MObject(self._node.children[index])
+
+    def parentCount(self):
+        return 1 if self._node.parent is not None else 0
+
+    def parent(self, index):
+        return MObject(self._node.parent)
+
+    def getPath(self):
+        return MDagPath(self._node)
+
+
+class MDGModifier:
+    """Queues plug values; doIt applies them and undoIt restores the old values."""
+
+    def __init__(self):
+        self._operations = []
+        self._previous = []
+
+    def _queue(self, plug, value):
+        self._operations.append((plug._node, plug._attribute, plug._index, value))
+
+    def newPlugValueBool(self, plug, value):
+        self._queue(plug, bool(value))
+
+    def newPlugValueInt(self, plug, value):
+        self._queue(plug, int(value))
+
+    def newPlugValueShort(self, plug, value):
+        self._queue(plug, int(value))
+
+    def newPlugValueDouble(self, plug, value):
+        self._queue(plug, float(value))
+
+    def newPlugValueFloat(self, plug, value):
+        self._queue(plug, float(value))
+
+    def newPlugValueMAngle(self, plug, angle):
+        self._queue(plug, angle.asDegrees())
+
+    def newPlugValueMDistance(self, plug, distance):
+        self._queue(plug, distance.asCentimeters())
+
+    def newPlugValue(self, plug, data):
+        self._queue(plug, data._item.value)
+
+    @counted("om2.MDGModifier.doIt")
+    def doIt(self):
+        self._previous = []
+        for node, attribute, index, value in self._operations:
+            self._previous.append(node.get(attribute, index) if index is not None else
+                                  _copy(node.get(attribute)))
+            node.set(attribute, value, index)
+
+    def undoIt(self):
+        for (node, attribute, index, _), value in reversed(list(zip(self._operations, self._previous))):
+            node.set(attribute, value, index)
+
+
+class MDagModifier(MDGModifier):
+    """Also creates nodes: they are added to the scene by doIt and deleted by undoIt."""
+
+    def __init__(self):
+        super().__init__()
+        self._created = []
+
+    def createNode(self, node_type, parent=MObject.kNullObj):
+        obj = MObject(_PendingNode(node_type, parent))
+        self._created.append(obj)
+        return obj
+
+    def renameNode(self, obj, name):
+        obj._item.name = name
+
+    @counted("om2.MDagModifier.doIt")
+    def doIt(self):
+        scene = scene_module.current()
+        for obj in self._created:
+            pending = obj._item
+            if isinstance(pending, _PendingNode):
+                parent = pending.parent._item if pending.parent is not None else None
+                obj._item = scene.create_node(pending.type, pending.name, parent)
+                obj._pending = pending
+        super().doIt()
+
+    def undoIt(self):
+        super().undoIt()
+        scene = scene_module.current()
+        for obj in reversed(self._created):
+            if obj._item.alive:
+                scene.delete(obj._item)
+            obj._item = obj._pending
+
+
+class MPointArray(list):
+    pass
+
+
+class MDoubleArray(list):
+    pass
+
+
+class MFnNurbsCurveData:
+    def create(self):
+        return MObject(_Data())
+
+
+class MFnNurbsCurve:
+    kOpen, kClosed, kPeriodic = 1, 2, 3
+
+    @counted("om2.MFnNurbsCurve.create")
+    def create(self, cvs, knots, degree, form, is_2d, rational, parent=MObject.kNullObj):
+        if len(knots) != len(cvs) + degree - 1:
+            raise RuntimeError(f"(kInvalidParameter): {len(knots)} knots for {len(cvs)} CVs of degree {degree}")
+        parent._item.value = {"cvs": [list(cv) for cv in cvs], "knots": list(knots), "degree": degree,
+                              "form": form}
+        return parent
+
+
+class MFnMatrixData:
+    def create(self, matrix):
+        return MObject(_Data(list(matrix)))
+
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
+
+
+class MItDag:
+    kDepthFirst, kBreadthFirst = 1, 2
+
+    @counted("om2.MItDag")
+    def __init__(self, traversal=kDepthFirst, filter_type=MFn.kInvalid):
+        self._filter = filter_type
+        self._start(None)
+
+    def reset(self, root=None, traversal=kDepthFirst, filter_type=None):
+        if filter_type is not None:
+            self._filter = filter_type
+        self._start(root._item if isinstance(root, MObject) else None)
+
+    def _start(self, root):
+        self._stack = [root] if root is not None else list(reversed(scene_module.current().roots))
+        self._current = None
+        self._advance()
+
+    def _advance(self):
+        check = _NODE_FUNCTIONS.get(self._filter)
+        while self._stack:
+            node = self._stack.pop()
+            self._stack.extend(reversed(node.children))
+            if not check or check(node):
+                self._current = node
+                return
+        self._current = None
+
+    def isDone(self):
+        return self._current is None
+
+    def next(self):
+        self._advance()
+
+    def prune(self):
+        children = self._current.children
+        if children:
+            del self._stack[len(self._stack) - len(children):]
+
+    def currentItem(self):
+        return MObject(self._current)
+
+    def fullPathName(self):
+        return self._current.full_path()
+
+    def getPath(self):
+        return MDagPath(self._current)
+
+    def depth(self):
+        return self._current.depth()
+
+
+class MPxCommand:
+    def __init__(self):
+        pass
+
+    def isUndoable(self):
+        return False
+
+
+class MFnPlugin:
+    def __init__(self, plugin=None, vendor="", version="", api_version="Any"):
+        self._plugin = plugin
+
+    def registerCommand(self, name, creator, syntax_creator=None):
+        from benchmarks.fake_maya import cmds
+
+        cmds._register_command(name, creator)
+
+    def deregisterCommand(self, name):
+        from benchmarks.fake_maya import cmds
+
+        cmds._deregister_command(name)
+
+    def registerNode(self, *args, **kwargs):
+        pass
+
+    def deregisterNode(self, *args, **kwargs):
+        pass
+
+
+class MMessage:
+    @staticmethod
+    def removeCallback(callback_id):
+        scene_module.current().remove_callback(callback_id)
+
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            scene_module.current().remove_callback(callback_id)
+
+
+class MDGMessage(MMessage):
+    @staticmethod
+    def addNodeAddedCallback(function, node_type="dependNode", client_data=None):
+        return scene_module.current().add_callback("nodeAdded", function, node_type)
+
+    @staticmethod
+    def addNodeRemovedCallback(function, node_type="dependNode", client_data=None):
+        return scene_module.current().add_callback("nodeRemoved", function, node_type)
+
+
+class MDagMessage(MMessage):
+    @staticmethod
+    def addParentAddedCallback(function, client_data=None):
+        return scene_module.current().add_callback("parentAdded", function)
+
+    @staticmethod
+    def addParentRemovedCallback(function, client_data=None):
+        return scene_module.current().add_callback("parentRemoved", function)
+
+
+class MNodeMessage(MMessage):
+    @staticmethod
+    def addNameChangedCallback(node, function, client_data=None):
+        return scene_module.current().add_callback("nameChanged", function)
+
+
+class MSceneMessage(MMessage):
+    kAfterNew, kAfterOpen, kAfterImport = "afterNew", "afterOpen", "afterImport"
+
+    @staticmethod
+    def addCallback(message, function, client_data=None):
+        return scene_module.current().add_callback(message, function)
+
+
+class MModelMessage(MMessage):
+    kActiveListModified = "activeListModified"
+
+    @staticmethod
+    def addCallback(message, function, client_data=None):
+        return scene_module.current().add_callback(message, function)
+
+
+class MGlobal:
+    @staticmethod
+    def getActiveSelectionList(ordered_selection_if_possible=False):
+        selection = MSelectionList()
+        selection._nodes = list(scene_module.current().selection)
+        return selection
+
+    @staticmethod
+    def displayWarning(message):
+        scene_module.current().messages.append(("warning", message))
+
+    @staticmethod
+    def displayError(message):
+        scene_module.current().messages.append(("error", message))
+
+    @staticmethod
+    def displayInfo(message):
+        scene_module.current().messages.append(("info", message))
@@ -0,0 +1,351 @@
+"""Fake maya.cmds backed by the in-memory scene.
+
+Each command accepts the flags used by MAKS Tools (long names only) and counts
+its calls in scene.counts under "cmds.<name>". Unsupported flags raise
+TypeError so a benchmark never silently measures a code path the fake does
+not model.
+"""
+
+import importlib.util as _importlib_util
+import os as _os
+
+import numpy as _np
+
+from benchmarks.fake_maya import scene as _scene_module
+from benchmarks.fake_maya.scene import ATTRIBUTES as _ATTRIBUTES
+from benchmarks.fake_maya.scene import counted as _counted
+from benchmarks.fake_maya.scene import euler_matrix as _euler_matrix
+from benchmarks.fake_maya.scene import matrix_euler as _matrix_euler
+
+_loaded_plugins = {}
+_script_jobs = {}
+# optionVars outlive scenes, like Maya's preferences.
+_option_vars = {}
+
+
+def _scene():
+    return _scene_module.current()
+
+
+def _as_list(nodes):
+    if nodes is None:
+        return []
+    if isinstance(nodes, str):
+        return [nodes]
+    flat = []
+    for node in nodes:
+        flat.extend(_as_list(node))
+    return flat
+
+
+def _resolve(nodes):
+    resolved = []
+    for name in _as_list(nodes):
+        node = _scene().find(name)
+        if node is None:
+            raise ValueError(f"No object matches name: {name}")
+        resolved.append(node)
+    return resolved
+
+
+def _name(node, long):
+    return node.full_path() if long else node.name
+
+
+def _split_plug(plug):
+    node_name, _, attribute = plug.partition(".")
+    node = _scene().find(node_name)
+    if node is None:
+        raise ValueError(f"No object matches name: {plug}")
+    if attribute in node.values:
+        return node, attribute, None
+    name, suffix = attribute[:-1], attribute[-1:]
+    if name in node.values and suffix in _ATTRIBUTES[name][2]:
+        return node, name, _ATTRIBUTES[name][2].index(suffix)
+    raise RuntimeError(f"setAttr: No object matches name: {plug}")
+
+
+# ------------------------------------------------------------------ queries
+@_counted("cmds.ls")
+def ls(*nodes, selection=False, type=None, long=False, **flags):
+    _check_flags("ls", flags, ("dagObjects", "transforms", "shapes"))
+    from benchmarks.fake_maya.api import matches_type
+
+    if selection:
+        candidates = list(_scene().selection)
+    elif nodes:
+        candidates = []
+        for name in _as_list(nodes):
+            node = _scene().find(name)
+            if node is not None:
+                candidates.append(node)
+    else:
+        candidates = list(_scene().iter_dag())
+
+    if flags.get("transforms"):
+        candidates = [node for node in candidates if node.is_transform]
+    if flags.get("shapes"):
+        candidates = [node for node in candidates if node.is_shape]
+    if type is not None:
+        types = _as_list(type)
+        candidates = [node for node in candidates if any(matches_type(node, name) for name in types)]
+    return [_name(node, long) for node in candidates]
+
+
+@_counted("cmds.listRelatives")
+def listRelatives(*nodes, children=False, allDescendents=False, parent=False, shapes=False,
+                  type=None, fullPath=False, noIntermediate=False):
+    from benchmarks.fake_maya.api import matches_type
+
+    result = []
+    for node in _resolve(nodes):
+        if parent:
+            relatives = [node.parent] if node.parent is not None else []
+        elif allDescendents:
+            # Maya returns descendants deepest first.
+            relatives = list(node.descendants())[::-1]
+        else:
+            relatives = list(node.children)
+        if shapes:
+            relatives = [relative for relative in relatives if relative.is_shape]
+        if type is not None:
+            relatives = [relative for relative in relatives
+                         if any(matches_type(relative, name) for name in _as_list(type))]
+        result.extend(relatives)
+
+    if not result:
+        return None
+    return [_name(node, fullPath) for node in result]
+
+
+@_counted("cmds.objExists")
+def objExists(name):
+    return _scene().find(name) is not None
+
+
+@_counted("cmds.getAttr")
+def getAttr(plug):
+    node, attribute, index = _split_plug(plug)
+    value = node.get(attribute, index)
+    return [tuple(value)] if isinstance(value, list) else value
+
+
+@_counted("cmds.setAttr")
+def setAttr(plug, *values, type=None):
+    node, attribute, index = _split_plug(plug)
+    previous = node.get(attribute, index)
+    previous = list(previous) if isinstance(previous, list) else previous
+    value = list(values) if len(values) > 1 else values[0]
+    node.set(attribute, value, index)
+    _scene().record_undo(lambda: node.set(attribute, previous, index),
+                         lambda: node.set(attribute, value, index))
+
+
+@_counted("cmds.xform")
+def xform(*nodes, query=False, worldSpace=False, objectSpace=False, relative=False,
+          translation=None, matrix=None, rotateAxis=None, rotation=None):
+    targets = _resolve(nodes)
+    if query:
+        values = []
+        for node in targets:
+            world = node.world_matrix() if worldSpace else node.local_matrix()
+            if translation:
+                values.extend(world[3, :3].tolist())
+            elif matrix:
+                values.extend(world.ravel().tolist())
+            elif rotation:
+                values.extend(node.get("rotate"))
+            else:
+                raise TypeError("xform query only supports translation, matrix and rotation")
+        return values
+
+    for node in targets:
+        if rotateAxis is not None:
+            current = node.get("rotateAxis") if relative else [0.0, 0.0, 0.0]
+            setAttr(f"{node.full_path()}.rotateAxis", *_np.add(current, rotateAxis).tolist())
+        if translation is not None:
+            setAttr(f"{node.full_path()}.translate", *translation)
+        if rotation is not None:
+            setAttr(f"{node.full_path()}.rotate", *rotation)
+
+
+# ------------------------------------------------------------------ joints
+@_counted("cmds.joint")
+def joint(*nodes, edit=False, zeroScaleOrient=False, orientJoint=None, secondaryAxisOrient=None,
+          autoOrientSecondaryAxis=False, children=False, **flags):
+    if orientJoint is not None or flags:
+        raise TypeError("The fake scene only supports joint(edit=True, zeroScaleOrient=True)")
+    _resolve(nodes)
+
+
+@_counted("cmds.makeIdentity")
+def makeIdentity(*nodes, apply=False, translate=False, rotate=False, scale=False, normal=0):
+    if not apply or translate or scale:
+        raise TypeError("The fake scene only supports makeIdentity(apply=True, rotate=True)")
+    for node in _resolve(nodes):
+        if node.type != "joint" or not rotate:
+            continue
+        orient = _euler_matrix(node.get("rotateAxis")) @ _euler_matrix(node.get("rotate")) \
+            @ _euler_matrix(node.get("jointOrient"))
+        setAttr(f"{node.full_path()}.jointOrient", *_matrix_euler(orient).tolist())
+        setAttr(f"{node.full_path()}.rotate", 0.0, 0.0, 0.0)
+        setAttr(f"{node.full_path()}.rotateAxis", 0.0, 0.0, 0.0)
+
+
+# ------------------------------------------------------------------- scene
+@_counted("cmds.createNode")
+def createNode(node_type, name=None, parent=None, skipSelect=False):
+    node = _scene().create_node(node_type, name, parent)
+    if node.is_shape and parent is None:
+        transform = _scene().create_node("transform", node.name.replace("Shape", "") or "transform1")
+        node.set_parent(transform)
+        _scene().roots.remove(node)
+    if not skipSelect:
+        _scene().selection = [node]
+    _scene().record_undo(lambda: _scene().delete(node.parent if node.is_shape else node), None)
+    return node.name
+
+
+@_counted("cmds.delete")
+def delete(*nodes):
+    for node in _resolve(nodes):
+        if node.alive:
+            _scene().delete(node)
+
+
+@_counted("cmds.select")
+def select(*nodes, replace=True, add=False, clear=False):
+    resolved = [] if clear else _resolve(nodes)
+    _scene().selection = (_scene().selection if add else []) + resolved
+    _scene().emit("activeListModified")
+
+
+@_counted("cmds.colorIndex")
+def colorIndex(index, query=False):
+    # Deterministic stand-in for Maya's default palette.
+    return [((index * 37) % 32) / 31.0, ((index * 11) % 32) / 31.0, ((index * 5) % 32) / 31.0]
+
+
+@_counted("cmds.scriptJob")
+def scriptJob(event=None, exists=None, kill=None, parent=None):
+    if exists is not None:
+        return exists in _script_jobs
+    if kill is not None:
+        _script_jobs.pop(kill, None)
+        return None
+    job_id = len(_script_jobs) + 1
+    _script_jobs[job_id] = event
+    return job_id
+
+
+@_counted("cmds.refresh")
+def refresh(currentView=False, force=False):
+    pass
+
+
+# ------------------------------------------------------------- preferences
+@_counted("cmds.optionVar")
+def optionVar(exists=None, query=None, remove=None, stringValue=None, intValue=None, floatValue=None):
+    if exists is not None:
+        return exists in _option_vars
+    if query is not None:
+        return _option_vars.get(query, 0)
+    if remove is not None:
+        _option_vars.pop(remove, None)
+    for value in (stringValue, intValue, floatValue):
+        if value is not None:
+            _option_vars[value[0]] = value[1]
+
+
+# -------------------------------------------------------------------- undo
+@_counted("cmds.undoInfo")
+def undoInfo(query=False, openChunk=False, closeChunk=False, stateWithoutFlush=None, state=None, chunkName=None):
+    scene = _scene()
+    if query:
+        return scene.undo_enabled
+    if stateWithoutFlush is not None:
+        scene.undo_enabled = bool(stateWithoutFlush)
+    if state is not None:
+        scene.undo_enabled = bool(state)
+        if not state:
+            scene.undo_queue = []
+    if openChunk:
+        scene.chunk_depth += 1
+        scene.undo_queue.append("chunk")
+    if closeChunk and scene.chunk_depth:
+        scene.chunk_depth -= 1
+        entries = []
+        while scene.undo_queue and scene.undo_queue[-1] != "chunk":
+            entries.append(scene.undo_queue.pop())
+        scene.undo_queue.pop()
+        if entries:
+            scene.undo_queue.append((lambda: [undo() for undo, _ in entries],
+                                     lambda: [redo() for _, redo in reversed(entries) if redo]))
+
+
+@_counted("cmds.undo")
+def undo():
+    scene = _scene()
+    while scene.undo_queue and scene.undo_queue[-1] == "chunk":
+        scene.undo_queue.pop()
+    if scene.undo_queue:
+        entry = scene.undo_queue.pop()
+        entry[0]()
+        scene.redo_queue.append(entry)
+
+
+@_counted("cmds.redo")
+def redo():
+    scene = _scene()
+    if scene.redo_queue:
+        entry = scene.redo_queue.pop()
+        if entry[1]:
+            entry[1]()
+        scene.undo_queue.append(entry)
+
+
+# ----------------------------------------------------------------- plugins
+@_counted("cmds.pluginInfo")
+def pluginInfo(plugin, query=False, loaded=False):
+    return _os.path.abspath(plugin) in _loaded_plugins
+
+
+@_counted("cmds.loadPlugin")
+def loadPlugin(path, quiet=False):
+    path = _os.path.abspath(path)
+    if path in _loaded_plugins:
+        return [_os.path.splitext(_os.path.basename(path))[0]]
+
+    from benchmarks.fake_maya import api
+
+    name = _os.path.splitext(_os.path.basename(path))[0]
+    spec = _importlib_util.spec_from_file_location(f"fake_maya_plugin_{name}", path)
+    module = _importlib_util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.initializePlugin(api.MObject())
+    _loaded_plugins[path] = module
+    return [name]
+
+
+def _register_command(name, creator):
+    """Expose an MPxCommand as cmds.<name>, recording it on the undo queue."""
+
+    @_counted(f"cmds.{name}")
+    def command(*args, **kwargs):
+        instance = creator()
+        instance.doIt(args)
+        if instance.isUndoable():
+            _scene().record_undo(instance.undoIt, instance.redoIt)
+
+    command.__name__ = name
+    globals()[name] = command
+
+
+def _deregister_command(name):
+    globals().pop(name, None)
+
+
+def _check_flags(command, flags, supported):
+    unknown = set(flags) - set(supported)
+    if unknown:
+        raise TypeError(f"{command}: unsupported flags {sorted(unknown)}")
@@ -0,0 +1,5 @@
+"""Fake maya.OpenMaya (Python API 1.0); only MGlobal messages are used."""
+
+from benchmarks.fake_maya.api import MGlobal
+
+__all__ = ["MGlobal"]
@@ -0,0 +1,325 @@
+"""In-memory DAG backing the fake maya.cmds and maya.api.OpenMaya modules.
+
+Only what the MAKS Tools helpers touch is modelled: transforms, joints and a
+few shape types, their transform/display attributes, world matrices, the
+selection, DG/DAG callbacks and a simple undo queue.
+"""
+
+import collections
+import itertools
+
+import numpy as np
+
+SHAPE_TYPES = ("mesh", "nurbsCurve", "locator")
+TRANSFORM_TYPES = ("transform", "joint")
+
+# attribute name -> (value kind, child count, child suffixes)
+ATTRIBUTES = {
+    "translate": ("distance", 3, "XYZ"),
+    "rotate": ("angle", 3, "XYZ"),
+    "rotateAxis": ("angle", 3, "XYZ"),
+    "jointOrient": ("angle", 3, "XYZ"),
+    "scale": ("double", 3, "XYZ"),
+    "overrideColorRGB": ("float", 3, "RGB"),
+    "visibility": ("bool", 1, ""),
+    "displayLocalAxis": ("bool", 1, ""),
+    "hiddenInOutliner": ("bool", 1, ""),
+    "overrideEnabled": ("bool", 1, ""),
+    "overrideRGBColors": ("bool", 1, ""),
+    "overrideColor": ("int", 1, ""),
+    "offsetParentMatrix": ("data", 1, ""),
+    "cached": ("data", 1, ""),
+}
+
+COMMON_ATTRIBUTES = ("visibility", "hiddenInOutliner", "overrideEnabled", "overrideRGBColors",
+                     "overrideColor", "overrideColorRGB")
+TRANSFORM_ATTRIBUTES = COMMON_ATTRIBUTES + ("translate", "rotate", "rotateAxis", "scale", "displayLocalAxis",
+                                            "offsetParentMatrix")
+CURVE_ATTRIBUTES = COMMON_ATTRIBUTES + ("cached",)
+JOINT_ATTRIBUTES = TRANSFORM_ATTRIBUTES + ("jointOrient",)
+
+MATRIX_ATTRIBUTES = ("translate", "rotate", "rotateAxis", "jointOrient", "scale", "offsetParentMatrix")
+
+DEFAULTS = {
+    "scale": (1.0, 1.0, 1.0),
+    "visibility": True,
+    "offsetParentMatrix": None,
+    "cached": None,
+}
+
+counts = collections.Counter()
+
+
+def counted(name):
+    """Decorator counting calls of a fake Maya function under `name`."""
+
+    def decorator(function):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return function(*args, **kwargs)
+
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+    return decorator
+
+
+def euler_matrix(angles):
+    """Return the 3x3 row-vector rotation matrix for XYZ Euler angles in degrees."""
+    x, y, z = np.radians(angles)
+    cx, sx, cy, sy, cz, sz = np.cos(x), np.sin(x), np.cos(y), np.sin(y), np.cos(z), np.sin(z)
+    rx = np.array([[1, 0, 0], [0, cx, sx], [0, -sx, cx]])
+    ry = np.array([[cy, 0, -sy], [0, 1, 0], [sy, 0, cy]])
+    rz = np.array([[cz, sz, 0], [-sz, cz, 0], [0, 0, 1]])
+    return rx @ ry @ rz
+
+
+def matrix_euler(matrix):
+    """Return XYZ Euler angles in degrees for a 3x3 row-vector rotation matrix."""
+    sy = np.clip(-matrix[0, 2], -1.0, 1.0)
+    if np.hypot(matrix[0, 0], matrix[0, 1]) < 1e-6:
+        return np.degrees([np.arctan2(-matrix[2, 1], matrix[1, 1]), np.arcsin(sy), 0.0])
+    return np.degrees([np.arctan2(matrix[1, 2], matrix[2, 2]), np.arcsin(sy),
+                       np.arctan2(matrix[0, 1], matrix[0, 0])])
+
+
+class Node:
+    """A DAG node with attribute values stored in a dict."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, scene, node_type, name, parent=None):
+        self.id = next(self._ids)
+        self.scene = scene
+        self.type = node_type
+        self.name = name
+        self.parent = None
+        self.children = []
+        self.alive = True
+
+        if node_type == "joint":
+            names = JOINT_ATTRIBUTES
+        elif node_type in TRANSFORM_TYPES:
+            names = TRANSFORM_ATTRIBUTES
+        elif node_type == "nurbsCurve":
+            names = CURVE_ATTRIBUTES
+        else:
+            names = COMMON_ATTRIBUTES
+        self.values = {}
+        for attribute in names:
+            kind, size, _ = ATTRIBUTES[attribute]
+            default = DEFAULTS.get(attribute, [0.0] * size if size > 1 else (False if kind == "bool" else 0))
+            self.values[attribute] = list(default) if size > 1 else default
+
+        if parent is not None:
+            self.set_parent(parent)
+
+    def __repr__(self):
+        return f"Node({self.full_path()!r})"
+
+    @property
+    def is_transform(self):
+        return self.type in TRANSFORM_TYPES
+
+    @property
+    def is_shape(self):
+        return self.type in SHAPE_TYPES
+
+    def set_parent(self, parent):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self)
+        self.scene.world_version += 1
+
+    def full_path(self):
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(parts))
+
+    def depth(self):
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    def descendants(self):
+        """Yield descendants depth-first, parents before children."""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def local_matrix(self):
+        matrix = np.eye(4)
+        if not self.is_transform:
+            return matrix
+        rotation = euler_matrix(self.values["rotateAxis"]) @ euler_matrix(self.values["rotate"])
+        if self.type == "joint":
+            rotation = rotation @ euler_matrix(self.values["jointOrient"])
+        matrix[:3, :3] = np.diag(self.values["scale"]) @ rotation
+        matrix[3, :3] = self.values["translate"]
+        if self.values["offsetParentMatrix"] is not None:
+            matrix = matrix @ np.asarray(self.values["offsetParentMatrix"], dtype=float).reshape(4, 4)
+        return matrix
+
+    def world_matrix(self):
+        cached = self.scene.world_cache.get(self.id)
+        if cached is not None and cached[0] == self.scene.world_version:
+            return cached[1]
+        matrix = self.local_matrix()
+        if self.parent is not None:
+            matrix = matrix @ self.parent.world_matrix()
+        self.scene.world_cache[self.id] = (self.scene.world_version, matrix)
+        return matrix
+
+    def parent_matrix(self):
+        return self.parent.world_matrix() if self.parent is not None else np.eye(4)
+
+    def get(self, attribute, index=None):
+        value = self.values[attribute]
+        return value if index is None else value[index]
+
+    def set(self, attribute, value, index=None):
+        if index is None:
+            self.values[attribute] = list(value) if isinstance(value, (list, tuple, np.ndarray)) and \
+                isinstance(self.values[attribute], list) else value
+        else:
+            self.values[attribute][index] = value
+        if attribute in MATRIX_ATTRIBUTES:
+            self.scene.world_version += 1
+
+
+class Scene:
+    """The fake scene: nodes by name, selection, callbacks and undo queue."""
+
+    def __init__(self):
+        self.nodes = {}
+        self.roots = []
+        self.selection = []
+        self.world_cache = {}
+        self.world_version = 0
+
+        self.callbacks = {}
+        self._callback_ids = itertools.count(1)
+
+        self.undo_enabled = True
+        self.undo_queue = []
+        self.redo_queue = []
+        self.chunk_depth = 0
+        self.messages = []
+
+    # ----------------------------------------------------------- nodes
+    def unique_name(self, name):
+        if name not in self.nodes:
+            return name
+        base = name.rstrip("0123456789") or name
+        for index in itertools.count(1):
+            candidate = f"{base}{index}"
+            if candidate not in self.nodes:
+                return candidate
+
+    def create_node(self, node_type, name=None, parent=None):
+        if isinstance(parent, str):
+            parent = self.find(parent)
+        node = Node(self, node_type, self.unique_name(name or f"{node_type}1"))
+        self.nodes[node.name] = node
+        if parent is not None:
+            node.set_parent(parent)
+        else:
+            self.roots.append(node)
+
+        self.emit("nodeAdded", node)
+        if parent is not None:
+            self.emit("parentAdded", node, parent)
+        return node
+
+    def delete(self, node):
+        for child in list(node.children):
+            self.delete(child)
+        self.emit("nodeRemoved", node)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        else:
+            self.roots.remove(node)
+        del self.nodes[node.name]
+        node.alive = False
+        self.world_version += 1
+        if node in self.selection:
+            self.selection.remove(node)
+            self.emit("activeListModified")
+
+    def find(self, name):
+        """Return the node for a short name, DAG path or plug-less path, or None."""
+        if not name:
+            return None
+        node = self.nodes.get(name.rpartition("|")[2])
+        if node is None or ("|" in name and node.full_path() != ("|" + name.lstrip("|"))):
+            return None
+        return node
+
+    def iter_dag(self):
+        for root in list(self.roots):
+            yield root
+            yield from root.descendants()
+
+    # ------------------------------------------------------- callbacks
+    def add_callback(self, message, function, filter_type=None):
+        callback_id = next(self._callback_ids)
+        self.callbacks[callback_id] = (message, function, filter_type)
+        return callback_id
+
+    def remove_callback(self, callback_id):
+        self.callbacks.pop(callback_id, None)
+
+    def emit(self, message, *nodes):
+        if not self.callbacks:
+            return
+        from benchmarks.fake_maya import api
+
+        for registered, function, filter_type in list(self.callbacks.values()):
+            if registered != message:
+                continue
+            if message in ("nodeAdded", "nodeRemoved"):
+                if not api.matches_type(nodes[0], filter_type):
+                    continue
+                function(api.MObject(nodes[0]), None)
+            elif message in ("parentAdded", "parentRemoved"):
+                function(api.MDagPath(nodes[0]), api.MDagPath(nodes[1]), None)
+            elif message == "nameChanged":
+                function(api.MObject(nodes[0]), nodes[1], None)
+            else:
+                function(None)
+
+    # ------------------------------------------------------------ undo
+    def record_undo(self, undo, redo):
+        if self.undo_enabled:
+            self.undo_queue.append((undo, redo))
+            self.redo_queue = []
+
+
+scene = Scene()
+
+
+def new_scene():
+    """Replace the current fake scene with an empty one and return it."""
+    global scene
+    previous = scene
+    scene = Scene()
+    scene.callbacks = previous.callbacks
+    scene._callback_ids = previous._callback_ids
+    scene.emit("afterNew")
+    return scene
+
+
+def current():
+    """Return the current fake scene."""
+    return scene
@@ -0,0 +1,245 @@
+"""Benchmark the core helpers against synthetic scenes in the headless Maya stand-in.
+
+Usage (from the repository root):
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 1000 10000 --repeat 5 --json results.json
+
+Each scene holds joint chains and curve controls (a transform with a
+nurbsCurve shape), split evenly by node count. For every helper the best wall
+time over --repeat runs is reported along with the number of fake Maya calls
+one run made, grouped by call.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import fake_maya  # noqa: E402
+
+fake_maya.install()
+
+import numpy as np  # noqa: E402
+
+from core.analysis import OrientAnalyzer  # noqa: E402
+from core.color import ColorHelper  # noqa: E402
+from core.control import ControlHelper  # noqa: E402
+from core.joint import JointHelper  # noqa: E402
+from core.meshcache import MeshCache  # noqa: E402
+from core.meshdata import MeshData  # noqa: E402
+from core.mirror import MirrorHelper  # noqa: E402
+from core.proxy import ProxyHelper  # noqa: E402
+from core.scene import SceneIndex  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+CHAIN_LENGTH = 10
+# Faces of the synthetic mesh per scene node, for the mesh benchmarks.
+FACES_PER_NODE = 10
+POLYGROUP_COUNT = 64
+
+
+def build_scene(node_count, seed=0):
+    """Create a fresh fake scene with about node_count DAG nodes.
+
+    Args:
+        node_count (int): Total number of transforms, joints and shapes.
+        seed (int): Seed for the random joint positions.
+
+    Returns:
+        tuple[list[str], list[str]]: Root joints of every chain and the
+        control transforms, as full paths.
+    """
+    scene = fake_maya.new_scene()
+    random = np.random.default_rng(seed)
+
+    roots = []
+    joint_count = node_count // 2
+    for chain in range(max(joint_count // CHAIN_LENGTH, 1)):
+        parent = None
+        for link in range(CHAIN_LENGTH):
+            joint = scene.create_node("joint", f"chain{chain}_jnt{link}", parent)
+            offset = (0.0, 2.0, 0.0) if parent is not None else (0.0, 0.0, 0.0)
+            joint.set("translate", random.uniform(-1.0, 1.0, 3) + offset)
+            joint.set("jointOrient", random.uniform(-30.0, 30.0, 3))
+            if parent is None:
+                roots.append(joint.full_path())
+            parent = joint
+
+    controls = []
+    for control in range(max((node_count - joint_count) // 2, 1)):
+        transform = scene.create_node("transform", f"ctrl{control}")
+        transform.set("translate", random.uniform(-50.0, 50.0, 3))
+        scene.create_node("nurbsCurve", f"ctrl{control}Shape", transform)
+        controls.append(transform.full_path())
+
+    return roots, controls
+
+
+def build_mesh(face_count, polygroup_count=POLYGROUP_COUNT, seed=0):
+    """Return a quad grid of about face_count faces split into polygroup bands.
+
+    Args:
+        face_count (int): Approximate number of faces.
+        polygroup_count (int): Number of polygroups.
+        seed (int): Seed for the random point heights.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    side = max(int(np.sqrt(face_count)), 1)
+    grid = np.stack(np.meshgrid(np.arange(side + 1), np.arange(side + 1)), -1).reshape(-1, 2)
+    heights = np.random.default_rng(seed).uniform(-0.1, 0.1, len(grid))
+    points = np.column_stack([grid[:, 0], heights, grid[:, 1]])
+
+    faces = np.arange(side * side)
+    corners = faces // side * (side + 1) + faces % side
+    indices = np.stack([corners, corners + side + 1, corners + side + 2, corners + 1], axis=1)
+    polygroups = faces * polygroup_count // len(faces)
+    return MeshData("grid", points, np.full(len(faces), 4), indices.reshape(-1), polygroups)
+
+
+def mesh_cache_benchmarks(size):
+    """Return (name, setup, function) triples timing MeshCache on a synthetic mesh."""
+    folder = tempfile.mkdtemp(prefix="maks_mesh_cache_")
+    atexit.register(shutil.rmtree, folder, True)
+    source = os.path.join(folder, "grid.usd")
+    cache = MeshCache(os.path.join(folder, "cache"))
+    mesh = build_mesh(size * FACES_PER_NODE)
+    regrouped = MeshData(mesh.name, mesh.points, mesh.face_counts, mesh.face_indices, mesh.polygroups[::-1])
+
+    def write_source(content):
+        with open(source, "w") as handle:
+            handle.write(content)
+
+    def clean():
+        write_source("grid")
+        shutil.rmtree(cache.root, ignore_errors=True)
+
+    def fill():
+        clean()
+        consume(cache.read(source, lambda path: iter([mesh])))
+
+    def edit_source():
+        fill()
+        write_source("regrouped grid")
+
+    def read(meshes):
+        # Touch every array as a mesh builder would.
+        return lambda: consume(mesh_data.points.sum() + mesh_data.face_indices.sum()
+                               for mesh_data in cache.read(source, lambda path: iter(meshes)))
+
+    return (
+        ("mesh_cache(miss)", clean, read([mesh])),
+        ("mesh_cache(hit)", fill, read([mesh])),
+        ("mesh_cache(regrouped)", edit_source, read([regrouped])),
+    )
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def select(nodes):
+    # Bypasses the counted cmds.select but notifies selection listeners like it.
+    fake_maya.current().selection = [fake_maya.current().find(node) for node in nodes]
+    fake_maya.current().emit("activeListModified")
+
+
+def benchmarks(roots, controls):
+    """Return (name, setup, function) triples for the helpers to measure."""
+    all_joints = SceneIndex.instance().joints()
+
+    spawned = []
+
+    def cold_index():
+        SceneIndex.instance().invalidate()
+
+    def clear_spawned():
+        # Delete the previous run's controls so every run spawns into the same scene.
+        if spawned:
+            fake_maya.cmds.delete(spawned)
+            spawned.clear()
+
+    return (
+        ("get_joints(all, cold index)", cold_index, lambda: JointHelper.get_joints(all_joints=True)),
+        ("get_joints(all, warm index)", None, lambda: JointHelper.get_joints(all_joints=True)),
+        ("get_joints(hierarchy)", lambda: select(roots), lambda: JointHelper.get_joints(hierarchy=True)),
+        ("set_local_axis_visibility", None, lambda: JointHelper.set_local_axis_visibility(all_joints, True)),
+        ("orient_joints", None, lambda: JointHelper.orient_joints(all_joints, "xyz", "yup", use_cache=False)),
+        ("orient_joints(cached)", None, lambda: JointHelper.orient_joints(all_joints, "xyz", "yup")),
+        ("analyze_orientation", None, lambda: OrientAnalyzer.analyze(all_joints, "xyz")),
+        ("rotate_local_axes", None, lambda: JointHelper.rotate_local_axes(all_joints, (90, 0, 0))),
+        ("mirror_orientations(position)", None,
+         lambda: MirrorHelper.mirror_orientations(all_joints, match="position", tolerance=0.5)),
+        ("override_color", lambda: select(controls), lambda: ColorHelper.override_color(17)),
+        ("override_gradient(chain)", lambda: select(controls),
+         lambda: ColorHelper.override_gradient((1, 0, 0), (0, 0, 1), "chain")),
+        ("skin_proxy_mesh", None,
+         lambda: ProxyHelper.proxy_mesh_data(JointHelper.read_joint_arrays(all_joints))),
+        ("spawn_controls", clear_spawned,
+         lambda: spawned.extend(ControlHelper.spawn_controls("circle", all_joints, color=17))),
+    )
+
+
+def measure(setup, function, repeat):
+    """Time function, returning the best time and the call counts of one run."""
+    best = float("inf")
+    calls = {}
+    for _ in range(repeat):
+        if setup:
+            setup()
+        fake_maya.reset_counts()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+        calls = dict(fake_maya.counts)
+    return best, calls
+
+
+def run(sizes, repeat, only=None):
+    results = []
+    for size in sizes:
+        roots, controls = build_scene(size)
+        # Keep the undo queue from growing across runs.
+        fake_maya.cmds.undoInfo(state=False)
+        for name, setup, function in benchmarks(roots, controls) + mesh_cache_benchmarks(size):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            seconds, calls = measure(setup, function, repeat)
+            results.append({"nodes": size, "benchmark": name, "seconds": seconds, "calls": calls})
+            print_result(results[-1])
+    return results
+
+
+def print_result(result):
+    calls = ", ".join(f"{name}={count}" for name, count in sorted(result["calls"].items(),
+                                                                   key=lambda item: -item[1]))
+    print(f"{result['nodes']:>7} nodes  {result['benchmark']:<28} {result['seconds'] * 1000:>10.2f} ms  "
+          f"{sum(result['calls'].values()):>7} calls  {calls}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Scene sizes in DAG nodes (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best is kept.")
+    parser.add_argument("--only", nargs="+", help="Run only benchmarks whose name contains one of these.")
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.only)
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
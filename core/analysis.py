@@ -0,0 +1,209 @@
+"""Vectorized checks of joint orientation quality.
+
+OrientAnalyzer reads a skeleton once with JointHelper.read_joint_arrays and
+computes every metric as array operations over all joints:
+- up_angles: angle between a joint's up axis and its parent's; above
+  FLIP_ANGLE the secondary axis is considered flipped.
+- aim_errors: angle between the aim axis and the direction to the first child.
+- scale_residues / shear_residues: how far the joint's local matrix is from a
+  pure rotation (scale other than 1, axes that are not perpendicular).
+
+Flipped and mis-aimed joints can be fixed in one batched write; scale and shear
+are only reported since removing them would move the joints below.
+"""
+
+import numpy as np
+
+from core.constants import ORIENT_ORDERS
+from core.joint import JointHelper
+from core.orient import OrientSolver
+from core.profiling import profiled
+
+
+class OrientReport:
+    """Per-joint orientation metrics of one analysis.
+
+    Attributes:
+        arrays (JointArrays): The snapshot that was analyzed.
+        orient_order (str): Aim/up axes the joints were checked against.
+        up_angles (numpy.ndarray): (N,) degrees between up axes of joint and
+            parent; NaN for joints without a parent in the set.
+        aim_errors (numpy.ndarray): (N,) degrees between the aim axis and the
+            first child; NaN for leaf joints.
+        scale_residues (numpy.ndarray): (N,) largest deviation of a local axis
+            length from 1.
+        shear_residues (numpy.ndarray): (N,) largest cosine between two local axes.
+        checked (numpy.ndarray): (N,) boolean mask of the joints that were
+            asked for; the others are direct children read for reference.
+        flipped, misaimed, skewed (numpy.ndarray): (N,) boolean masks of the
+            checked joints failing each check.
+    """
+
+    def __init__(self, arrays, orient_order, up_angles, aim_errors, scale_residues, shear_residues, checked):
+        self.arrays = arrays
+        self.checked = checked
+        self.orient_order = orient_order
+        self.up_angles = up_angles
+        self.aim_errors = aim_errors
+        self.scale_residues = scale_residues
+        self.shear_residues = shear_residues
+
+        with np.errstate(invalid="ignore"):
+            self.flipped = checked & (np.nan_to_num(up_angles) > OrientAnalyzer.FLIP_ANGLE)
+            self.misaimed = checked & (np.nan_to_num(aim_errors) > OrientAnalyzer.AIM_TOLERANCE)
+        self.skewed = checked & (np.maximum(scale_residues, shear_residues) > OrientAnalyzer.RESIDUE_TOLERANCE)
+
+    def __len__(self):
+        return int(self.checked.sum())
+
+    @property
+    def offenders(self):
+        """numpy.ndarray: (N,) boolean mask of joints failing any check."""
+        return self.flipped | self.misaimed | self.skewed
+
+    @property
+    def offender_names(self):
+        """list[str]: Full paths of the joints failing any check."""
+        return [self.arrays.names[index] for index in np.flatnonzero(self.offenders)]
+
+    def issues(self, index):
+        """Describe what is wrong with one joint.
+
+        Args:
+            index (int): Joint index in the report.
+
+        Returns:
+            list[str]: Human readable issues, empty if the joint passes.
+        """
+        issues = []
+        if self.flipped[index]:
+            issues.append(f"up axis flipped ({self.up_angles[index]:.0f}° from parent)")
+        if self.misaimed[index]:
+            issues.append(f"aim off by {self.aim_errors[index]:.1f}°")
+        if self.skewed[index]:
+            issues.append(f"scale/shear residue {max(self.scale_residues[index], self.shear_residues[index]):.3g}")
+        return issues
+
+    def summary(self):
+        """Return a one-line count of joints per issue."""
+        return (f"{len(self)} joints checked: {int(self.flipped.sum())} flipped, "
+                f"{int(self.misaimed.sum())} mis-aimed, {int(self.skewed.sum())} with scale/shear")
+
+
+class OrientAnalyzer:
+    """Finds and fixes orientation problems across whole skeletons."""
+
+    FLIP_ANGLE = 90.0
+    AIM_TOLERANCE = 0.5
+    RESIDUE_TOLERANCE = 1e-3
+
+    @staticmethod
+    def axis_indices(orient_order):
+        """Return the (aim, up) rows for an orient order such as 'yzx'; 'none' checks X/Y."""
+        if orient_order not in ORIENT_ORDERS:
+            orient_order = "xyz"
+        return OrientSolver.AXES.index(orient_order[0]), OrientSolver.AXES.index(orient_order[1])
+
+    @classmethod
+    @profiled()
+    def analyze(cls, joints, orient_order="xyz"):
+        """Read joints in bulk and compute their orientation metrics.
+
+        Direct children of the joints are read too, so the aim of every joint
+        can be checked even when only part of a chain is given.
+
+        Args:
+            joints (list[str]): Joints to check.
+            orient_order (str): Expected aim/up axes, as in orient_joints.
+
+        Returns:
+            OrientReport: The metrics and failing-joint masks.
+        """
+        arrays, checked = JointHelper.read_orient_targets(joints)
+        return cls.analyze_arrays(arrays, orient_order, checked)
+
+    @classmethod
+    def analyze_arrays(cls, arrays, orient_order="xyz", checked=None):
+        """Compute orientation metrics for an existing snapshot; see analyze.
+
+        Args:
+            arrays (JointArrays): Joints to check.
+            orient_order (str): Expected aim/up axes.
+            checked (numpy.ndarray | None): (N,) mask of the joints to flag;
+                defaults to all of them.
+        """
+        if checked is None:
+            checked = np.ones(len(arrays), dtype=bool)
+        aim_axis, up_axis = cls.axis_indices(orient_order)
+        parent_indices = arrays.parent_indices
+        rotations = arrays.rotations
+        count = len(arrays)
+
+        up_angles = np.full(count, np.nan)
+        inside = parent_indices >= 0
+        if inside.any():
+            cosines = np.einsum("ij,ij->i", rotations[inside, up_axis], rotations[parent_indices[inside], up_axis])
+            up_angles[inside] = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+
+        aim_errors = np.full(count, np.nan)
+        first_child = OrientSolver.first_children(parent_indices)
+        directions = OrientSolver.normalize(arrays.positions[np.maximum(first_child, 0)] - arrays.positions)
+        aimed = (first_child >= 0) & (np.linalg.norm(directions, axis=-1) > 0)
+        if aimed.any():
+            cosines = np.einsum("ij,ij->i", rotations[aimed, aim_axis], directions[aimed])
+            aim_errors[aimed] = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+
+        # Row-vector convention: world = local * parent, so local = world * parent^-1.
+        local = arrays.matrices[:, :3, :3] @ np.linalg.inv(arrays.parent_matrices[:, :3, :3])
+        lengths = np.linalg.norm(local, axis=-1)
+        scale_residues = np.abs(lengths - 1.0).max(axis=-1) if count else np.zeros(0)
+        axes = local / np.where(lengths > 0, lengths, 1.0)[:, :, None]
+        gram = axes @ np.transpose(axes, (0, 2, 1))
+        shear_residues = np.abs(gram - np.eye(3)).max(axis=(1, 2)) if count else np.zeros(0)
+
+        return OrientReport(arrays, orient_order, up_angles, aim_errors, scale_residues, shear_residues,
+                            np.asarray(checked, dtype=bool))
+
+    @classmethod
+    @profiled()
+    def fix(cls, joints, orient_order, secondary_axis, auto_orient=False):
+        """Re-aim mis-aimed joints and turn flipped ones back, in one write.
+
+        Mis-aimed joints are re-oriented with the given settings. Then, from
+        the top of each chain down, every joint whose up axis opposes its
+        parent's is turned 180 degrees about its aim axis, which makes the
+        chain below a flip consistent again. Scale and shear are left as is,
+        and joints whose world axes are sheared (below a non-uniformly scaled
+        joint) are skipped since a rotation alone cannot describe them.
+
+        Args:
+            joints (list[str]): Joints to check and fix; read fresh.
+            orient_order (str): Aim/up axes, e.g. 'xyz'.
+            secondary_axis (str): World up direction used to re-aim joints.
+            auto_orient (bool): See JointHelper.orient_joints.
+
+        Returns:
+            tuple[OrientReport, int]: The report before fixing and the number
+            of joints written.
+        """
+        report = cls.analyze(joints, orient_order)
+        arrays = report.arrays
+        if not (report.flipped | report.misaimed).any():
+            return report, 0
+
+        aim_axis, up_axis = cls.axis_indices(orient_order)
+        frames = arrays.rotations
+        gram = frames @ np.transpose(frames, (0, 2, 1))
+        fixable = report.checked & (np.abs(gram - np.eye(3)).max(axis=(1, 2)) <= cls.RESIDUE_TOLERANCE)
+
+        misaimed = report.misaimed & fixable
+        if misaimed.any() and orient_order != "none":
+            frames = OrientSolver.orient_frames(arrays.positions, arrays.parent_indices, frames,
+                                                arrays.parent_rotations, misaimed,
+                                                orient_order, secondary_axis, auto_orient)
+        turned = OrientSolver.unflip_frames(frames, arrays.parent_indices, fixable, aim_axis, up_axis)
+
+        changed = misaimed | turned
+        if not changed.any():
+            return report, 0
+        return report, JointHelper.apply_world_rotations(arrays, frames, changed)
@@ -0,0 +1,321 @@
+"""Batched attribute writes through a single OpenMaya 2.0 modifier.
+
+Tools that set the same attribute on many nodes should queue the values on an
+AttributeWriter instead of calling cmds.setAttr per node. Plugs are resolved
+once through the API, every change is queued on one MDGModifier and the whole
+batch is executed by a small undoable command, so one commit is one entry in
+Maya's undo queue. The modifier keeps the previous values and replays them in
+C++ on undo and redo. It requires running inside Autodesk Maya.
+"""
+
+import os
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+
+from core.profiling import Profiler, profiled
+
+
+class CommitModifierCommand(om2.MPxCommand):
+    """Undoable command that executes the modifier handed over by AttributeWriter.
+
+    The command is registered by plugins/maks_commands.py and is not meant to
+    be called directly; AttributeWriter.commit sets `pending` and invokes it.
+    Modifiers that AttributeWriter.apply already executed are only recorded,
+    so undo reverts them together with the final modifier. Its undo record is
+    these modifiers and nothing else.
+    """
+
+    COMMAND_NAME = "maksCommitModifier"
+
+    pending = None
+
+    def __init__(self):
+        super().__init__()
+        self._modifiers = []
+
+    @classmethod
+    def creator(cls):
+        return cls()
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, args):
+        # pending is (modifiers already executed, modifier to execute or None).
+        if CommitModifierCommand.pending is None:
+            raise RuntimeError(f"{self.COMMAND_NAME} only runs the changes of AttributeWriter.commit() "
+                               "and cannot be called directly")
+        applied, modifier = CommitModifierCommand.pending
+        CommitModifierCommand.pending = None
+        self._modifiers = list(applied)
+        if modifier is not None:
+            modifier.doIt()
+            self._modifiers.append(modifier)
+
+    def redoIt(self):
+        for modifier in self._modifiers:
+            modifier.doIt()
+
+    def undoIt(self):
+        for modifier in reversed(self._modifiers):
+            modifier.undoIt()
+
+
+class AttributeWriter:
+    """Queue attribute values on many nodes and apply them in one undoable step.
+
+    Values use the same units as cmds.setAttr (UI units for angles and
+    distances). Compound attributes such as translate or jointOrient take a
+    sequence with one value per child.
+
+    Display-only changes can skip the undo queue with commit(undoable=False)
+    instead of toggling cmds.undoInfo around the call.
+
+    Example:
+        writer = AttributeWriter()
+        writer.set_many(shapes, "overrideEnabled", True)
+        writer.set_many(shapes, "overrideColor", 17)
+        writer.commit()
+    """
+
+    PLUGIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "plugins", "maks_commands.py")
+
+    def __init__(self):
+        self.failed = []
+
+        self._modifier = om2.MDGModifier()
+        self._objects = {}
+        self._nodes = set()
+        self._count = 0
+        self._applied = []
+        self._applied_count = 0
+
+    def __len__(self):
+        return self._count
+
+    @classmethod
+    def load_plugin(cls):
+        """Load the plug-in registering the commit command if needed."""
+        if not cmds.pluginInfo(cls.PLUGIN_PATH, query=True, loaded=True):
+            cmds.loadPlugin(cls.PLUGIN_PATH, quiet=True)
+
+    def set(self, node, attribute, value):
+        """Queue a single value.
+
+        Args:
+            node (str): Node name or DAG path.
+            attribute (str): Attribute name, e.g. "overrideColor".
+            value (bool | int | float | Sequence[float] | om2.MObject): New
+                value; data objects (e.g. from MFnMatrixData) set typed attributes.
+
+        Returns:
+            bool: False if the plug could not be resolved or is not settable.
+        """
+        plug = self._find_plug(node, attribute)
+        if plug is None:
+            self.failed.append(node)
+            return False
+
+        self._queue(plug, value)
+        self._nodes.add(node)
+        self._count += 1
+        return True
+
+    def set_many(self, nodes, attribute, values):
+        """Queue the same attribute on several nodes.
+
+        Args:
+            nodes (Iterable[str]): Node names or DAG paths.
+            attribute (str): Attribute name.
+            values: Either one value applied to every node, or a sequence with
+                one value per node (e.g. an (N, 3) array for jointOrient).
+
+        Returns:
+            int: The number of values queued.
+        """
+        nodes = list(nodes)
+        # np.isscalar also accepts NumPy scalars such as np.float32 from an array.
+        if np.isscalar(values):
+            values = [values] * len(nodes)
+
+        queued = 0
+        for node, value in zip(nodes, values):
+            queued += self.set(node, attribute, value)
+        return queued
+
+    def read_many(self, nodes, attribute):
+        """Read a plain attribute of several nodes, in the units set() takes.
+
+        Each value is paired with the node's MObjectHandle, so a caller
+        restoring the values later can skip nodes deleted in the meantime.
+
+        Args:
+            nodes (Iterable[str]): Node names or DAG paths.
+            attribute (str): Name of a boolean, numeric, angle or distance attribute.
+
+        Returns:
+            list[tuple[om2.MObjectHandle, bool | int | float] | None]: Handle
+            and value per node, None where the plug could not be resolved or
+            is not settable.
+        """
+        states = []
+        for node in nodes:
+            plug = self._find_plug(node, attribute)
+            states.append(None if plug is None else (om2.MObjectHandle(plug.node()), self._read(plug)))
+        return states
+
+    @profiled()
+    def commit(self, undoable=True):
+        """Execute every queued change as one undoable operation.
+
+        Changes executed earlier with apply() are part of the same undo step.
+
+        Args:
+            undoable (bool): Record the operation in the undo queue; without
+                it the changes are executed directly and cannot be undone.
+
+        Returns:
+            int: The number of values written, including applied ones.
+        """
+        count = self._count + self._applied_count
+        if count and not undoable:
+            if self._count:
+                self._modifier.doIt()
+            Profiler.add_nodes(len(self._nodes))
+        elif count:
+            self.load_plugin()
+            CommitModifierCommand.pending = (self._applied, self._modifier if self._count else None)
+            getattr(cmds, CommitModifierCommand.COMMAND_NAME)()
+            Profiler.add_nodes(len(self._nodes))
+
+        self._reset()
+        self._applied = []
+        self._applied_count = 0
+        return count
+
+    def apply(self):
+        """Execute the queued changes now without adding an undo step.
+
+        Use it to write a large batch in several chunks: a later commit()
+        records every applied chunk as one undo step, rollback() reverts them.
+
+        Returns:
+            int: The number of values written.
+        """
+        count = self._count
+        if count:
+            self._modifier.doIt()
+            self._applied.append(self._modifier)
+            self._applied_count += count
+            Profiler.add_nodes(len(self._nodes))
+
+        self._reset()
+        return count
+
+    def add_applied(self, modifier, count=1):
+        """Adopt a modifier the caller already executed, e.g. one creating nodes.
+
+        Like chunks run by apply(), it becomes part of the next commit()'s undo
+        step and is reverted by rollback().
+
+        Args:
+            modifier (om2.MDGModifier): The executed modifier.
+            count (int): Number of changes it made, for the commit count.
+        """
+        self._applied.append(modifier)
+        self._applied_count += count
+
+    def rollback(self):
+        """Revert every applied change and drop the queued ones."""
+        for modifier in reversed(self._applied):
+            modifier.undoIt()
+        self._reset()
+        self._applied = []
+        self._applied_count = 0
+
+    def report_failures(self, message):
+        """Display one warning per node that could not be written.
+
+        Args:
+            message (str): Warning prefix, e.g. "Failed to override color".
+        """
+        for node in dict.fromkeys(self.failed):
+            om.MGlobal.displayWarning(f"{message}: {node}")
+
+    def _reset(self):
+        self._modifier = om2.MDGModifier()
+        self._nodes.clear()
+        self._count = 0
+
+    def _find_plug(self, node, attribute):
+        obj = self._objects.get(node)
+        if obj is None:
+            selection = om2.MSelectionList()
+            try:
+                selection.add(node)
+            except RuntimeError:
+                return None
+            obj = self._objects[node] = selection.getDependNode(0)
+
+        try:
+            plug = om2.MFnDependencyNode(obj).findPlug(attribute, False)
+        except RuntimeError:
+            return None
+
+        if plug.isLocked or plug.isDestination:
+            return None
+        return plug
+
+    @staticmethod
+    def _read(plug):
+        attribute = plug.attribute()
+        if attribute.hasFn(om2.MFn.kUnitAttribute):
+            unit_type = om2.MFnUnitAttribute(attribute).unitType()
+            if unit_type == om2.MFnUnitAttribute.kAngle:
+                return plug.asMAngle().asUnits(om2.MAngle.uiUnit())
+            if unit_type == om2.MFnUnitAttribute.kDistance:
+                return plug.asMDistance().asUnits(om2.MDistance.uiUnit())
+            return plug.asDouble()
+        if attribute.hasFn(om2.MFn.kNumericAttribute):
+            numeric_type = om2.MFnNumericAttribute(attribute).numericType()
+            if numeric_type == om2.MFnNumericData.kBoolean:
+                return plug.asBool()
+            if numeric_type in (om2.MFnNumericData.kFloat, om2.MFnNumericData.kDouble):
+                return plug.asDouble()
+        return plug.asInt()
+
+    def _queue(self, plug, value):
+        if isinstance(value, om2.MObject):
+            # Typed data such as matrices or curve geometry.
+            self._modifier.newPlugValue(plug, value)
+            return
+
+        if plug.isCompound:
+            for index, child_value in enumerate(value):
+                self._queue(plug.child(index), child_value)
+            return
+
+        attribute = plug.attribute()
+        if attribute.hasFn(om2.MFn.kUnitAttribute):
+            unit_type = om2.MFnUnitAttribute(attribute).unitType()
+            if unit_type == om2.MFnUnitAttribute.kAngle:
+                self._modifier.newPlugValueMAngle(plug, om2.MAngle(float(value), om2.MAngle.uiUnit()))
+            elif unit_type == om2.MFnUnitAttribute.kDistance:
+                self._modifier.newPlugValueMDistance(plug, om2.MDistance(float(value), om2.MDistance.uiUnit()))
+            else:
+                self._modifier.newPlugValueDouble(plug, float(value))
+        elif attribute.hasFn(om2.MFn.kNumericAttribute):
+            numeric_type = om2.MFnNumericAttribute(attribute).numericType()
+            if numeric_type == om2.MFnNumericData.kBoolean:
+                self._modifier.newPlugValueBool(plug, bool(value))
+            elif numeric_type in (om2.MFnNumericData.kFloat, om2.MFnNumericData.kDouble):
+                self._modifier.newPlugValueDouble(plug, float(value))
+            else:
+                self._modifier.newPlugValueInt(plug, int(value))
+        else:
+            self._modifier.newPlugValueInt(plug, int(value))
@@ -1,13 +1,21 @@
 """Utilities to manage Maya viewport override colors for shape nodes.
 
 This module provides helpers for reading the current selection and applying or
-resetting the Maya draw-override color on shape nodes. It is intended to run
-inside Autodesk Maya with maya.cmds available.
+resetting the Maya draw-override color on shape nodes, either as one of the 32
+index colors or as true RGB colors (including gradients across a selection).
+It is intended to run inside Autodesk Maya with maya.cmds available.
 """
 
+import numpy as np
+
 import maya.cmds as cmds
 import maya.OpenMaya as om
 
+from core.attribute import AttributeWriter
+from core.profiling import profiled
+from core.scene import SceneIndex
+from core.selection import SelectionService
+
 
 class ColorHelper:
     """Helper methods for working with Maya's display override colors.
@@ -15,13 +23,47 @@ class ColorHelper:
     Notes:
     - Maya supports 32 legacy index colors for overrides (0-31). See
       Window > Settings/Preferences > Color Settings for their mapping.
+    - RGB overrides use overrideRGBColors/overrideColorRGB instead, with
+      values in the 0-1 range.
     - All functions operate on currently selected DAG nodes and affect
       their shape descendants (e.g., meshes, NURBS shapes).
     """
 
     MAX_OVERRIDE_COLORS = 32
 
+    # Index 0 means "use the default color" and has no colorIndex entry.
+    DEFAULT_INDEX_COLOR = (0.6, 0.6, 0.6)
+
+    _palette = None
+    _palette_job = None
+
+    @classmethod
+    def get_palette(cls):
+        """Return the RGB values of the override index colors.
+
+        The colors are queried from Maya once and cached until Maya's color
+        preferences change (ColorIndexChanged event).
+
+        Returns:
+            list[tuple[float, float, float]]: One RGB triple (0-1) per index.
+        """
+        if cls._palette is None:
+            cls._palette = [cls.DEFAULT_INDEX_COLOR]
+            cls._palette.extend(tuple(cmds.colorIndex(index, query=True))
+                                for index in range(1, cls.MAX_OVERRIDE_COLORS))
+
+        if cls._palette_job is None or not cmds.scriptJob(exists=cls._palette_job):
+            cls._palette_job = cmds.scriptJob(event=["ColorIndexChanged", cls.invalidate_palette])
+
+        return cls._palette
+
+    @classmethod
+    def invalidate_palette(cls):
+        """Drop the cached palette so the next get_palette call re-queries Maya."""
+        cls._palette = None
+
     @classmethod
+    @profiled()
     def get_shape_nodes(cls):
         """Return shape nodes under the current selection.
 
@@ -29,22 +71,21 @@ class ColorHelper:
             list[str] | None: A list of shape node names under the selected
             transforms, or None if nothing is selected.
         """
-        selection = cmds.ls(selection=True)
+        selection = SelectionService.instance().snapshot()
         if not selection:
             return None
 
-        shapes = []
-        for node in selection:
-            shapes.extend(cmds.listRelatives(node, shapes=True) or [])
-
-        return shapes
+        return SceneIndex.instance().shapes(handle for handle, _ in selection.transforms)
 
     @classmethod
-    def override_color(cls, color_index):
-        """Enable draw overrides and set the overrideColor on selected shapes.
+    @profiled()
+    def override_color(cls, color_index, shapes=None):
+        """Enable draw overrides and set the overrideColor on shapes.
 
         Args:
             color_index (int): Index color in the range [0, 31].
+            shapes (list[str] | None): Shapes to color; defaults to the shapes
+                under the current selection.
 
         Returns:
             bool | None: False on validation/selection failure, otherwise None.
@@ -53,18 +94,120 @@ class ColorHelper:
             om.MGlobal.displayError("Color index out-of-range (must be between 0-31)")
             return False
 
-        shapes = cls.get_shape_nodes()
+        if shapes is None:
+            shapes = cls.get_shape_nodes()
+        if not shapes:
+            om.MGlobal.displayError("No shape nodes selected")
+            return False
+
+        writer = AttributeWriter()
+        writer.set_many(shapes, "overrideEnabled", True)
+        writer.set_many(shapes, "overrideColor", color_index)
+        writer.commit()
+        writer.report_failures("Failed to override color")
+        return None
+
+    @classmethod
+    @profiled()
+    def override_rgb_color(cls, colors, shapes=None):
+        """Enable RGB draw overrides and set overrideColorRGB on shapes.
+
+        Args:
+            colors (Sequence[float] | numpy.ndarray): One RGB triple (0-1)
+                for every shape, or an (N, 3) array with one color per shape.
+            shapes (list[str] | None): Shapes to color; defaults to the shapes
+                under the current selection.
+
+        Returns:
+            bool | None: False on validation/selection failure, otherwise None.
+        """
+        if shapes is None:
+            shapes = cls.get_shape_nodes()
         if not shapes:
             om.MGlobal.displayError("No shape nodes selected")
             return False
 
-        for shape in shapes:
-            try:
-                cmds.setAttr(f"{shape}.overrideEnabled", True)
-                cmds.setAttr(f"{shape}.overrideColor", color_index)
-            except RuntimeError:
-                om.MGlobal.displayWarning("Failed to override color: {0}".format(shape))
+        colors = np.asarray(colors, dtype=float)
+        if colors.ndim == 1:
+            colors = np.broadcast_to(colors, (len(shapes), 3))
+        if colors.shape != (len(shapes), 3):
+            om.MGlobal.displayError("Expected one RGB color or one RGB color per shape")
+            return False
+
+        writer = AttributeWriter()
+        writer.set_many(shapes, "overrideEnabled", True)
+        writer.set_many(shapes, "overrideRGBColors", True)
+        writer.set_many(shapes, "overrideColorRGB", np.clip(colors, 0.0, 1.0))
+        writer.commit()
+        writer.report_failures("Failed to override color")
         return None
 
+    @staticmethod
+    def gradient_colors(weights, start_color, end_color):
+        """Interpolate between two RGB colors for every weight at once.
+
+        Args:
+            weights (Sequence[float]): Values in the 0-1 range.
+            start_color (Sequence[float]): RGB color at weight 0.
+            end_color (Sequence[float]): RGB color at weight 1.
+
+        Returns:
+            numpy.ndarray: (N, 3) RGB colors.
+        """
+        weights = np.clip(np.asarray(weights, dtype=float), 0.0, 1.0)[:, None]
+        start_color = np.asarray(start_color, dtype=float)
+        end_color = np.asarray(end_color, dtype=float)
+        return start_color + (end_color - start_color) * weights
+
+    @staticmethod
+    def gradient_weights(shapes, mode="depth"):
+        """Compute a 0-1 gradient position for every shape.
+
+        Args:
+            shapes (list[str]): Full shape DAG paths.
+            mode (str): "depth" ramps by the DAG depth of each shape's
+                transform; "chain" ramps by cumulative world distance between
+                the transforms, in order.
+
+        Returns:
+            numpy.ndarray: (N,) weights; all zero when there is no spread.
+        """
+        transforms = [shape.rpartition("|")[0] or shape for shape in shapes]
+
+        if mode == "chain":
+            # Shapes sharing a transform share its position along the chain.
+            unique_transforms = list(dict.fromkeys(transforms))
+            positions = np.reshape(cmds.xform(unique_transforms, query=True, worldSpace=True, translation=True),
+                                   (-1, 3))
+            steps = np.linalg.norm(np.diff(positions, axis=0), axis=-1)
+            distances = np.concatenate(([0.0], np.cumsum(steps)))
+            index_map = {transform: index for index, transform in enumerate(unique_transforms)}
+            values = distances[[index_map[transform] for transform in transforms]]
+        else:
+            values = np.array([transform.count("|") for transform in transforms], dtype=float)
+
+        spread = values.max() - values.min() if len(values) else 0.0
+        if spread <= 0:
+            return np.zeros(len(values))
+        return (values - values.min()) / spread
+
+    @classmethod
+    @profiled()
+    def override_gradient(cls, start_color, end_color, mode="depth"):
+        """Color the selected shapes with a gradient between two RGB colors.
+
+        Args:
+            start_color (Sequence[float]): RGB color for the first/shallowest shape.
+            end_color (Sequence[float]): RGB color for the last/deepest shape.
+            mode (str): "depth" or "chain", see gradient_weights.
 
+        Returns:
+            bool | None: False on selection failure, otherwise None.
+        """
+        shapes = cls.get_shape_nodes()
+        if not shapes:
+            om.MGlobal.displayError("No shape nodes selected")
+            return False
 
+        colors = cls.gradient_colors(cls.gradient_weights(shapes, mode), start_color, end_color)
+        return cls.override_rgb_color(colors, shapes)
@@ -0,0 +1,17 @@
+"""Option values shared by the core helpers, the tool settings and the tools.
+
+The module imports nothing, so core.settings can validate saved settings
+without loading the helpers and the Maya API modules they need.
+"""
+
+# Aim, up and third axis orders JointHelper.orient_joints takes, besides 'none'.
+ORIENT_ORDERS = ("xyz", "yzx", "zxy", "zyx", "yxz", "xzy")
+
+# Axes a control shape's normal can point along.
+NORMAL_AXES = ("x", "y", "z")
+
+# Ways MirrorHelper pairs joints with their counterparts.
+MIRROR_MATCH_MODES = ("name", "position")
+
+# Default box width of a skin proxy, relative to its bone length.
+PROXY_WIDTH_RATIO = 0.2
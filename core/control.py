@@ -0,0 +1,241 @@
+"""Control curve library and batched creation of rig controls.
+
+Control shapes are stored in data/control_shapes.json as unit-size CV lists.
+ControlShapes parses the file once and caches every curve's CVs and knots as
+NumPy arrays; per spawn, each curve of the chosen shape is turned into one
+NURBS curve data object that every new control shares as its geometry.
+
+ControlHelper.spawn_controls creates all controls of a spawn with one
+OpenMaya 2.0 DAG modifier, places them on their targets through
+offsetParentMatrix (leaving translate/rotate/scale at their defaults), sets
+their geometry through one AttributeWriter, and colors them with ColorHelper,
+all in one undo chunk. It requires running inside Autodesk Maya.
+"""
+
+import json
+import os
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+
+from core.attribute import AttributeWriter
+from core.color import ColorHelper
+from core.constants import NORMAL_AXES
+from core.profiling import profiled
+
+
+class ControlShapes:
+    """Cached library of control curve shapes, read from a JSON data file.
+
+    Each shape is a list of curves with a degree, an optional periodic flag
+    and unit-size points drawn around the +Y axis.
+    """
+
+    DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "data", "control_shapes.json")
+    NORMAL_AXES = NORMAL_AXES
+
+    # Point component order turning the +Y normal of the stored shapes into each axis.
+    _AXIS_ORDERS = {"x": [1, 0, 2], "y": [0, 1, 2], "z": [0, 2, 1]}
+
+    _shapes = None
+
+    @classmethod
+    def load(cls, path=None):
+        """Return the shape library, reading the data file on first use.
+
+        Args:
+            path (str | None): Data file to read instead of DATA_PATH; reloads
+                the library.
+
+        Returns:
+            dict[str, list[tuple[numpy.ndarray, numpy.ndarray, int, bool]]]:
+            Per shape name, its curves as (CVs (K, 3), knots, degree, periodic).
+
+        Raises:
+            ValueError: If the file does not describe valid shapes.
+        """
+        if cls._shapes is not None and path is None:
+            return cls._shapes
+
+        path = path or cls.DATA_PATH
+        with open(path, "r") as handle:
+            data = json.load(handle)
+        if not isinstance(data, dict) or not isinstance(data.get("shapes"), dict):
+            raise ValueError(f"{path} is not a control shape file: expected an object with a 'shapes' object")
+
+        shapes = {}
+        for name, curves in data["shapes"].items():
+            shapes[name] = [cls.build_curve(name, curve) for curve in curves]
+        cls._shapes = shapes
+        return shapes
+
+    @staticmethod
+    def build_curve(name, curve):
+        """Return the CVs and knots of one stored curve.
+
+        Periodic curves get their first `degree` points repeated at the end,
+        as Maya expects; open curves get clamped knots.
+
+        Raises:
+            ValueError: If the curve has too few points for its degree.
+        """
+        degree = int(curve.get("degree", 1))
+        periodic = bool(curve.get("periodic", False))
+        points = np.asarray(curve["points"], dtype=np.float64).reshape(-1, 3)
+        if len(points) <= degree:
+            raise ValueError(f"Control shape {name!r}: a degree {degree} curve needs more than {degree} points")
+
+        if periodic:
+            cvs = np.concatenate([points, points[:degree]])
+            knots = np.arange(-degree + 1, len(cvs), dtype=np.float64)
+        else:
+            cvs = points
+            spans = len(cvs) - degree
+            knots = np.concatenate([np.zeros(degree - 1), np.arange(spans + 1), np.full(degree - 1, spans)])
+        return cvs, knots.astype(np.float64), degree, periodic
+
+    @classmethod
+    def names(cls):
+        """Return the names of the shapes in the library, in file order."""
+        return list(cls.load())
+
+    @classmethod
+    def curve_data(cls, name, size=1.0, normal="y"):
+        """Build the NURBS curve data objects of a shape at a size and orientation.
+
+        Args:
+            name (str): Shape name.
+            size (float): Uniform scale of the unit-size shape.
+            normal (str): Axis the shape faces, 'x', 'y' or 'z'.
+
+        Returns:
+            list[om2.MObject]: One curve data object per curve of the shape.
+
+        Raises:
+            KeyError: If there is no shape with that name.
+        """
+        data_objects = []
+        for cvs, knots, degree, periodic in cls.load()[name]:
+            points = (cvs[:, cls._AXIS_ORDERS[normal]] * size).tolist()
+            form = om2.MFnNurbsCurve.kPeriodic if periodic else om2.MFnNurbsCurve.kOpen
+            data = om2.MFnNurbsCurveData().create()
+            om2.MFnNurbsCurve().create(om2.MPointArray(points), om2.MDoubleArray(knots.tolist()), degree, form,
+                                       False, False, data)
+            data_objects.append(data)
+        return data_objects
+
+
+class ControlHelper:
+    """Helper methods for creating rig controls from the shape library."""
+
+    SUFFIX = "_ctrl"
+    # Suffixes of target names replaced by SUFFIX, e.g. "arm_jnt" -> "arm_ctrl".
+    TARGET_SUFFIXES = ("_jnt", "_joint", "_JNT", "_bind")
+
+    @classmethod
+    def control_name(cls, target):
+        """Return the control name for a target node (or a shape name)."""
+        name = target.rpartition("|")[2]
+        for suffix in cls.TARGET_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+        return name + cls.SUFFIX
+
+    @staticmethod
+    def unique_names(names):
+        """Return names made unique among themselves and against existing nodes."""
+        used = set()
+        unique = []
+        for name in names:
+            candidate, index = name, 1
+            while candidate in used or cmds.objExists(candidate):
+                candidate = f"{name}{index}"
+                index += 1
+            used.add(candidate)
+            unique.append(candidate)
+        return unique
+
+    @staticmethod
+    def world_matrices(nodes):
+        """Return the world matrix of each node, read through the API."""
+        selection = om2.MSelectionList()
+        for node in nodes:
+            selection.add(node)
+        return [selection.getDagPath(index).inclusiveMatrix() for index in range(len(nodes))]
+
+    @classmethod
+    @profiled()
+    def spawn_controls(cls, shape, targets=None, size=1.0, normal="x", color=None):
+        """Create one control per target, matched to its world transform.
+
+        All controls are created by a single DAG modifier and written by a
+        single AttributeWriter; with the coloring they form one undo step.
+
+        Args:
+            shape (str): Shape name from ControlShapes.
+            targets (list[str] | None): Nodes to create controls for; without
+                targets one control is created at the origin.
+            size (float): Uniform scale of the shape.
+            normal (str): Axis the shape faces, 'x', 'y' or 'z'.
+            color (int | Sequence[float] | None): Override index color,
+                RGB color (0-1), or None to keep the default color.
+
+        Returns:
+            list[str]: Full paths of the control transforms.
+
+        Raises:
+            KeyError: If the shape is not in the library.
+        """
+        curves = ControlShapes.curve_data(shape, size, normal)
+        targets = list(targets or [])
+        names = cls.unique_names([cls.control_name(target) for target in targets] or
+                                 [cls.control_name(shape)])
+        matrices = cls.world_matrices(targets) if targets else [om2.MMatrix()]
+
+        modifier = om2.MDagModifier()
+        created = []
+        for name in names:
+            transform = modifier.createNode("transform")
+            modifier.renameNode(transform, name)
+            shape_nodes = []
+            for index in range(len(curves)):
+                shape_node = modifier.createNode("nurbsCurve", transform)
+                modifier.renameNode(shape_node, f"{name}Shape{index or ''}")
+                shape_nodes.append(shape_node)
+            created.append((transform, shape_nodes))
+
+        cmds.undoInfo(openChunk=True, chunkName="maksSpawnControls")
+        try:
+            modifier.doIt()
+            writer = AttributeWriter()
+            writer.add_applied(modifier, len(created))
+
+            transforms = []
+            shapes = []
+            try:
+                for (transform, shape_nodes), matrix in zip(created, matrices):
+                    transforms.append(om2.MFnDagNode(transform).fullPathName())
+                    writer.set(transforms[-1], "offsetParentMatrix", om2.MFnMatrixData().create(matrix))
+                    for shape_node, data in zip(shape_nodes, curves):
+                        shapes.append(om2.MFnDagNode(shape_node).fullPathName())
+                        writer.set(shapes[-1], "cached", data)
+            except Exception:
+                writer.rollback()
+                raise
+            writer.commit()
+            writer.report_failures("Failed to build control")
+
+            if isinstance(color, int):
+                ColorHelper.override_color(color, shapes)
+            elif color is not None:
+                ColorHelper.override_rgb_color(color, shapes)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        om.MGlobal.displayInfo(f"Created {len(transforms)} {shape} control(s)")
+        return transforms
@@ -2,17 +2,106 @@
 
 This module wraps common operations on Maya joints (cmds.joint) that are used by
 UI tools such as the Orienter. It requires running inside Autodesk Maya with
-maya.cmds available.
+maya.cmds available. Orientation math lives in core.orient and works on the
+arrays read here.
 """
 
+import collections
+import hashlib
+
+import numpy as np
+
 import maya.cmds as cmds
 import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+
+from core.attribute import AttributeWriter
+from core.orient import OrientSolver
+from core.profiling import profiled
+from core.scene import SceneIndex
+from core.selection import SelectionService
+
+
+class JointArrays:
+    """World-space snapshot of a set of joints, stored as NumPy arrays.
+
+    Attributes:
+        names (list[str]): Full DAG paths, in DAG order (parents first).
+        matrices (numpy.ndarray): (N, 4, 4) world matrices.
+        parent_matrices (numpy.ndarray): (N, 4, 4) world matrices of each
+            joint's DAG parent (identity for joints under the world).
+        joint_orients (numpy.ndarray): (N, 3) jointOrient values in degrees.
+        parent_indices (numpy.ndarray): (N,) index of each joint's parent in
+            names, or -1 when the parent is not part of the set.
+    """
+
+    def __init__(self, names, matrices, parent_matrices, joint_orients, parent_indices):
+        self.names = names
+        self.matrices = matrices
+        self.parent_matrices = parent_matrices
+        self.joint_orients = joint_orients
+        self.parent_indices = parent_indices
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def positions(self):
+        """numpy.ndarray: (N, 3) world positions."""
+        return self.matrices[:, 3, :3]
+
+    @property
+    def scales(self):
+        """numpy.ndarray: (N, 3) world scale along each joint axis."""
+        return np.linalg.norm(self.matrices[:, :3, :3], axis=-1)
+
+    @property
+    def rotations(self):
+        """numpy.ndarray: (N, 3, 3) orthonormal world rotations."""
+        return self.matrices[:, :3, :3] / self.scales[:, :, None]
+
+    @property
+    def parent_rotations(self):
+        """numpy.ndarray: (N, 3, 3) orthonormal world rotations of DAG parents."""
+        rotations = self.parent_matrices[:, :3, :3]
+        return rotations / np.linalg.norm(rotations, axis=-1)[:, :, None]
+
+
+class JointHierarchy:
+    """Deduplicated joint hierarchy in parent-before-child (DAG pre-order) order.
+
+    Attributes:
+        names (list[str]): Full DAG paths.
+        parent_indices (numpy.ndarray): (N,) index of each joint's parent in
+            names, or -1 when the parent is not part of the hierarchy.
+        depths (numpy.ndarray): (N,) depth below the top-most joint in the set.
+    """
+
+    def __init__(self, names, parent_indices, depths):
+        self.names = names
+        self.parent_indices = parent_indices
+        self.depths = depths
+
+    def __len__(self):
+        return len(self.names)
 
 
 class JointHelper:
     """Helpers to query joints and perform orientation-related edits."""
 
+    # Quantization steps used to fingerprint chains for the orient cache.
+    POSITION_TOLERANCE = 1e-4
+    ROTATION_TOLERANCE = 1e-6
+
+    # Chains remembered by the orient cache; the least recently used go first.
+    ORIENT_CACHE_SIZE = 10000
+
+    # {chain root path: fingerprint of the chain right after it was oriented}
+    _orient_cache = collections.OrderedDict()
+    _orient_cache_watched = False
+
     @classmethod
+    @profiled()
     def get_joints(cls, hierarchy=False, all_joints=False):
         """Get joints to operate on based on current selection and options.
 
@@ -25,16 +114,417 @@ class JointHelper:
         """
 
         if all_joints:
-            return cmds.ls(type="joint") or []
+            return SceneIndex.instance().joints()
 
-        selected_joints = cmds.ls(selection=True, type="joint") or []
+        selected_joints = SelectionService.instance().joints()
         if hierarchy and selected_joints:
-            descendants = cmds.listRelatives(selected_joints, allDescendents=True, type="joint") or []
-            selected_joints.extend(descendants)
+            return cls.walk_hierarchy(selected_joints).names
 
         return selected_joints
 
     @classmethod
+    def walk_hierarchy(cls, roots):
+        """Collect the joints under the given roots in one DAG iterator walk.
+
+        Roots are visited from the top of the DAG down, and subtrees that were
+        already reached from another root are pruned, so overlapping roots
+        (e.g. a selected arm and its hand) yield every joint exactly once.
+
+        Args:
+            roots (list[str]): Joints to start from; they are included.
+
+        Returns:
+            JointHierarchy: Joints ordered parent-before-child.
+        """
+        roots = sorted(set(cmds.ls(roots, long=True, type="joint") or []) if roots else [],
+                       key=lambda name: name.count("|"))
+
+        names = []
+        index_map = {}
+        iterator = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kJoint)
+        selection = om2.MSelectionList()
+        for root in roots:
+            if root in index_map:
+                continue
+            selection.clear()
+            selection.add(root)
+            iterator.reset(selection.getDependNode(0), om2.MItDag.kDepthFirst, om2.MFn.kJoint)
+            while not iterator.isDone():
+                path = iterator.fullPathName()
+                if path in index_map:
+                    iterator.prune()
+                else:
+                    index_map[path] = len(names)
+                    names.append(path)
+                iterator.next()
+
+        parent_indices = np.array([index_map.get(name.rpartition("|")[0], -1) for name in names],
+                                  dtype=np.int64)
+        return JointHierarchy(names, parent_indices, OrientSolver.depths(parent_indices))
+
+    @classmethod
+    @profiled()
+    def read_joint_arrays(cls, joints, world_only=False):
+        """Read world matrices, jointOrients and parenting for joints in one pass.
+
+        Args:
+            joints (list[str]): Joint names; duplicates are ignored.
+            world_only (bool): Only read what fingerprints a chain: world
+                matrices, and parent matrices of the joints whose parent is
+                not in the set. Other parent matrices are identity and
+                jointOrients zero.
+
+        Returns:
+            JointArrays: The snapshot, ordered parents first.
+        """
+        # cmds.ls with an empty list would return every joint in the scene.
+        names = list(dict.fromkeys(cmds.ls(joints, long=True, type="joint") or [])) if joints else []
+        names.sort(key=lambda name: name.count("|"))
+        index_map = {name: index for index, name in enumerate(names)}
+
+        selection = om2.MSelectionList()
+        for name in names:
+            selection.add(name)
+
+        count = len(names)
+        parent_indices = np.array([index_map.get(name.rpartition("|")[0], -1) for name in names],
+                                  dtype=np.int64)
+        matrices = np.empty((count, 4, 4))
+        if world_only:
+            parent_matrices = np.broadcast_to(np.eye(4), (count, 4, 4)).copy()
+            joint_orients = np.zeros((count, 3))
+            for index in range(count):
+                dag_path = selection.getDagPath(index)
+                matrices[index] = np.reshape(list(dag_path.inclusiveMatrix()), (4, 4))
+                if parent_indices[index] < 0:
+                    parent_matrices[index] = np.reshape(list(dag_path.exclusiveMatrix()), (4, 4))
+            return JointArrays(names, matrices, parent_matrices, joint_orients, parent_indices)
+
+        parent_matrices = np.empty((count, 4, 4))
+        joint_orients = np.empty((count, 3))
+        for index in range(count):
+            dag_path = selection.getDagPath(index)
+            matrices[index] = np.reshape(list(dag_path.inclusiveMatrix()), (4, 4))
+            parent_matrices[index] = np.reshape(list(dag_path.exclusiveMatrix()), (4, 4))
+            plug = om2.MFnDependencyNode(dag_path.node()).findPlug("jointOrient", False)
+            joint_orients[index] = [plug.child(axis).asMAngle().asDegrees() for axis in range(3)]
+
+        return JointArrays(names, matrices, parent_matrices, joint_orients, parent_indices)
+
+    @classmethod
+    @profiled()
+    def apply_world_rotations(cls, arrays, frames, targets):
+        """Write jointOrients so targeted joints end up with the given world frames.
+
+        Targeted joints get their rotate and rotateAxis zeroed and the new
+        frame baked into jointOrient. Direct children of targeted joints keep
+        their world position and rotation: their translate and jointOrient are
+        recomputed against the new parent frame.
+
+        Args:
+            arrays (JointArrays): Snapshot the frames were computed from.
+            frames (numpy.ndarray): (N, 3, 3) new world rotations.
+            targets (numpy.ndarray): (N,) boolean mask of joints to rewrite.
+
+        Returns:
+            int: The number of joints written.
+        """
+        parent_indices = arrays.parent_indices
+        targets = np.asarray(targets, dtype=bool)
+        rotations = arrays.rotations
+        parent_frames = OrientSolver.parent_frames(frames, parent_indices, arrays.parent_rotations)
+        old_parent_frames = OrientSolver.parent_frames(rotations, parent_indices, arrays.parent_rotations)
+
+        joint_orients = OrientSolver.joint_orients(frames, parent_frames)
+
+        # Children that are not re-oriented keep their rotate channels, so only
+        # the change of parent frame is folded into their jointOrient.
+        compensated = ~targets & (parent_indices >= 0)
+        compensated &= targets[np.maximum(parent_indices, 0)]
+        if compensated.any():
+            orient_matrices = OrientSolver.euler_to_matrix(arrays.joint_orients[compensated])
+            joint_orients[compensated] = OrientSolver.matrix_to_euler(
+                orient_matrices @ old_parent_frames[compensated]
+                @ np.transpose(parent_frames[compensated], (0, 2, 1)))
+
+        moved = (parent_indices >= 0) & targets[np.maximum(parent_indices, 0)]
+        translations = OrientSolver.local_translations(arrays.positions, parent_indices, parent_frames,
+                                                       arrays.scales[np.maximum(parent_indices, 0)])
+
+        writer = AttributeWriter()
+        zeros = np.zeros((int(targets.sum()), 3))
+        writer.set_many((name for name, target in zip(arrays.names, targets) if target), "rotate", zeros)
+        writer.set_many((name for name, target in zip(arrays.names, targets) if target), "rotateAxis", zeros)
+
+        written = targets | compensated
+        writer.set_many((name for name, write in zip(arrays.names, written) if write),
+                        "jointOrient", joint_orients[written])
+        writer.set_many((name for name, move in zip(arrays.names, moved) if move),
+                        "translate", translations[moved])
+        writer.commit()
+        writer.report_failures("Failed to orient joint")
+        return int(written.sum())
+
+    @classmethod
+    @profiled()
+    def orient_joints(cls, joints, orient_order, secondary_axis, auto_orient=False, children=False, use_cache=True):
+        """Orient joints with the NumPy solver instead of cmds.joint(orientJoint=...).
+
+        Mirrors the cmds.joint flags: joints aim at their first child, leaf
+        joints take their parent's orientation and 'none' zeroes jointOrient.
+        Chains already oriented with the same settings, whose joints have not
+        moved or rotated since, are skipped (see clear_orient_cache). Telling
+        them apart still reads the world matrix of every joint, but nothing
+        else is read for skipped chains.
+
+        Args:
+            joints (list[str]): Joints to orient.
+            orient_order (str): Aim/up/third axes ('xyz', 'yzx', ...) or 'none'.
+            secondary_axis (str): World up direction ('yup', 'zdown', ...).
+            auto_orient (bool): Same as autoOrientSecondaryAxis.
+            children (bool): Also orient all descendant joints.
+            use_cache (bool): Skip unchanged chains.
+
+        Returns:
+            int: The number of joints written.
+        """
+        targets, names = cls._orient_target_names(joints, children)
+        if not targets:
+            return 0
+
+        labels = dict.fromkeys(targets, cls._settings_label(orient_order, secondary_axis, auto_orient))
+        if use_cache and cls._orient_cache:
+            names = cls._changed_chains(names, labels)
+            if not names:
+                return 0
+
+        arrays = cls.read_joint_arrays(names)
+        target_mask = np.isin(arrays.names, targets)
+        labels = np.array([labels.get(name, "") for name in arrays.names])
+        frames = OrientSolver.orient_frames(arrays.positions, arrays.parent_indices, arrays.rotations,
+                                            arrays.parent_rotations, target_mask,
+                                            orient_order, secondary_axis, auto_orient)
+        written = cls.apply_world_rotations(arrays, frames, target_mask)
+        cls._cache_orientations(arrays, frames, target_mask, labels)
+        return written
+
+    @classmethod
+    @profiled()
+    def orient_joint_groups(cls, groups, use_cache=True):
+        """Orient several sets of joints, each with its own settings, in one pass.
+
+        All joints are read, solved and written together. When a joint
+        appears in several groups the last group wins.
+
+        Args:
+            groups (Sequence[tuple[list[str], str, str, bool]]): (joints,
+                orient_order, secondary_axis, auto_orient) per group; the
+                settings are the same as for orient_joints.
+            use_cache (bool): Skip unchanged chains, see orient_joints.
+
+        Returns:
+            int: The number of joints written.
+        """
+        group_joints = [cmds.ls(joints, long=True, type="joint") or [] if joints else [] for joints, *_ in groups]
+        targets = list(dict.fromkeys(name for names in group_joints for name in names))
+        if not targets:
+            return 0
+
+        settings = [(orient_order, secondary_axis, auto_orient) for _, orient_order, secondary_axis, auto_orient
+                    in groups]
+        group_of = {name: group for group, names in enumerate(group_joints) for name in names}
+        labels = {name: cls._settings_label(*settings[group]) for name, group in group_of.items()}
+
+        targets, names = cls._orient_target_names(targets)
+        if use_cache and cls._orient_cache:
+            names = cls._changed_chains(names, labels)
+            if not names:
+                return 0
+
+        arrays = cls.read_joint_arrays(names)
+        target_mask = np.isin(arrays.names, targets)
+        group_ids = np.array([group_of.get(name, -1) for name in arrays.names], dtype=np.int64)
+        labels = np.array([labels.get(name, "") for name in arrays.names])
+        frames = OrientSolver.orient_frames_grouped(arrays.positions, arrays.parent_indices, arrays.rotations,
+                                                    arrays.parent_rotations, group_ids, settings)
+        written = cls.apply_world_rotations(arrays, frames, target_mask)
+        cls._cache_orientations(arrays, frames, target_mask, labels)
+        return written
+
+    @classmethod
+    def clear_orient_cache(cls):
+        """Forget every cached chain so the next orient pass writes everything.
+
+        Called automatically when a scene is opened or a new one created.
+        """
+        cls._orient_cache.clear()
+
+    @staticmethod
+    def _settings_label(orient_order, secondary_axis, auto_orient):
+        return f"{orient_order}/{secondary_axis}/{int(bool(auto_orient))}"
+
+    @staticmethod
+    def _chain_roots(parent_indices):
+        """Return, for every joint, the index of the top-most joint above it in the set."""
+        chain_roots = np.arange(len(parent_indices))
+        depths = OrientSolver.depths(parent_indices)
+        for level in range(1, int(depths.max()) + 1 if len(depths) else 0):
+            indices = np.flatnonzero(depths == level)
+            chain_roots[indices] = chain_roots[parent_indices[indices]]
+        return chain_roots
+
+    @classmethod
+    def _chain_fingerprints(cls, arrays, rotations, labels):
+        """Fingerprint every chain (joints sharing a top-most joint in the set).
+
+        The fingerprint covers what an orient pass depends on and changes:
+        names, world positions and rotations of the chain, the world rotation
+        above its root, and the settings label of each joint.
+
+        Returns:
+            dict[int, bytes]: Digest per chain root index.
+        """
+        chain_roots = cls._chain_roots(arrays.parent_indices)
+        positions = np.round(arrays.positions / cls.POSITION_TOLERANCE).astype(np.int64)
+        rotations = np.round(np.reshape(rotations, (-1, 9)) / cls.ROTATION_TOLERANCE).astype(np.int64)
+        parent_rotations = np.round(np.reshape(arrays.parent_rotations, (-1, 9))
+                                    / cls.ROTATION_TOLERANCE).astype(np.int64)
+
+        order = np.argsort(chain_roots, kind="stable")
+        roots, starts = np.unique(chain_roots[order], return_index=True)
+        fingerprints = {}
+        for root, members in zip(roots, np.split(order, starts[1:])):
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(positions[members].tobytes())
+            digest.update(rotations[members].tobytes())
+            digest.update(parent_rotations[root].tobytes())
+            digest.update("\0".join(arrays.names[member] + "=" + labels[member] for member in members).encode())
+            fingerprints[int(root)] = digest.digest()
+        return fingerprints
+
+    @classmethod
+    def _changed_chains(cls, joints, labels):
+        """Return the joints of the chains that do not match the orient cache.
+
+        Only world matrices are read for the check (see read_joint_arrays).
+
+        Args:
+            joints (list[str]): Targets and their direct children.
+            labels (dict[str, str]): Settings label per targeted joint.
+
+        Returns:
+            list[str]: Joints of the changed chains, parents first.
+        """
+        arrays = cls.read_joint_arrays(joints, world_only=True)
+        fingerprints = cls._chain_fingerprints(arrays, arrays.rotations,
+                                               [labels.get(name, "") for name in arrays.names])
+        changed = []
+        for root, fingerprint in fingerprints.items():
+            name = arrays.names[root]
+            if cls._orient_cache.get(name) == fingerprint:
+                cls._orient_cache.move_to_end(name)
+            else:
+                changed.append(root)
+
+        keep = np.isin(cls._chain_roots(arrays.parent_indices), changed)
+        return [name for name, kept in zip(arrays.names, keep) if kept]
+
+    @classmethod
+    def _cache_orientations(cls, arrays, frames, targets, labels):
+        """Remember the fingerprint of every chain that was just oriented."""
+        if not cls._orient_cache_watched:
+            SceneIndex.instance().add_scene_listener(cls.clear_orient_cache)
+            cls._orient_cache_watched = True
+
+        fingerprints = cls._chain_fingerprints(arrays, frames, labels)
+        oriented = np.unique(cls._chain_roots(arrays.parent_indices)[targets])
+        for root in oriented:
+            name = arrays.names[root]
+            cls._orient_cache[name] = fingerprints[int(root)]
+            cls._orient_cache.move_to_end(name)
+        while len(cls._orient_cache) > cls.ORIENT_CACHE_SIZE:
+            cls._orient_cache.popitem(last=False)
+
+    @classmethod
+    def read_orient_targets(cls, joints, children=False):
+        """Read the arrays needed to orient joints, without solving anything.
+
+        Direct children of the targets are included because joints aim at
+        them and they have to be compensated, even when only the selected
+        joints are being oriented.
+
+        Args:
+            joints (list[str]): Joints to orient.
+            children (bool): Also target all descendant joints.
+
+        Returns:
+            tuple[JointArrays, numpy.ndarray]: The snapshot and a boolean
+            mask of the targeted joints.
+        """
+        targets, names = cls._orient_target_names(joints, children)
+        arrays = cls.read_joint_arrays(names)
+        return arrays, np.isin(arrays.names, targets)
+
+    @classmethod
+    def _orient_target_names(cls, joints, children=False):
+        """Return the targeted joints, and those plus their direct children."""
+        targets = cmds.ls(joints, long=True, type="joint") or []
+        if children and targets:
+            targets = cls.walk_hierarchy(targets).names
+
+        direct_children = []
+        if targets:
+            direct_children = cmds.listRelatives(targets, children=True, type="joint", fullPath=True) or []
+        return targets, targets + direct_children
+
+    @classmethod
+    @profiled()
+    def rotate_local_axes(cls, joints, rotation):
+        """Rotate the local axes of joints and bake the result into jointOrient.
+
+        Every joint is rotated in its own local space in one vectorized step;
+        child joints keep their world position and orientation.
+
+        Args:
+            joints (list[str]): Joints to rotate.
+            rotation (Sequence[float]): XYZ rotation in degrees, e.g. (90, 0, 0).
+
+        Returns:
+            int: The number of joints written.
+        """
+        targets = list(dict.fromkeys(cmds.ls(joints, long=True, type="joint") or []))
+        if not targets:
+            return 0
+
+        direct_children = cmds.listRelatives(targets, children=True, type="joint", fullPath=True) or []
+        arrays = cls.read_joint_arrays(targets + direct_children)
+        target_mask = np.isin(arrays.names, targets)
+
+        frames = arrays.rotations
+        frames[target_mask] = OrientSolver.euler_to_matrix([rotation])[0] @ frames[target_mask]
+        return cls.apply_world_rotations(arrays, frames, target_mask)
+
+    @classmethod
+    @profiled()
+    def set_local_axis_visibility(cls, joints, visible, undoable=True):
+        """Show or hide the local axis display of joints in one batched write.
+
+        Args:
+            joints (list[str]): Joints to affect.
+            visible (bool): True to show, False to hide.
+            undoable (bool): Record the change in the undo queue.
+
+        Returns:
+            int: The number of joints written.
+        """
+        writer = AttributeWriter()
+        writer.set_many(joints, "displayLocalAxis", visible)
+        written = writer.commit(undoable)
+        writer.report_failures("Failed to set local axis display")
+        return written
+
+    @classmethod
+    @profiled()
     def freeze_joint_orientation(cls, joints_to_orient):
         """Zero out jointOrient and bake the rotation into the joint's transform.
 
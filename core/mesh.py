@@ -0,0 +1,373 @@
+"""Utilities to move Maya polygon meshes to and from NumPy mesh data.
+
+MeshHelper.create_mesh hands the arrays of a MeshData to one OpenMaya 2.0
+MFnMesh.create call and shows polygroups as a vertex color set: the few
+distinct polygroup colors are set once and every face vertex is assigned its
+palette index in one call. The arrays still have to be copied element by
+element into OpenMaya arrays (om2 has no buffer constructor), but no Python
+loop over faces is written here. The geometry is built as mesh data and the
+nodes are created by a DAG modifier, so a created mesh is one undo step.
+
+MeshData points and matrices are in the scene's working linear unit unless a
+caller says otherwise (see scene_meters_per_unit).
+
+MeshHelper.read_mesh goes the other way, through the 1.0 API where arrays
+can reach NumPy as C buffers: points are viewed in place through
+MFnMesh.getRawPoints, topology and face vertex colors are copied by
+MIntArray/MColorArray.get into MScriptUtil buffers, and each buffer is copied
+once into NumPy. No Python object is created per vertex or face. It requires
+running inside Autodesk Maya.
+"""
+
+import ctypes
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+
+from core.attribute import AttributeWriter
+from core.meshdata import MeshData, Polygroups
+from core.profiling import profiled
+
+
+class MeshHelper:
+    """Helper methods for creating meshes from MeshData."""
+
+    POLYGROUP_COLOR_SET = "polygroups"
+    # Int32Array attribute on the mesh shape listing the polygroup IDs of the color set's colors.
+    POLYGROUP_IDS_ATTRIBUTE = "maksPolygroupIds"
+
+    # Meters per unit of Maya's internal unit, used by the API and MFnMesh points.
+    INTERNAL_METERS_PER_UNIT = 0.01
+    # cmds.currentUnit(linear=True) names -> meters per unit.
+    METERS_PER_UNIT = {"mm": 0.001, "cm": 0.01, "m": 1.0, "km": 1000.0,
+                       "in": 0.0254, "ft": 0.3048, "yd": 0.9144, "mi": 1609.344}
+
+    @classmethod
+    def scene_meters_per_unit(cls):
+        """Return the scene's working linear unit in meters, e.g. 0.01 for centimeters."""
+        return cls.METERS_PER_UNIT[cmds.currentUnit(query=True, linear=True)]
+
+    @classmethod
+    @profiled()
+    def create_mesh(cls, mesh_data, polygroup_colors=True, meters_per_unit=None):
+        """Create a mesh from NumPy arrays in a single MFnMesh.create call.
+
+        The geometry is built into a mesh data object; the transform and shape
+        are created by a DAG modifier and the geometry, transform channels and
+        polygroup attributes are written by one AttributeWriter, so the mesh,
+        its name, placement and shading are one undo step.
+
+        Args:
+            mesh_data (MeshData): The mesh to build.
+            polygroup_colors (bool): Show the polygroups as a vertex color set.
+            meters_per_unit (float | None): Linear unit of the mesh data;
+                defaults to the scene's working unit.
+
+        Returns:
+            str: Full path of the new mesh transform.
+
+        Raises:
+            ValueError: If the mesh data is inconsistent.
+        """
+        mesh_data.validate()
+        name = mesh_data.name or "mesh"
+
+        geometry = om2.MFnMeshData().create()
+        fn_mesh = om2.MFnMesh()
+        fn_mesh.create(om2.MFloatPointArray(mesh_data.points), cls.int_array(mesh_data.face_counts),
+                       cls.int_array(mesh_data.face_indices), parent=geometry)
+        ids = None
+        if polygroup_colors and mesh_data.polygroups is not None:
+            ids = cls.set_polygroup_colors(fn_mesh, mesh_data.face_counts, mesh_data.polygroups)
+
+        modifier = om2.MDagModifier()
+        transform = modifier.createNode("transform")
+        modifier.renameNode(transform, name)
+        shape = modifier.createNode("mesh", transform)
+        modifier.renameNode(shape, f"{name}Shape")
+        if ids is not None:
+            # Keep the IDs so an export can give the colors their original polygroup IDs back.
+            modifier.addAttribute(shape, om2.MFnTypedAttribute().create(
+                cls.POLYGROUP_IDS_ATTRIBUTE, cls.POLYGROUP_IDS_ATTRIBUTE, om2.MFnData.kIntArray))
+
+        cmds.undoInfo(openChunk=True, chunkName="maksCreateMesh")
+        try:
+            modifier.doIt()
+            writer = AttributeWriter()
+            writer.add_applied(modifier)
+
+            transform_path = om2.MFnDagNode(transform).fullPathName()
+            shape_path = om2.MFnDagNode(shape).fullPathName()
+            try:
+                writer.set(shape_path, "inMesh", geometry)
+                for attribute, value in cls.transform_values(mesh_data.matrix, meters_per_unit):
+                    writer.set(transform_path, attribute, value)
+                if ids is not None:
+                    writer.set(shape_path, "displayColors", True)
+                    writer.set(shape_path, cls.POLYGROUP_IDS_ATTRIBUTE,
+                               om2.MFnIntArrayData().create(cls.int_array(ids)))
+            except Exception:
+                writer.rollback()
+                raise
+            writer.commit()
+
+            cmds.sets(shape_path, edit=True, forceElement="initialShadingGroup")
+            if ids is not None:
+                cmds.polyColorSet(shape_path, currentColorSet=True, colorSet=cls.POLYGROUP_COLOR_SET)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        return transform_path
+
+    @classmethod
+    def transform_values(cls, matrix, meters_per_unit=None):
+        """Split a MeshData matrix into transform channel values for AttributeWriter.
+
+        MFnMesh reads points in internal units, so the unit change from
+        meters_per_unit is folded into the scale; the translation is given
+        in the scene's working unit, as AttributeWriter expects.
+
+        Args:
+            matrix (numpy.ndarray): (4, 4) row-vector matrix.
+            meters_per_unit (float | None): Linear unit of the matrix and of
+                the points it places; defaults to the scene's working unit.
+
+        Returns:
+            list[tuple[str, tuple[float, float, float]]]: translate, rotate
+            (in the scene's angle unit), scale and shear values.
+        """
+        scene_unit = cls.scene_meters_per_unit()
+        meters_per_unit = scene_unit if meters_per_unit is None else meters_per_unit
+
+        internal = np.array(matrix, dtype=np.float64)
+        internal[:3, :3] *= meters_per_unit / cls.INTERNAL_METERS_PER_UNIT
+        transformation = om2.MTransformationMatrix(om2.MMatrix(internal.reshape(-1).tolist()))
+        rotation = transformation.rotation()
+        return [
+            ("translate", tuple(np.asarray(matrix)[3, :3] * (meters_per_unit / scene_unit))),
+            ("rotate", tuple(om2.MAngle(angle).asUnits(om2.MAngle.uiUnit())
+                             for angle in (rotation.x, rotation.y, rotation.z))),
+            ("scale", tuple(transformation.scale(om2.MSpace.kTransform))),
+            ("shear", tuple(transformation.shear(om2.MSpace.kTransform))),
+        ]
+
+    @classmethod
+    def set_polygroup_colors(cls, fn_mesh, face_counts, polygroups):
+        """Add a color set coloring every face by its polygroup and make it current.
+
+        Args:
+            fn_mesh (om2.MFnMesh): Function set attached to the mesh or mesh data.
+            face_counts (numpy.ndarray): (F,) vertices per face.
+            polygroups (numpy.ndarray): (F,) polygroup ID per face.
+
+        Returns:
+            numpy.ndarray: The polygroup ID of each color of the color set.
+        """
+        ids, palette_indices = Polygroups.unique(polygroups)
+        rgba = np.ones((len(ids), 4), dtype=np.float32)
+        rgba[:, :3] = Polygroups.id_colors(ids)
+
+        color_set = fn_mesh.createColorSet(cls.POLYGROUP_COLOR_SET, False)
+        fn_mesh.setCurrentColorSetName(color_set)
+        fn_mesh.setColors(om2.MColorArray(rgba), color_set)
+        # One palette index per face vertex, in the same order as the face vertex indices.
+        fn_mesh.assignColors(cls.int_array(np.repeat(palette_indices, face_counts)), color_set)
+        return ids
+
+    @staticmethod
+    def int_array(values):
+        """Return values as an MIntArray without building an intermediate list.
+
+        Args:
+            values (numpy.ndarray): 1-D integer array.
+
+        Returns:
+            om2.MIntArray: The converted array.
+        """
+        return om2.MIntArray(memoryview(np.ascontiguousarray(values, dtype=np.int32)))
+
+    @classmethod
+    @profiled()
+    def create_meshes(cls, meshes, polygroup_colors=True, meters_per_unit=None):
+        """Create meshes one at a time from an iterable such as a reader.
+
+        Each MeshData is released before the next one is read, so streaming
+        readers only hold one mesh in memory. Meshes that fail validation are
+        reported and skipped. All meshes are one undo step.
+
+        Args:
+            meshes (Iterable[MeshData]): Meshes to build.
+            polygroup_colors (bool): See create_mesh.
+            meters_per_unit (float | None): See create_mesh.
+
+        Returns:
+            list[str]: Full paths of the created transforms.
+        """
+        created = []
+        cmds.undoInfo(openChunk=True, chunkName="maksCreateMeshes")
+        try:
+            for mesh_data in meshes:
+                try:
+                    created.append(cls.create_mesh(mesh_data, polygroup_colors, meters_per_unit))
+                except ValueError as e:
+                    om.MGlobal.displayWarning(str(e))
+                # Drop this mesh before the reader produces the next one.
+                del mesh_data
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        return created
+
+    @classmethod
+    @profiled()
+    def read_mesh(cls, mesh, color_set=None, meters_per_unit=None):
+        """Read a Maya mesh into NumPy arrays, with polygroups from a color set.
+
+        Args:
+            mesh (str): Mesh shape or its transform.
+            color_set (str | None): Color set holding the polygroup colors;
+                defaults to POLYGROUP_COLOR_SET, or the current color set
+                without one. No polygroups are read if the mesh has no color set.
+            meters_per_unit (float | None): Linear unit of the returned matrix;
+                defaults to the scene's working unit.
+
+        Returns:
+            MeshData: The mesh in object space, its matrix the world matrix.
+
+        Raises:
+            ValueError: If mesh is not a polygon mesh.
+        """
+        selection = om2.MSelectionList()
+        try:
+            selection.add(mesh)
+            dag_path = selection.getDagPath(0)
+            if not dag_path.hasFn(om2.MFn.kMesh):
+                dag_path.extendToShape()
+        except RuntimeError:
+            raise ValueError(f"{mesh} is not a polygon mesh")
+        if not dag_path.hasFn(om2.MFn.kMesh):
+            raise ValueError(f"{mesh} is not a polygon mesh")
+
+        fn_mesh = cls.api1_mesh(dag_path)
+        face_counts, face_indices = om.MIntArray(), om.MIntArray()
+        fn_mesh.getVertices(face_counts, face_indices)
+        face_counts = cls.int_buffer(face_counts)
+        face_indices = cls.int_buffer(face_indices)
+
+        polygroups = None
+        color_sets = []
+        fn_mesh.getColorSetNames(color_sets)
+        if color_set is None and cls.POLYGROUP_COLOR_SET in color_sets:
+            color_set = cls.POLYGROUP_COLOR_SET
+        elif color_set is None and color_sets:
+            color_set = fn_mesh.currentColorSetName()
+        if color_set in color_sets:
+            polygroups = Polygroups.from_colors(cls.face_colors(fn_mesh, face_counts, color_set),
+                                                cls.polygroup_ids(dag_path.fullPathName()))
+
+        # Points stay in internal units; the matrix takes them to the requested unit.
+        scene_unit = cls.scene_meters_per_unit() if meters_per_unit is None else meters_per_unit
+        matrix = np.reshape(list(dag_path.inclusiveMatrix()), (4, 4))
+        matrix[:, :3] *= cls.INTERNAL_METERS_PER_UNIT / scene_unit
+
+        transform = om2.MDagPath(dag_path)
+        transform.pop()
+        return MeshData(transform.partialPathName().rpartition("|")[2], cls.raw_points(fn_mesh),
+                        face_counts, face_indices, polygroups, matrix)
+
+    @staticmethod
+    def api1_mesh(dag_path):
+        """Return a 1.0 API MFnMesh for a mesh; only that API exposes raw buffers.
+
+        Args:
+            dag_path (om2.MDagPath): Path to the mesh shape.
+
+        Returns:
+            om.MFnMesh: The function set.
+        """
+        selection = om.MSelectionList()
+        selection.add(dag_path.fullPathName())
+        api1_path = om.MDagPath()
+        selection.getDagPath(0, api1_path)
+        return om.MFnMesh(api1_path)
+
+    @classmethod
+    def raw_points(cls, fn_mesh):
+        """Copy a mesh's object-space points into NumPy straight from Maya's buffer.
+
+        Args:
+            fn_mesh (om.MFnMesh): 1.0 API function set attached to the mesh.
+
+        Returns:
+            numpy.ndarray: (N, 3) float32 points.
+        """
+        count = fn_mesh.numVertices()
+        if not count:
+            return np.zeros((0, 3), dtype=np.float32)
+        buffer = (ctypes.c_float * (count * 3)).from_address(int(fn_mesh.getRawPoints()))
+        return np.frombuffer(buffer, dtype=np.float32).reshape(count, 3).copy()
+
+    @classmethod
+    def face_colors(cls, fn_mesh, face_counts, color_set):
+        """Return the color of the first vertex of every face.
+
+        Args:
+            fn_mesh (om.MFnMesh): 1.0 API function set attached to the mesh.
+            face_counts (numpy.ndarray): (F,) vertices per face.
+            color_set (str): Color set to read.
+
+        Returns:
+            numpy.ndarray: (F, 4) float32 RGBA colors; unset colors are black.
+        """
+        colors = om.MColorArray()
+        fn_mesh.getFaceVertexColors(colors, color_set, om.MColor(0.0, 0.0, 0.0, 1.0))
+        starts = np.cumsum(face_counts, dtype=np.int64) - face_counts
+        return cls.color_buffer(colors)[starts]
+
+    @staticmethod
+    def int_buffer(values):
+        """Copy a 1.0 API MIntArray into NumPy through a C buffer.
+
+        Args:
+            values (om.MIntArray): Array to convert.
+
+        Returns:
+            numpy.ndarray: 1-D int32 array.
+        """
+        count = values.length()
+        if not count:
+            return np.zeros(0, dtype=np.int32)
+        util = om.MScriptUtil()
+        util.createFromList([0] * count, count)
+        pointer = util.asIntPtr()
+        values.get(pointer)
+        buffer = (ctypes.c_int * count).from_address(int(pointer))
+        return np.frombuffer(buffer, dtype=np.int32).copy()
+
+    @staticmethod
+    def color_buffer(colors):
+        """Copy a 1.0 API MColorArray into NumPy through a C buffer.
+
+        Args:
+            colors (om.MColorArray): Colors to convert.
+
+        Returns:
+            numpy.ndarray: (N, 4) float32 RGBA colors.
+        """
+        count = colors.length()
+        if not count:
+            return np.zeros((0, 4), dtype=np.float32)
+        util = om.MScriptUtil()
+        util.createFromList([0.0] * (count * 4), count * 4)
+        pointer = util.asFloat4Ptr()
+        colors.get(pointer)
+        buffer = (ctypes.c_float * (count * 4)).from_address(int(pointer))
+        return np.frombuffer(buffer, dtype=np.float32).reshape(count, 4).copy()
+
+    @classmethod
+    def polygroup_ids(cls, shape):
+        """Return the polygroup IDs stored on a mesh by create_mesh, or None."""
+        if not cmds.attributeQuery(cls.POLYGROUP_IDS_ATTRIBUTE, node=shape, exists=True):
+            return None
+        return cmds.getAttr(f"{shape}.{cls.POLYGROUP_IDS_ATTRIBUTE}") or None
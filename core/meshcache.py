@@ -0,0 +1,261 @@
+"""On-disk cache of imported meshes as memory-mappable NumPy files.
+
+Parsing a multi-million polygon USD file takes far longer than reading its
+arrays back. MeshCache keeps, per source file, one .npy file per mesh array
+and a JSON manifest recording the source's size, modification time and
+content hash, the import options and a digest of every array. A later import
+of an unchanged source maps the arrays straight from disk (np.load with
+mmap_mode) without parsing anything. When the source did change, the new
+meshes are compared array by array and only the arrays whose digest differs
+(e.g. just the polygroups after regrouping in ZBrush) are rewritten.
+
+Array files are named after their digest and never overwritten, because a
+file that is still memory-mapped cannot be replaced on Windows. A changed
+array goes to a new file recorded in the manifest; files the manifest no
+longer lists are deleted once they can be, i.e. after their maps were
+released, at the end of a later read.
+
+It only needs NumPy, so it can be used and tested with synthetic MeshData
+outside Maya::
+
+    cache = MeshCache()
+    for mesh_data in cache.read("sculpt.usd", UsdMeshReader.read, up_axis="y"):
+        ...
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from core.meshdata import MeshData
+
+
+class MeshCache:
+    """A directory of cached meshes, one entry per source file.
+
+    Attributes:
+        root (str): Cache directory.
+        last_hit (bool): Whether the last read was served from the cache.
+        refreshed (list[tuple[str, str]]): (mesh name, array name) pairs
+            written by the last read that missed the cache.
+    """
+
+    VERSION = 1
+    ARRAYS = ("points", "face_counts", "face_indices", "polygroups")
+    MANIFEST = "manifest.json"
+    HASH_BLOCK_SIZE = 1 << 22
+
+    def __init__(self, root=None):
+        self.root = root or self.default_root()
+        self.last_hit = False
+        self.refreshed = []
+
+    @staticmethod
+    def default_root():
+        """Return the cache directory: $MAKS_MESH_CACHE or a folder in the temp directory."""
+        return os.environ.get("MAKS_MESH_CACHE") or os.path.join(tempfile.gettempdir(), "maks_tools", "mesh_cache")
+
+    def entry_path(self, source):
+        """Return the cache folder of a source file.
+
+        Args:
+            source (str): Source file path.
+        """
+        key = hashlib.blake2b(os.path.abspath(source).encode("utf-8"), digest_size=12).hexdigest()
+        return os.path.join(self.root, key)
+
+    @classmethod
+    def file_hash(cls, path):
+        """Return the content hash of a file, read in blocks.
+
+        Args:
+            path (str): File path.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(cls.HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def array_digest(array):
+        """Return a digest of an array's dtype, shape and data, hashed without copying it."""
+        array = np.ascontiguousarray(array)
+        digest = hashlib.blake2b(f"{array.dtype.str}{array.shape}".encode("ascii"), digest_size=16)
+        digest.update(memoryview(array).cast("B"))
+        return digest.hexdigest()
+
+    def read(self, source, reader, **options):
+        """Yield the meshes of a source file, from the cache when it is fresh.
+
+        On a miss every mesh coming from reader is written to the cache as it
+        passes through, so the source is still only read once and streamed.
+
+        Args:
+            source (str): Source file path.
+            reader (Callable[..., Iterable[MeshData]]): Parser called as
+                reader(source, **options) on a cache miss.
+            **options: Import options; cached meshes are only used if they
+                were imported with the same options.
+
+        Yields:
+            MeshData: The meshes, memory-mapped read-only on a cache hit.
+        """
+        self.refreshed = []
+        manifest = self.load_manifest(source)
+        stat = os.stat(source)
+        source_hash = None
+        if manifest and manifest["options"] == options:
+            if (manifest["size"], manifest["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                # Touched but maybe not modified: compare content before parsing.
+                source_hash = self.file_hash(source)
+                if source_hash == manifest["hash"]:
+                    manifest["size"], manifest["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                    self.save_manifest(source, manifest)
+            if source_hash is None or source_hash == manifest["hash"]:
+                meshes = self.load_meshes(source, manifest)
+                if meshes is not None:
+                    self.last_hit = True
+                    yield from meshes
+                    self.remove_unused(self.entry_path(source), manifest)
+                    return
+
+        self.last_hit = False
+        yield from self.store(source, reader(source, **options), options, manifest, source_hash)
+
+    def store(self, source, meshes, options=None, previous=None, source_hash=None):
+        """Write meshes to the cache entry of source while yielding them.
+
+        Arrays whose digest matches the previous entry are kept as they are;
+        changed arrays are written to new files, so maps of the old ones stay
+        valid. The manifest is written once every mesh went through, so an
+        interrupted import never leaves a partial entry that looks valid.
+
+        Args:
+            source (str): Source file path.
+            meshes (Iterable[MeshData]): Meshes read from source.
+            options (dict | None): Import options the meshes were read with.
+            previous (dict | None): Manifest of the existing entry, if any.
+            source_hash (str | None): Content hash of source, if known.
+
+        Yields:
+            MeshData: The meshes from the input, unchanged.
+        """
+        entry = self.entry_path(source)
+        os.makedirs(entry, exist_ok=True)
+        # Array files are about to change under the old manifest.
+        self.invalidate(source)
+        stat = os.stat(source)
+        previous_arrays = {mesh["name"]: mesh["arrays"] for mesh in (previous or {}).get("meshes", [])}
+
+        records = []
+        for index, mesh_data in enumerate(meshes):
+            old_arrays = previous_arrays.get(mesh_data.name, {})
+            arrays = {}
+            for array_name in self.ARRAYS:
+                array = getattr(mesh_data, array_name)
+                if array is None:
+                    continue
+                digest = self.array_digest(array)
+                old = old_arrays.get(array_name)
+                if old and old["digest"] == digest and os.path.exists(os.path.join(entry, old["file"])):
+                    file_name = old["file"]
+                else:
+                    file_name = self.array_file_name(index, array_name, digest)
+                    self.write_array(os.path.join(entry, file_name), array)
+                    self.refreshed.append((mesh_data.name, array_name))
+                arrays[array_name] = {"file": file_name, "digest": digest}
+            records.append({"name": mesh_data.name, "matrix": mesh_data.matrix.reshape(-1).tolist(),
+                            "arrays": arrays})
+            yield mesh_data
+
+        manifest = {
+            "version": self.VERSION,
+            "source": os.path.abspath(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": source_hash or self.file_hash(source),
+            "options": options or {},
+            "meshes": records,
+        }
+        self.save_manifest(source, manifest)
+        self.remove_unused(entry, manifest)
+
+    def load_meshes(self, source, manifest):
+        """Map the cached arrays of an entry.
+
+        Returns:
+            list[MeshData] | None: The meshes, or None if a file is missing.
+        """
+        entry = self.entry_path(source)
+        meshes = []
+        try:
+            for record in manifest["meshes"]:
+                arrays = {array_name: np.load(os.path.join(entry, info["file"]), mmap_mode="r")
+                          for array_name, info in record["arrays"].items()}
+                meshes.append(MeshData(record["name"], arrays["points"], arrays["face_counts"],
+                                       arrays["face_indices"], arrays.get("polygroups"), record["matrix"]))
+        except (OSError, KeyError, ValueError):
+            return None
+        return meshes
+
+    def load_manifest(self, source):
+        """Return the manifest of a source's entry, or None if there is no valid one."""
+        try:
+            with open(os.path.join(self.entry_path(source), self.MANIFEST), "r") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("version") != self.VERSION:
+            return None
+        return manifest
+
+    def save_manifest(self, source, manifest):
+        """Write the manifest of a source's entry, replacing the old one atomically."""
+        path = os.path.join(self.entry_path(source), self.MANIFEST)
+        with open(path + ".tmp", "w") as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def invalidate(self, source):
+        """Forget the cached meshes of a source file."""
+        path = os.path.join(self.entry_path(source), self.MANIFEST)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @staticmethod
+    def array_file_name(index, array_name, digest):
+        """Return the file name of a mesh array; a new digest gives a new name."""
+        return f"{index}_{array_name}_{digest[:16]}.npy"
+
+    @staticmethod
+    def write_array(path, array):
+        """Write an array as a new .npy file.
+
+        An existing file of that name already holds the same data (names
+        follow the digest) and may be memory-mapped, so it is left alone.
+        """
+        if os.path.exists(path):
+            return
+        # Write under a temporary name first so a crash never leaves a truncated file.
+        with open(path + ".tmp", "wb") as handle:
+            np.save(handle, np.ascontiguousarray(array), allow_pickle=False)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def remove_unused(cls, entry, manifest):
+        """Delete array files of an entry that its manifest no longer lists.
+
+        Files that are still memory-mapped cannot be deleted on Windows; they
+        are skipped and deleted by a later call.
+        """
+        used = {info["file"] for mesh in manifest["meshes"] for info in mesh["arrays"].values()}
+        for file_name in os.listdir(entry):
+            if file_name.endswith(".npy") and file_name not in used:
+                try:
+                    os.remove(os.path.join(entry, file_name))
+                except OSError:
+                    pass
@@ -0,0 +1,189 @@
+"""Plain NumPy containers for polygon meshes moving between files and Maya.
+
+MeshData holds the arrays of one mesh exactly as Maya's MFnMesh.create wants
+them (points, face vertex counts and face vertex indices) plus optional
+per-face polygroup IDs. It imports neither Maya nor USD, so readers, caches
+and worker processes can share it.
+
+Polygroups are shown in Maya as vertex colors. Polygroups.to_colors maps the
+IDs of a whole mesh to a small palette and a per-face palette index in one
+vectorized lookup, without a Python loop over faces; Polygroups.from_colors
+goes back by snapping every face color to the nearest polygroup color.
+"""
+
+import numpy as np
+
+
+class MeshData:
+    """Arrays describing one polygon mesh.
+
+    Attributes:
+        name (str): Mesh name, usually the source prim name.
+        points (numpy.ndarray): (N, 3) float32 vertex positions.
+        face_counts (numpy.ndarray): (F,) int32 number of vertices per face.
+        face_indices (numpy.ndarray): (sum(face_counts),) int32 vertex index
+            of every face vertex, face after face.
+        polygroups (numpy.ndarray | None): (F,) int32 polygroup ID per face.
+        matrix (numpy.ndarray): (4, 4) float64 row-vector transform placing
+            the mesh in the scene.
+    """
+
+    def __init__(self, name, points, face_counts, face_indices, polygroups=None, matrix=None):
+        self.name = name
+        self.points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        self.face_counts = np.asarray(face_counts, dtype=np.int32)
+        self.face_indices = np.asarray(face_indices, dtype=np.int32)
+        self.polygroups = None if polygroups is None else np.asarray(polygroups, dtype=np.int32)
+        self.matrix = np.identity(4) if matrix is None else np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+
+    def __repr__(self):
+        return f"MeshData({self.name!r}, {len(self.points)} points, {len(self.face_counts)} faces)"
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the mesh arrays."""
+        arrays = (self.points, self.face_counts, self.face_indices, self.polygroups)
+        return sum(array.nbytes for array in arrays if array is not None)
+
+    def validate(self):
+        """Check that the arrays describe a consistent mesh.
+
+        Raises:
+            ValueError: If the counts, indices or polygroups do not match.
+        """
+        if len(self.face_indices) != int(self.face_counts.sum(dtype=np.int64)):
+            raise ValueError(f"{self.name}: face counts add up to {int(self.face_counts.sum(dtype=np.int64))} "
+                             f"face vertices, got {len(self.face_indices)} indices")
+        if len(self.face_counts) and self.face_counts.min() < 3:
+            raise ValueError(f"{self.name}: faces need at least 3 vertices")
+        if len(self.face_indices) and (self.face_indices.min() < 0 or self.face_indices.max() >= len(self.points)):
+            raise ValueError(f"{self.name}: face vertex index out of range for {len(self.points)} points")
+        if self.polygroups is not None and len(self.polygroups) != len(self.face_counts):
+            raise ValueError(f"{self.name}: {len(self.polygroups)} polygroup IDs for {len(self.face_counts)} faces")
+
+    def reverse_winding(self):
+        """Flip every face in place by reversing its vertex order (left-handed sources)."""
+        if not len(self.face_indices):
+            return
+        ends = np.cumsum(self.face_counts, dtype=np.int64)
+        starts = ends - self.face_counts
+        face_of = np.repeat(np.arange(len(self.face_counts)), self.face_counts)
+        # Face vertex k of a face moves to position count - 1 - k, i.e. start + end - 1 - position.
+        order = starts[face_of] + ends[face_of] - 1 - np.arange(len(self.face_indices))
+        self.face_indices = self.face_indices[order]
+
+
+class Polygroups:
+    """Conversion between polygroup IDs and display colors."""
+
+    # Hue step between consecutive IDs; the golden ratio keeps neighbours distinct.
+    HUE_STEP = 0.618033988749895
+    SATURATION = 0.55
+    VALUE = 0.9
+
+    # IDs spanning more than this many values per face are grouped with a sort instead of a lookup table.
+    MAX_LOOKUP_SPAN = 4
+
+    # Largest RGB distance (0-1 per channel) at which a face color still counts as a known polygroup's color.
+    COLOR_TOLERANCE = 0.05
+
+    @classmethod
+    def to_colors(cls, polygroups):
+        """Map polygroup IDs to a palette and a palette index per face.
+
+        The same ID always gets the same color, in every mesh.
+
+        Args:
+            polygroups (numpy.ndarray): (F,) integer polygroup ID per face.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (G, 3) float32 RGB colors (0-1)
+            of the G distinct IDs, and (F,) int32 palette index per face.
+        """
+        ids, palette_indices = cls.unique(polygroups)
+        return cls.id_colors(ids), palette_indices
+
+    @classmethod
+    def unique(cls, polygroups):
+        """Return the distinct IDs and each face's index into them.
+
+        IDs in a compact non-negative range, as ZBrush writes them, are grouped
+        through a lookup table in linear time; others fall back to np.unique.
+
+        Args:
+            polygroups (numpy.ndarray): (F,) integer polygroup ID per face.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (G,) sorted distinct IDs and
+            (F,) int32 index of each face's ID.
+        """
+        polygroups = np.asarray(polygroups)
+        if not len(polygroups):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+
+        low, high = int(polygroups.min()), int(polygroups.max())
+        if low < 0 or high >= cls.MAX_LOOKUP_SPAN * len(polygroups) + 1024:
+            ids, palette_indices = np.unique(polygroups, return_inverse=True)
+            return ids, palette_indices.astype(np.int32).reshape(-1)
+
+        present = np.zeros(high + 1, dtype=bool)
+        present[polygroups] = True
+        lookup = np.cumsum(present, dtype=np.int32) - 1
+        return np.flatnonzero(present), lookup[polygroups]
+
+    @classmethod
+    def id_colors(cls, ids):
+        """Return the display color of each polygroup ID.
+
+        Args:
+            ids (numpy.ndarray): (G,) integer IDs.
+
+        Returns:
+            numpy.ndarray: (G, 3) float32 RGB colors (0-1).
+        """
+        hue = (np.asarray(ids, dtype=np.float64) * cls.HUE_STEP) % 1.0
+        # Vectorized HSV to RGB with fixed saturation and value.
+        sector = hue[:, None] * 6.0 + np.array([5.0, 3.0, 1.0])
+        ramp = np.clip(np.minimum(sector % 6.0, 4.0 - sector % 6.0), 0.0, 1.0)
+        return (cls.VALUE * (1.0 - cls.SATURATION * ramp)).astype(np.float32)
+
+    @classmethod
+    def from_colors(cls, colors, ids=None, tolerance=None):
+        """Turn per-face colors back into polygroup IDs.
+
+        Colors are quantized to 8 bits per channel and grouped, then each
+        distinct color is matched to the nearest color of the known ids, so
+        the lookup costs one pass over the faces plus a small
+        (distinct colors x known ids) distance table. Colors farther than
+        tolerance from every known color, e.g. painted by hand, become new
+        polygroups numbered after the known ids.
+
+        Args:
+            colors (numpy.ndarray): (F, 3) or (F, 4) RGB(A) color per face, 0-1.
+            ids (Sequence[int] | None): Polygroup IDs the colors were made
+                from (see to_colors); without them every distinct color is a
+                new polygroup.
+            tolerance (float | None): Matching distance; defaults to COLOR_TOLERANCE.
+
+        Returns:
+            numpy.ndarray: (F,) int32 polygroup ID per face.
+        """
+        tolerance = cls.COLOR_TOLERANCE if tolerance is None else tolerance
+        levels = np.clip(np.rint(np.asarray(colors)[:, :3] * 255.0), 0, 255).astype(np.int32)
+        keys = (levels[:, 0] << 16) | (levels[:, 1] << 8) | levels[:, 2]
+        unique_keys, face_colors = cls.unique(keys)
+        unique_colors = np.column_stack([unique_keys >> 16, (unique_keys >> 8) & 255, unique_keys & 255]) / 255.0
+
+        color_ids = np.full(len(unique_keys), -1, dtype=np.int64)
+        next_id = 0
+        if ids is not None and len(ids):
+            ids = np.asarray(ids, dtype=np.int64)
+            distances = np.linalg.norm(unique_colors[:, None, :] - cls.id_colors(ids)[None, :, :], axis=-1)
+            nearest = distances.argmin(axis=1)
+            matched = distances[np.arange(len(unique_keys)), nearest] <= tolerance
+            color_ids[matched] = ids[nearest[matched]]
+            next_id = int(ids.max()) + 1
+
+        unmatched = color_ids < 0
+        color_ids[unmatched] = np.arange(next_id, next_id + int(unmatched.sum()))
+        return color_ids.astype(np.int32)[face_colors]
@@ -0,0 +1,222 @@
+"""Mirror joint orientations from one side of a skeleton to the other.
+
+MirrorMatcher pairs every joint on the source side with its counterpart in
+linear time: by name, swapping side tokens such as "L"/"R" or "left"/"right"
+and looking the result up in a dictionary, or by position, looking mirrored
+world positions up in a hash grid of cells one tolerance wide. Neither
+compares every joint with every other, so full-body skeletons with finger
+and face joints match as fast as a single arm.
+
+MirrorHelper.mirror_orientations mirrors the world frames of all matched
+source joints with one batched OrientSolver.mirror_frames call and writes the
+counterparts' jointOrients in one JointHelper.apply_world_rotations pass. It
+requires running inside Autodesk Maya.
+"""
+
+import re
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+
+from core.constants import MIRROR_MATCH_MODES
+from core.joint import JointHelper
+from core.orient import OrientSolver
+from core.profiling import profiled
+
+
+class MirrorMatcher:
+    """Pairs joints with their mirrored counterparts by name or by position."""
+
+    # (left, right) side tokens, matched as whole words of a name.
+    SIDE_TOKENS = (("L", "R"), ("l", "r"), ("Left", "Right"), ("left", "right"), ("Lf", "Rt"), ("lf", "rt"))
+    # Default position tolerance, in scene units.
+    TOLERANCE = 0.01
+
+    # Cell coordinates are packed into one int64 key, 21 bits per axis.
+    _CELL_BITS = 21
+    _CELL_OFFSETS = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), -1).reshape(-1, 3)
+
+    _side_pattern = None
+
+    @classmethod
+    def side_pattern(cls):
+        """Return the compiled regex matching any side token as a word of a name."""
+        if cls._side_pattern is None:
+            tokens = sorted({token for pair in cls.SIDE_TOKENS for token in pair}, key=len, reverse=True)
+            # A token starts a name or follows a separator, and ends one or is followed by a
+            # separator, a digit, or (for words) the capital letter of the next camelCase word.
+            alternatives = "|".join(f"{re.escape(token)}(?=[_|:0-9{'A-Z' if len(token) > 1 else ''}]|$)"
+                                    for token in tokens)
+            cls._side_pattern = re.compile(f"(?:^|(?<=[_|:]))(?:{alternatives})")
+        return cls._side_pattern
+
+    @classmethod
+    def mirror_name(cls, name):
+        """Return name with every side token swapped for the other side's.
+
+        Args:
+            name (str): Node name or DAG path, e.g. "|root|L_arm|L_elbow".
+
+        Returns:
+            str: The mirrored name, e.g. "|root|R_arm|R_elbow".
+        """
+        swaps = {}
+        for left, right in cls.SIDE_TOKENS:
+            swaps[left], swaps[right] = right, left
+        return cls.side_pattern().sub(lambda match: swaps[match.group(0)], name)
+
+    @classmethod
+    def match_names(cls, names, from_left=True):
+        """Pair the joints of one side with the joints named like their mirror.
+
+        A joint belongs to the side of the last side token in its own name.
+
+        Args:
+            names (Sequence[str]): Full DAG paths.
+            from_left (bool): Use the left side as the source.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (P,) source indices and (P,)
+            indices of their counterparts.
+        """
+        source_tokens = {pair[0] if from_left else pair[1] for pair in cls.SIDE_TOKENS}
+        index_map = {name: index for index, name in enumerate(names)}
+        pattern = cls.side_pattern()
+
+        sources, targets = [], []
+        for index, name in enumerate(names):
+            tokens = pattern.findall(name.rpartition("|")[2])
+            if not tokens or tokens[-1] not in source_tokens:
+                continue
+            target = index_map.get(cls.mirror_name(name))
+            if target is not None and target != index:
+                sources.append(index)
+                targets.append(target)
+        return np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64)
+
+    @classmethod
+    def match_positions(cls, positions, axis="x", from_positive=True, tolerance=None):
+        """Pair the joints of one side with the joints at their mirrored positions.
+
+        Positions are hashed into a grid of cells one tolerance wide, so the
+        counterpart of a joint can only be in the 27 cells around its
+        mirrored position; those are looked up for all joints at once with a
+        sorted key array.
+
+        Args:
+            positions (numpy.ndarray): (N, 3) world positions.
+            axis (str): Normal of the mirror plane, 'x' for the YZ plane.
+            from_positive (bool): Use the positive side of the axis as the
+                source (the character's left for 'x').
+            tolerance (float | None): Largest distance between a mirrored
+                position and its counterpart; defaults to TOLERANCE.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (P,) source indices and (P,)
+            indices of their counterparts, each counterpart used once.
+        """
+        tolerance = cls.TOLERANCE if tolerance is None else tolerance
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        axis_index = OrientSolver.AXES.index(axis)
+        sign = 1.0 if from_positive else -1.0
+
+        sources = np.flatnonzero(positions[:, axis_index] * sign > tolerance)
+        mirrored = positions[sources].copy()
+        mirrored[:, axis_index] *= -1.0
+
+        keys = cls._cell_keys(np.floor(positions / tolerance).astype(np.int64))
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        query_cells = np.floor(mirrored / tolerance).astype(np.int64)
+
+        best = np.full(len(sources), -1, dtype=np.int64)
+        best_distances = np.full(len(sources), np.inf)
+        for offset in cls._CELL_OFFSETS:
+            query_keys = cls._cell_keys(query_cells + offset)
+            starts = np.searchsorted(sorted_keys, query_keys, side="left")
+            ends = np.searchsorted(sorted_keys, query_keys, side="right")
+            # Cells rarely hold more than one joint; visit the k-th joint of every cell together.
+            for k in range(int((ends - starts).max(initial=0))):
+                found = starts + k < ends
+                candidates = order[np.minimum(starts + k, len(order) - 1)]
+                distances = np.linalg.norm(positions[candidates] - mirrored, axis=1)
+                better = found & (distances <= tolerance) & (distances < best_distances)
+                best[better] = candidates[better]
+                best_distances[better] = distances[better]
+
+        matched = np.flatnonzero(best >= 0)
+        # Where two sources found the same counterpart, keep the closer one.
+        matched = matched[np.argsort(best_distances[matched], kind="stable")]
+        _, first = np.unique(best[matched], return_index=True)
+        matched = np.sort(matched[first])
+        return sources[matched], best[matched]
+
+    @classmethod
+    def _cell_keys(cls, cells):
+        bits = cls._CELL_BITS
+        cells = np.clip(cells + (1 << (bits - 1)), 0, (1 << bits) - 1)
+        return (cells[:, 0] << (2 * bits)) | (cells[:, 1] << bits) | cells[:, 2]
+
+
+class MirrorHelper:
+    """Mirrors joint orientations across a world plane in one batched write."""
+
+    MATCH_MODES = MIRROR_MATCH_MODES
+
+    @classmethod
+    @profiled()
+    def mirror_orientations(cls, joints, axis="x", match="name", from_positive=True, behavior=True,
+                            tolerance=None, sources=None):
+        """Orient the counterparts of source-side joints as their mirror images.
+
+        Only orientations change: every counterpart keeps its world position,
+        and its children keep their world position and orientation.
+
+        Args:
+            joints (list[str]): Joints to search for pairs, both sides.
+            axis (str): Normal of the mirror plane, 'x' for the YZ plane.
+            match (str): 'name' to pair by side tokens, 'position' to pair by
+                mirrored world position.
+            from_positive (bool): Mirror from the left / positive side to the
+                right / negative side, or the other way around.
+            behavior (bool): See OrientSolver.mirror_frames.
+            tolerance (float | None): See MirrorMatcher.match_positions.
+            sources (list[str] | None): Only mirror these source-side joints,
+                e.g. the selected arm; joints still supplies the counterparts.
+
+        Returns:
+            int: The number of joints written.
+
+        Raises:
+            ValueError: If match is not one of MATCH_MODES.
+        """
+        if match not in cls.MATCH_MODES:
+            raise ValueError(f"Unknown match mode {match!r}, expected one of {cls.MATCH_MODES}")
+
+        arrays = JointHelper.read_joint_arrays(joints)
+        if match == "name":
+            pairs = MirrorMatcher.match_names(arrays.names, from_positive)
+        else:
+            pairs = MirrorMatcher.match_positions(arrays.positions, axis, from_positive, tolerance)
+        source_indices, target_indices = pairs
+        if sources is not None:
+            # cmds.ls with an empty list would list every node.
+            allowed = set(cmds.ls(sources, long=True) or []) if sources else set()
+            keep = np.array([arrays.names[index] in allowed for index in source_indices], dtype=bool)
+            source_indices, target_indices = source_indices[keep], target_indices[keep]
+        if not len(source_indices):
+            om.MGlobal.displayWarning("No mirrored joint pairs found")
+            return 0
+
+        mirrored = OrientSolver.mirror_frames(arrays.rotations[source_indices], axis, behavior)
+        target_names = [arrays.names[index] for index in target_indices]
+        target_arrays, target_mask = JointHelper.read_orient_targets(target_names)
+        index_map = {name: index for index, name in enumerate(target_arrays.names)}
+
+        frames = target_arrays.rotations
+        frames[[index_map[name] for name in target_names]] = mirrored
+        written = JointHelper.apply_world_rotations(target_arrays, frames, target_mask)
+        om.MGlobal.displayInfo(f"Mirrored the orientation of {len(source_indices)} joint(s)")
+        return written
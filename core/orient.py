@@ -0,0 +1,375 @@
+"""Array math for orienting joint chains without going through maya.cmds.
+
+This module holds the pure NumPy side of joint orientation: building aim/up
+frames for whole chains at once and converting them into jointOrient values.
+It does not import Maya so it can be exercised and benchmarked from any Python
+interpreter; core.joint feeds it with arrays read from the scene.
+
+Conventions follow Maya: matrices use row vectors (v' = v * M), rows 0-2 of a
+rotation matrix are the joint's X, Y and Z axes in world space, and Euler
+angles are in degrees with the XYZ rotation order used by jointOrient.
+"""
+
+import numpy as np
+
+
+class OrientSolver:
+    """Batched aim/up frame solver working on plain NumPy arrays.
+
+    All methods take arrays describing N joints:
+    - positions (N, 3): world positions.
+    - parent_indices (N,): index of each joint's parent in the same arrays,
+      or -1 when the parent is not part of the set.
+    - rotations (N, 3, 3): orthonormal world rotation matrices.
+    """
+
+    AXES = "xyz"
+    EPSILON = 1e-8
+
+    @classmethod
+    def axis_vector(cls, direction):
+        """Return the world vector for a secondaryAxisOrient style string.
+
+        Args:
+            direction (str): One of 'xup', 'xdown', 'yup', 'ydown', 'zup',
+                'zdown' or 'none'/'noneup'/'nonedown'.
+
+        Returns:
+            numpy.ndarray | None: A unit vector, or None for 'none'.
+        """
+        axis = direction[:1].lower()
+        if axis not in cls.AXES or direction.startswith("none"):
+            return None
+
+        vector = np.zeros(3)
+        vector[cls.AXES.index(axis)] = -1.0 if direction.endswith("down") else 1.0
+        return vector
+
+    @staticmethod
+    def normalize(vectors):
+        """Normalize an (N, 3) array row by row, leaving zero rows untouched."""
+        lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+
+    @staticmethod
+    def first_children(parent_indices):
+        """Return the index of the first child of every joint, -1 for leaves.
+
+        "First" follows array order, which matches the child Maya aims at when
+        the arrays are read in DAG order.
+        """
+        parent_indices = np.asarray(parent_indices)
+        first_child = np.full(len(parent_indices), -1, dtype=np.int64)
+        parents, first = np.unique(parent_indices, return_index=True)
+        valid = parents >= 0
+        first_child[parents[valid]] = first[valid]
+        return first_child
+
+    @staticmethod
+    def depths(parent_indices):
+        """Return the depth of every joint below its top-most parent in the set."""
+        parent_indices = np.asarray(parent_indices)
+        depth = np.zeros(len(parent_indices), dtype=np.int64)
+        current = parent_indices.copy()
+        while True:
+            mask = current >= 0
+            if not mask.any():
+                return depth
+            depth[mask] += 1
+            current[mask] = parent_indices[current[mask]]
+
+    @staticmethod
+    def euler_to_matrix(angles):
+        """Convert (N, 3) XYZ Euler angles in degrees into (N, 3, 3) matrices."""
+        radians = np.radians(np.asarray(angles, dtype=float))
+        cx, cy, cz = np.cos(radians).T
+        sx, sy, sz = np.sin(radians).T
+
+        matrices = np.empty((len(radians), 3, 3))
+        matrices[:, 0, 0] = cy * cz
+        matrices[:, 0, 1] = cy * sz
+        matrices[:, 0, 2] = -sy
+        matrices[:, 1, 0] = sx * sy * cz - cx * sz
+        matrices[:, 1, 1] = sx * sy * sz + cx * cz
+        matrices[:, 1, 2] = sx * cy
+        matrices[:, 2, 0] = cx * sy * cz + sx * sz
+        matrices[:, 2, 1] = cx * sy * sz - sx * cz
+        matrices[:, 2, 2] = cx * cy
+        return matrices
+
+    @classmethod
+    def matrix_to_euler(cls, matrices):
+        """Convert (N, 3, 3) rotation matrices into XYZ Euler angles in degrees."""
+        matrices = np.asarray(matrices, dtype=float)
+        sy = np.clip(-matrices[:, 0, 2], -1.0, 1.0)
+        cy = np.sqrt(matrices[:, 0, 0] ** 2 + matrices[:, 0, 1] ** 2)
+        gimbal = cy < 1e-6
+
+        x = np.where(gimbal,
+                     np.arctan2(-matrices[:, 2, 1], matrices[:, 1, 1]),
+                     np.arctan2(matrices[:, 1, 2], matrices[:, 2, 2]))
+        y = np.arcsin(sy)
+        z = np.where(gimbal, 0.0, np.arctan2(matrices[:, 0, 1], matrices[:, 0, 0]))
+        return np.degrees(np.stack((x, y, z), axis=-1))
+
+    @classmethod
+    def aim_frames(cls, positions, parent_indices, indices, orient_order, secondary_axis, auto_orient=False):
+        """Build world frames aiming each joint at its first child.
+
+        Args:
+            positions (numpy.ndarray): (N, 3) world positions.
+            parent_indices (numpy.ndarray): (N,) parent indices.
+            indices (numpy.ndarray): Joints to build frames for; each must have
+                at least one child.
+            orient_order (str): Aim, up and third axis, e.g. 'xyz' or 'yzx'.
+            secondary_axis (str): World up direction, e.g. 'yup' or 'zdown'.
+            auto_orient (bool): Derive the up axis from the plane each joint
+                forms with its parent and child, using the world up direction
+                only to pick a side, like autoOrientSecondaryAxis.
+
+        Returns:
+            numpy.ndarray: (len(indices), 3, 3) world rotation matrices.
+        """
+        positions = np.asarray(positions, dtype=float)
+        parent_indices = np.asarray(parent_indices)
+        indices = np.asarray(indices, dtype=np.int64)
+        first_child = cls.first_children(parent_indices)
+
+        aim = cls.normalize(positions[first_child[indices]] - positions[indices])
+
+        world_up = cls.axis_vector(secondary_axis)
+        reference = world_up if world_up is not None else np.array([0.0, 1.0, 0.0])
+        up = np.broadcast_to(reference, aim.shape).copy()
+
+        if auto_orient or world_up is None:
+            normals = cls.chain_normals(positions, parent_indices, first_child)[indices]
+            plane_up = cls.normalize(np.cross(normals, aim))
+            valid = np.linalg.norm(plane_up, axis=-1) > cls.EPSILON
+            flip = np.einsum("ij,j->i", plane_up, reference) < -cls.EPSILON
+            plane_up[flip] *= -1.0
+            up[valid] = plane_up[valid]
+
+        # Remove the aim component; fall back to the least aligned world axis
+        # when the up vector is parallel to the aim vector.
+        up -= np.einsum("ij,ij->i", up, aim)[:, None] * aim
+        degenerate = np.linalg.norm(up, axis=-1) < cls.EPSILON
+        if degenerate.any():
+            fallback = np.zeros((degenerate.sum(), 3))
+            fallback[np.arange(len(fallback)), np.abs(aim[degenerate]).argmin(axis=-1)] = 1.0
+            fallback -= np.einsum("ij,ij->i", fallback, aim[degenerate])[:, None] * aim[degenerate]
+            up[degenerate] = fallback
+        up = cls.normalize(up)
+
+        aim_axis, up_axis, third_axis = (cls.AXES.index(axis) for axis in orient_order)
+        if (up_axis - aim_axis) % 3 == 1:
+            third = np.cross(aim, up)
+        else:
+            third = np.cross(up, aim)
+
+        frames = np.empty((len(indices), 3, 3))
+        frames[:, aim_axis] = aim
+        frames[:, up_axis] = up
+        frames[:, third_axis] = third
+        return frames
+
+    @classmethod
+    def chain_normals(cls, positions, parent_indices, first_child):
+        """Return the normal of the plane formed by parent, joint and first child.
+
+        Joints without a usable plane (roots, straight chains) borrow the
+        normal of their first child, so chain roots follow the chain below.
+        Normals are flipped to agree with their parent's normal so that a
+        chain bending back and forth keeps its secondary axis on one side.
+        """
+        parent_indices = np.asarray(parent_indices)
+        has_plane = (parent_indices >= 0) & (first_child >= 0)
+        bone_in = positions - positions[np.where(parent_indices >= 0, parent_indices, np.arange(len(positions)))]
+        bone_out = positions[np.where(first_child >= 0, first_child, np.arange(len(positions)))] - positions
+
+        normals = cls.normalize(np.cross(bone_in, bone_out))
+        normals[~has_plane] = 0.0
+
+        missing = (np.linalg.norm(normals, axis=-1) < cls.EPSILON) & (first_child >= 0)
+        normals[missing] = normals[first_child[missing]]
+
+        depth = cls.depths(parent_indices)
+        for level in range(1, depth.max(initial=0) + 1):
+            indices = np.flatnonzero(depth == level)
+            parents = parent_indices[indices]
+            flip = np.einsum("ij,ij->i", normals[indices], normals[parents]) < 0
+            normals[indices[flip]] *= -1.0
+        return normals
+
+    @classmethod
+    def orient_frames(cls, positions, parent_indices, rotations, parent_rotations, targets,
+                      orient_order, secondary_axis, auto_orient=False):
+        """Compute new world rotations for the targeted joints.
+
+        Targeted joints with children aim at their first child. Targeted leaf
+        joints, and every targeted joint when orient_order is 'none', take the
+        frame of their parent so that their jointOrient ends up zeroed.
+        Joints that are not targeted keep their current world rotation.
+
+        Args:
+            positions (numpy.ndarray): (N, 3) world positions.
+            parent_indices (numpy.ndarray): (N,) parent indices.
+            rotations (numpy.ndarray): (N, 3, 3) current world rotations.
+            parent_rotations (numpy.ndarray): (N, 3, 3) world rotations of each
+                joint's DAG parent, used when the parent is not in the set.
+            targets (numpy.ndarray): (N,) boolean mask of joints to orient.
+            orient_order (str): 'xyz', 'yzx', ... or 'none'.
+            secondary_axis (str): World up direction, e.g. 'yup'.
+            auto_orient (bool): See aim_frames.
+
+        Returns:
+            numpy.ndarray: (N, 3, 3) new world rotations.
+        """
+        groups = np.where(np.asarray(targets, dtype=bool), 0, -1)
+        return cls.orient_frames_grouped(positions, parent_indices, rotations, parent_rotations, groups,
+                                         [(orient_order, secondary_axis, auto_orient)])
+
+    @classmethod
+    def orient_frames_grouped(cls, positions, parent_indices, rotations, parent_rotations, groups, settings):
+        """Compute new world rotations for joints oriented with different settings.
+
+        Same as orient_frames, but each joint belongs to a group with its own
+        settings. Aim frames are solved per group and leaf/'none' joints
+        inherit their parent's new frame in one pass, so a parent and child
+        in different groups stay consistent.
+
+        Args:
+            positions (numpy.ndarray): (N, 3) world positions.
+            parent_indices (numpy.ndarray): (N,) parent indices.
+            rotations (numpy.ndarray): (N, 3, 3) current world rotations.
+            parent_rotations (numpy.ndarray): (N, 3, 3) world rotations of DAG parents.
+            groups (numpy.ndarray): (N,) index into settings, -1 for joints
+                that are not oriented.
+            settings (Sequence[tuple[str, str, bool]]): (orient_order,
+                secondary_axis, auto_orient) for each group.
+
+        Returns:
+            numpy.ndarray: (N, 3, 3) new world rotations.
+        """
+        parent_indices = np.asarray(parent_indices)
+        groups = np.asarray(groups)
+        frames = np.array(rotations, dtype=float, copy=True)
+        has_child = cls.first_children(parent_indices) >= 0
+
+        inherit = np.zeros(len(groups), dtype=bool)
+        for group, (orient_order, secondary_axis, auto_orient) in enumerate(settings):
+            members = groups == group
+            if orient_order == "none":
+                inherit |= members
+                continue
+
+            aimed = np.flatnonzero(members & has_child)
+            if len(aimed):
+                frames[aimed] = cls.aim_frames(positions, parent_indices, aimed,
+                                               orient_order, secondary_axis, auto_orient)
+            inherit |= members & ~has_child
+
+        return cls.inherit_parent_frames(frames, parent_indices, parent_rotations, inherit)
+
+    @classmethod
+    def inherit_parent_frames(cls, frames, parent_indices, parent_rotations, mask):
+        """Copy parent frames onto the masked joints, one depth level at a time."""
+        parent_indices = np.asarray(parent_indices)
+        if not mask.any():
+            return frames
+
+        depth = cls.depths(parent_indices)
+        for level in np.unique(depth[mask]):
+            indices = np.flatnonzero(mask & (depth == level))
+            parents = parent_indices[indices]
+            inside = parents >= 0
+            frames[indices[inside]] = frames[parents[inside]]
+            frames[indices[~inside]] = parent_rotations[indices[~inside]]
+        return frames
+
+    @classmethod
+    def unflip_frames(cls, frames, parent_indices, mask, aim_axis, up_axis):
+        """Turn masked joints 180 degrees about their aim axis where their up axis opposes their parent's.
+
+        Joints are processed one depth level at a time against their parent's
+        corrected frame, so a whole flipped sub-chain is fixed in one call.
+
+        Args:
+            frames (numpy.ndarray): (N, 3, 3) world rotations, edited in place.
+            parent_indices (numpy.ndarray): (N,) parent indices.
+            mask (numpy.ndarray): (N,) boolean mask of joints that may be turned.
+            aim_axis (int): Row of the aim axis (0, 1 or 2).
+            up_axis (int): Row of the up axis.
+
+        Returns:
+            numpy.ndarray: (N,) boolean mask of the joints that were turned.
+        """
+        parent_indices = np.asarray(parent_indices)
+        third_axis = 3 - aim_axis - up_axis
+        turned = np.zeros(len(parent_indices), dtype=bool)
+        candidates = mask & (parent_indices >= 0)
+        if not candidates.any():
+            return turned
+
+        depth = cls.depths(parent_indices)
+        for level in np.unique(depth[candidates]):
+            indices = np.flatnonzero(candidates & (depth == level))
+            ups = frames[indices, up_axis]
+            flipped = indices[np.einsum("ij,ij->i", ups, frames[parent_indices[indices], up_axis]) < 0]
+            frames[flipped, up_axis] *= -1.0
+            frames[flipped, third_axis] *= -1.0
+            turned[flipped] = True
+        return turned
+
+    @classmethod
+    def mirror_frames(cls, frames, axis="x", behavior=True):
+        """Mirror world rotations across the plane normal to a world axis.
+
+        Args:
+            frames (numpy.ndarray): (N, 3, 3) world rotations.
+            axis (str): Normal of the mirror plane, 'x' for the YZ plane.
+            behavior (bool): Mirror like mirrorJoint's Behavior mode, where
+                every axis is reflected and negated so mirrored poses move
+                symmetrically; otherwise keep the world orientation as is,
+                like its Orientation mode.
+
+        Returns:
+            numpy.ndarray: (N, 3, 3) right-handed mirrored rotations.
+        """
+        frames = np.array(frames, dtype=np.float64)
+        if not behavior:
+            return frames
+        # Reflecting every axis row flips the handedness; negating them all flips it back.
+        frames[:, :, cls.AXES.index(axis)] *= -1.0
+        return -frames
+
+    @staticmethod
+    def parent_frames(frames, parent_indices, parent_rotations):
+        """Return the world rotation of each joint's parent after an edit."""
+        parent_indices = np.asarray(parent_indices)
+        return np.where((parent_indices >= 0)[:, None, None], frames[parent_indices], parent_rotations)
+
+    @classmethod
+    def joint_orients(cls, frames, parent_frames):
+        """Return jointOrient angles that produce frames under parent_frames.
+
+        Assumes rotate and rotateAxis are zero, i.e. world = jointOrient * parent.
+        """
+        return cls.matrix_to_euler(frames @ np.transpose(parent_frames, (0, 2, 1)))
+
+    @staticmethod
+    def local_translations(positions, parent_indices, parent_frames, parent_scales):
+        """Return translate values that keep joints at their world positions.
+
+        Args:
+            positions (numpy.ndarray): (N, 3) world positions.
+            parent_indices (numpy.ndarray): (N,) parent indices; rows with -1
+                are returned as NaN since their parent space is unknown here.
+            parent_frames (numpy.ndarray): (N, 3, 3) new parent world rotations.
+            parent_scales (numpy.ndarray): (N, 3) parent scale along its axes.
+        """
+        parent_indices = np.asarray(parent_indices)
+        inside = parent_indices >= 0
+        offsets = positions - positions[np.where(inside, parent_indices, 0)]
+        translations = np.einsum("nj,nij->ni", offsets, parent_frames) / parent_scales
+        translations[~inside] = np.nan
+        return translations
@@ -0,0 +1,173 @@
+"""Opt-in timing of tool actions and the Maya commands they issue.
+
+Helper entry points and widget slots are decorated with @profiled. While the
+Profiler is disabled the decorator only adds one attribute check per call.
+Once enabled, every maya.cmds function is wrapped with a call counter, and each
+profiled call records its wall time, the Maya commands it ran and the number of
+nodes written through AttributeWriter. Nested profiled calls (e.g. a widget
+slot calling JointHelper) are kept as children of the outer record.
+
+Example:
+    Profiler.set_enabled(True)
+    JointHelper.orient_joints(joints, "xyz", "yup")
+    Profiler.export("C:/temp/timings.json")
+"""
+
+import collections
+import functools
+import json
+import time
+
+import maya.cmds as cmds
+
+
+class Profiler:
+    """Collects timing records for profiled actions; all state is class-level."""
+
+    MAX_RECORDS = 200
+
+    enabled = False
+    records = collections.deque(maxlen=MAX_RECORDS)
+    listeners = []
+
+    _stack = []
+    _command_counts = collections.Counter()
+    _node_count = 0
+    _original_commands = {}
+
+    @classmethod
+    def set_enabled(cls, enabled):
+        """Start or stop recording, (un)wrapping maya.cmds to count commands.
+
+        Args:
+            enabled (bool): True to record profiled actions.
+        """
+        if enabled == cls.enabled:
+            return
+        cls.enabled = enabled
+        if enabled:
+            cls._wrap_commands()
+        else:
+            cls._unwrap_commands()
+            cls._stack.clear()
+
+    @classmethod
+    def clear(cls):
+        """Drop every recorded action."""
+        cls.records.clear()
+
+    @classmethod
+    def add_nodes(cls, count):
+        """Add written nodes to the actions being recorded.
+
+        Args:
+            count (int): Number of nodes written.
+        """
+        if cls.enabled:
+            cls._node_count += count
+
+    @classmethod
+    def export(cls, path):
+        """Write the recorded actions to a JSON file.
+
+        Args:
+            path (str): Destination file path.
+
+        Returns:
+            int: The number of top-level records written.
+        """
+        records = list(cls.records)
+        with open(path, "w") as handle:
+            json.dump(records, handle, indent=2)
+        return len(records)
+
+    @classmethod
+    def begin(cls, name):
+        """Open a record; prefer the profiled decorator over calling this directly."""
+        record = {
+            "name": name,
+            "start": time.time(),
+            "seconds": 0.0,
+            "commands": {},
+            "command_count": 0,
+            "nodes": 0,
+            "children": [],
+            "_clock": time.perf_counter(),
+            "_commands": collections.Counter(cls._command_counts),
+            "_nodes": cls._node_count,
+        }
+        cls._stack.append(record)
+        return record
+
+    @classmethod
+    def end(cls, record):
+        """Close a record opened by begin and publish it."""
+        record["seconds"] = time.perf_counter() - record.pop("_clock")
+        commands = cls._command_counts - record.pop("_commands")
+        record["commands"] = dict(commands.most_common())
+        record["command_count"] = sum(commands.values())
+        record["nodes"] = cls._node_count - record.pop("_nodes")
+
+        if cls._stack and cls._stack[-1] is record:
+            cls._stack.pop()
+        if cls._stack:
+            cls._stack[-1]["children"].append(record)
+            return
+
+        cls.records.append(record)
+        for listener in list(cls.listeners):
+            listener(record)
+
+    @classmethod
+    def _wrap_commands(cls):
+        for name in dir(cmds):
+            command = getattr(cmds, name)
+            if name.startswith("_") or not callable(command):
+                continue
+            cls._original_commands[name] = command
+            setattr(cmds, name, cls._counting(name, command))
+
+    @classmethod
+    def _unwrap_commands(cls):
+        for name, command in cls._original_commands.items():
+            setattr(cmds, name, command)
+        cls._original_commands.clear()
+
+    @classmethod
+    def _counting(cls, name, command):
+        counts = cls._command_counts
+
+        @functools.wraps(command)
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return command(*args, **kwargs)
+
+        return wrapper
+
+
+def profiled(name=None):
+    """Decorator recording a function call with the Profiler when it is enabled.
+
+    Place it below @classmethod/@staticmethod.
+
+    Args:
+        name (str | None): Record name; defaults to the function's qualified name.
+    """
+
+    def decorator(function):
+        record_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not Profiler.enabled:
+                return function(*args, **kwargs)
+
+            record = Profiler.begin(record_name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                Profiler.end(record)
+
+        return wrapper
+
+    return decorator
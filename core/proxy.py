@@ -0,0 +1,196 @@
+"""Skin proxies: one combined mesh of bone-aligned boxes, rigidly skinned to joints.
+
+ProxyHelper.proxy_mesh_data turns a JointArrays snapshot into a single
+MeshData in one vectorized pass: every joint gets a box reaching to its first
+child (leaf joints continue their parent's bone), and all boxes are made by
+one batched transform of a unit cube. Each joint's faces form one polygroup,
+so the boxes show up in distinct colors.
+
+ProxyHelper.create_proxy builds that mesh with MeshHelper.create_mesh and
+binds it with a single skinCluster whose weights are written sparsely, one
+weightList entry per vertex, so each box follows only its own joint. Mesh,
+binding and weights are one undo step. One mesh keeps the viewport fast where
+hundreds of separate proxies would not. It requires running inside Autodesk
+Maya.
+"""
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma2
+
+from core.attribute import AttributeWriter
+from core.constants import PROXY_WIDTH_RATIO
+from core.joint import JointHelper
+from core.mesh import MeshHelper
+from core.meshdata import MeshData
+from core.profiling import profiled
+
+
+class ProxyHelper:
+    """Helper methods for building rigidly skinned proxy meshes for joints."""
+
+    WIDTH_RATIO = PROXY_WIDTH_RATIO
+    # Length of a leaf joint's box relative to its parent's bone.
+    LEAF_LENGTH_RATIO = 0.5
+
+    # Unit box from the joint (x = 0) to the child (x = 1), centered on the bone.
+    CUBE_POINTS = np.array([[0, -0.5, -0.5], [1, -0.5, -0.5], [1, 0.5, -0.5], [0, 0.5, -0.5],
+                            [0, -0.5, 0.5], [1, -0.5, 0.5], [1, 0.5, 0.5], [0, 0.5, 0.5]], dtype=np.float64)
+    # Quads of the unit box, wound counter-clockwise seen from outside.
+    CUBE_FACES = np.array([[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4],
+                           [2, 3, 7, 6], [0, 4, 7, 3], [1, 2, 6, 5]], dtype=np.int32)
+
+    @classmethod
+    def bone_frames(cls, arrays):
+        """Return the start, axis and length of every joint's bone.
+
+        A bone runs from a joint to its first child in the set. Leaf joints
+        continue their parent's bone direction at LEAF_LENGTH_RATIO of its
+        length; joints without parent or child use their own X axis and the
+        median bone length.
+
+        Args:
+            arrays (JointArrays): The joints.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: (N, 3) bone
+            starts, (N, 3, 3) orthonormal frames with the bone along the first
+            row, and (N,) bone lengths.
+        """
+        count = len(arrays)
+        positions = arrays.positions
+        rotations = arrays.rotations
+        parents = arrays.parent_indices
+
+        # Reversed so the first child of every parent is the one written last.
+        children = np.flatnonzero(parents >= 0)[::-1]
+        first_child = np.full(count, -1, dtype=np.int64)
+        first_child[parents[children]] = children
+
+        bones = positions[first_child] - positions
+        lengths = np.linalg.norm(bones, axis=1)
+        has_bone = (first_child >= 0) & (lengths > 1e-6)
+        directions = rotations[:, 0].copy()
+        directions[has_bone] = bones[has_bone] / lengths[has_bone, None]
+        default_length = float(np.median(lengths[has_bone])) if has_bone.any() else 1.0
+
+        # Leaves: parents come first, so their bones are already final.
+        leaves = np.flatnonzero(~has_bone)
+        lengths[leaves] = default_length
+        continued = leaves[(parents[leaves] >= 0)]
+        continued = continued[has_bone[parents[continued]]]
+        directions[continued] = directions[parents[continued]]
+        lengths[continued] = lengths[parents[continued]] * cls.LEAF_LENGTH_RATIO
+
+        # Side axis: the joint axis least aligned with the bone, made perpendicular to it.
+        side_choice = np.abs(np.einsum("nj,nj->n", rotations[:, 1], directions)) < 0.9
+        sides = np.where(side_choice[:, None], rotations[:, 1], rotations[:, 2])
+        sides -= np.einsum("nj,nj->n", sides, directions)[:, None] * directions
+        sides /= np.linalg.norm(sides, axis=1)[:, None]
+        frames = np.stack([directions, sides, np.cross(directions, sides)], axis=1)
+        return positions, frames, lengths
+
+    @classmethod
+    def proxy_mesh_data(cls, arrays, width_ratio=None, name="skinProxy"):
+        """Build one mesh holding a bone-aligned box per joint.
+
+        Args:
+            arrays (JointArrays): The joints.
+            width_ratio (float | None): Box width relative to the bone length;
+                defaults to WIDTH_RATIO.
+            name (str): Mesh name.
+
+        Returns:
+            MeshData: The combined mesh in world space; box i (vertices
+            8i..8i+7, faces 6i..6i+5, polygroup i) belongs to joint i.
+        """
+        width_ratio = cls.WIDTH_RATIO if width_ratio is None else width_ratio
+        starts, frames, lengths = cls.bone_frames(arrays)
+
+        scales = np.stack([lengths, lengths * width_ratio, lengths * width_ratio], axis=1)
+        axes = frames * scales[:, :, None]
+        points = starts[:, None, :] + np.einsum("vk,nkj->nvj", cls.CUBE_POINTS, axes)
+
+        count = len(arrays)
+        cube_count = len(cls.CUBE_POINTS)
+        face_indices = cls.CUBE_FACES[None] + (np.arange(count, dtype=np.int32) * cube_count)[:, None, None]
+        return MeshData(name, points.reshape(-1, 3), np.full(count * len(cls.CUBE_FACES), 4),
+                        face_indices.reshape(-1), np.repeat(np.arange(count), len(cls.CUBE_FACES)))
+
+    @classmethod
+    @profiled()
+    def create_proxy(cls, joints, width_ratio=None, name="skinProxy", polygroup_colors=True):
+        """Create one rigidly skinned proxy mesh for joints.
+
+        Args:
+            joints (list[str]): Joints to build boxes for.
+            width_ratio (float | None): See proxy_mesh_data.
+            name (str): Name of the mesh transform.
+            polygroup_colors (bool): Color every joint's box differently.
+
+        Returns:
+            str | None: Full path of the proxy transform, or None if no joints
+            were given.
+        """
+        arrays = JointHelper.read_joint_arrays(joints)
+        if not len(arrays):
+            om.MGlobal.displayWarning("No joints to build a skin proxy for")
+            return None
+
+        mesh_data = cls.proxy_mesh_data(arrays, width_ratio, name)
+        cmds.undoInfo(openChunk=True, chunkName="maksCreateSkinProxy")
+        try:
+            # Joint positions are read in internal units.
+            transform = MeshHelper.create_mesh(mesh_data, polygroup_colors,
+                                               meters_per_unit=MeshHelper.INTERNAL_METERS_PER_UNIT)
+            skin_cluster = cmds.skinCluster(arrays.names, transform, toSelectedBones=True, bindMethod=0,
+                                            maximumInfluences=1, obeyMaxInfluences=True,
+                                            name=f"{name}_skinCluster")[0]
+            cls.set_rigid_weights(skin_cluster, arrays.names, len(cls.CUBE_POINTS))
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        om.MGlobal.displayInfo(f"Created skin proxy {transform} for {len(arrays)} joint(s)")
+        return transform
+
+    @classmethod
+    def set_rigid_weights(cls, skin_cluster, joints, vertices_per_joint):
+        """Weight consecutive vertex blocks fully to one joint each.
+
+        Every vertex gets a single weightList[v].weights[j] value of 1 and its
+        other weights are removed, so the work grows with the vertex count
+        only, not with vertices x influences. The writes are one undo step.
+
+        Args:
+            skin_cluster (str): The skinCluster deforming the proxy mesh.
+            joints (list[str]): Full joint paths; block i follows joints[i].
+            vertices_per_joint (int): Vertices in each block.
+        """
+        selection = om2.MSelectionList()
+        selection.add(skin_cluster)
+        skin_node = selection.getDependNode(0)
+        fn_skin = oma2.MFnSkinCluster(skin_node)
+
+        # weights[] is indexed by the influence's logical index in the matrix array.
+        influences = {path.fullPathName(): fn_skin.indexForInfluenceObject(path)
+                      for path in fn_skin.influenceObjects()}
+        columns = np.repeat([influences[joint] for joint in joints], vertices_per_joint)
+
+        fn_node = om2.MFnDependencyNode(skin_node)
+        weight_list = fn_node.findPlug("weightList", False)
+        weights_attribute = fn_node.attribute("weights")
+        modifier = om2.MDGModifier()
+        for vertex, column in enumerate(columns.tolist()):
+            weights = weight_list.elementByLogicalIndex(vertex).child(weights_attribute)
+            for index in weights.getExistingArrayAttributeIndices():
+                if index != column:
+                    modifier.removeMultiInstance(weights.elementByLogicalIndex(index), True)
+            modifier.newPlugValueDouble(weights.elementByLogicalIndex(column), 1.0)
+
+        modifier.doIt()
+        writer = AttributeWriter()
+        writer.add_applied(modifier, len(columns))
+        writer.commit()
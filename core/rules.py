@@ -0,0 +1,185 @@
+"""Rule files that orient a whole rig in one batched pass.
+
+A rules file is JSON with a list of rules. Each rule selects joints either by
+a name pattern (fnmatch-style, matched against the short joint name) or by a
+chain root (the root and every joint below it), and gives the orientation
+settings used for them::
+
+    {
+        "version": 1,
+        "rules": [
+            {"pattern": "*_spine_*", "orient_order": "xyz", "secondary_axis": "zup"},
+            {"root": "L_clavicle_jnt", "orient_order": "xyz", "secondary_axis": "yup",
+             "auto_orient": true},
+            {"pattern": "*_end_jnt", "orient_order": "none"}
+        ]
+    }
+
+Later rules override earlier ones for the joints they share. All matched
+joints are oriented with one JointHelper.orient_joint_groups call in one undo
+chunk. From a headless session::
+
+    mayapy -m core.rules rig_rules.json rig.ma --save rig_oriented.ma
+"""
+
+import argparse
+import fnmatch
+import json
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+
+from core.constants import ORIENT_ORDERS
+from core.joint import JointHelper
+from core.scene import SceneIndex
+
+
+class OrientRules:
+    """An ordered list of orientation rules loaded from or saved to JSON.
+
+    Attributes:
+        rules (list[dict]): Validated rules with every setting filled in.
+    """
+
+    VERSION = 1
+    ORIENT_ORDERS = ORIENT_ORDERS + ("none",)
+    SECONDARY_AXES = tuple(axis + direction for axis in ("x", "y", "z", "none") for direction in ("up", "down"))
+    DEFAULTS = {"secondary_axis": "yup", "auto_orient": False}
+
+    def __init__(self, rules=()):
+        self.rules = [self.validate_rule(rule) for rule in rules]
+
+    @classmethod
+    def load(cls, path):
+        """Read a rules file.
+
+        Args:
+            path (str): JSON file path.
+
+        Returns:
+            OrientRules: The loaded rules.
+
+        Raises:
+            ValueError: If the file content is not a valid rules file.
+        """
+        with open(path, "r") as handle:
+            data = json.load(handle)
+        if not isinstance(data, dict) or not isinstance(data.get("rules"), list):
+            raise ValueError(f"{path} is not a rules file: expected an object with a 'rules' list")
+        return cls(data["rules"])
+
+    def save(self, path):
+        """Write the rules to a JSON file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        with open(path, "w") as handle:
+            json.dump({"version": self.VERSION, "rules": self.rules}, handle, indent=4)
+
+    @classmethod
+    def validate_rule(cls, rule):
+        """Return a copy of rule with defaults filled in.
+
+        Raises:
+            ValueError: If the rule has no selector or invalid settings.
+        """
+        if not isinstance(rule, dict):
+            raise ValueError(f"Rule must be an object: {rule!r}")
+        if ("pattern" in rule) == ("root" in rule):
+            raise ValueError(f"Rule needs exactly one of 'pattern' or 'root': {rule!r}")
+
+        rule = dict(cls.DEFAULTS, **rule)
+        if rule.get("orient_order") not in cls.ORIENT_ORDERS:
+            raise ValueError(f"Invalid orient_order {rule.get('orient_order')!r}, "
+                             f"expected one of {', '.join(cls.ORIENT_ORDERS)}")
+        if rule["secondary_axis"] not in cls.SECONDARY_AXES:
+            raise ValueError(f"Invalid secondary_axis {rule['secondary_axis']!r}, "
+                             f"expected one of {', '.join(cls.SECONDARY_AXES)}")
+        rule["auto_orient"] = bool(rule["auto_orient"])
+        return rule
+
+    def add_rule(self, orient_order, secondary_axis="yup", auto_orient=False, pattern=None, root=None):
+        """Append a rule selecting joints by pattern or by chain root.
+
+        Returns:
+            dict: The validated rule.
+        """
+        rule = {"orient_order": orient_order, "secondary_axis": secondary_axis, "auto_orient": auto_orient}
+        if pattern is not None:
+            rule["pattern"] = pattern
+        if root is not None:
+            rule["root"] = root
+        rule = self.validate_rule(rule)
+        self.rules.append(rule)
+        return rule
+
+    def resolve(self, joints=None):
+        """Match the rules against joints.
+
+        Args:
+            joints (list[str] | None): Full paths of the joints rules may
+                affect; defaults to every joint in the scene.
+
+        Returns:
+            list[tuple[list[str], str, str, bool]]: One group per rule that
+            matched anything, in rule order, as expected by
+            JointHelper.orient_joint_groups.
+        """
+        if joints is None:
+            joints = SceneIndex.instance().joints()
+        short_names = [name.rpartition("|")[2] for name in joints]
+
+        groups = []
+        for rule in self.rules:
+            if "pattern" in rule:
+                matched = [name for name, short_name in zip(joints, short_names)
+                           if fnmatch.fnmatchcase(short_name, rule["pattern"])]
+            else:
+                roots = tuple(cmds.ls(rule["root"], long=True, type="joint") or [])
+                below = tuple(root + "|" for root in roots)
+                matched = [name for name in joints if name in roots or name.startswith(below)] if roots else []
+
+            if matched:
+                groups.append((matched, rule["orient_order"], rule["secondary_axis"], rule["auto_orient"]))
+        return groups
+
+    def apply(self, joints=None):
+        """Orient every joint matched by the rules in one batched, undoable pass.
+
+        Args:
+            joints (list[str] | None): See resolve.
+
+        Returns:
+            int: The number of joints written.
+        """
+        groups = self.resolve(joints)
+        if not groups:
+            return 0
+
+        return JointHelper.orient_joint_groups(groups)
+
+
+def main(argv=None):
+    """Apply a rules file to a scene file in a mayapy session."""
+    parser = argparse.ArgumentParser(description="Orient a rig from a MAKS Tools rules file.")
+    parser.add_argument("rules", help="Rules JSON file.")
+    parser.add_argument("scene", help="Maya scene to open.")
+    parser.add_argument("--save", help="Save the result to this file instead of overwriting the scene.")
+    args = parser.parse_args(argv)
+
+    import maya.standalone
+    maya.standalone.initialize()
+    try:
+        cmds.file(args.scene, open=True, force=True)
+        written = OrientRules.load(args.rules).apply()
+        om.MGlobal.displayInfo(f"Oriented {written} joints")
+        if args.save:
+            cmds.file(rename=args.save)
+        cmds.file(save=True, force=True)
+    finally:
+        maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Persistent index of joints and shapes kept in sync with the Maya scene.
+
+Tools often need every joint in the scene or the shapes under a set of
+transforms. Instead of scanning the scene with cmds.ls/cmds.listRelatives on
+every click, SceneIndex builds the answer once and keeps it current with DG/DAG
+message callbacks (node added/removed, parent changed, renamed, scene opened).
+It requires running inside Autodesk Maya.
+"""
+
+import numpy as np
+
+import maya.api.OpenMaya as om2
+
+
+class HandleMap:
+    """Dictionary keyed by MObjectHandle.
+
+    hashCode() only picks a bucket: different nodes can share a hash code,
+    so keys are matched with == inside the bucket.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def get(self, handle, default=None):
+        """Return the value stored for handle, or default."""
+        for key, value in self._buckets.get(handle.hashCode(), ()):
+            if key == handle:
+                return value
+        return default
+
+    def set(self, handle, value):
+        """Store value for handle, replacing any previous value."""
+        bucket = self._buckets.setdefault(handle.hashCode(), [])
+        for index, (key, _) in enumerate(bucket):
+            if key == handle:
+                bucket[index] = (handle, value)
+                return
+        bucket.append((handle, value))
+        self._count += 1
+
+    def pop(self, handle, default=None):
+        """Remove handle and return its value, or default if it is not stored."""
+        code = handle.hashCode()
+        bucket = self._buckets.get(code, [])
+        for index, (key, value) in enumerate(bucket):
+            if key == handle:
+                del bucket[index]
+                if not bucket:
+                    del self._buckets[code]
+                self._count -= 1
+                return value
+        return default
+
+    def values(self):
+        """Return every stored value."""
+        return [value for bucket in self._buckets.values() for _, value in bucket]
+
+    def clear(self):
+        """Remove every entry."""
+        self._buckets.clear()
+        self._count = 0
+
+
+class SceneIndex:
+    """Callback-maintained cache of scene joints and transform→shape children.
+
+    Use SceneIndex.instance() to get the shared index. Queries that can be
+    answered from the cache count as hits, queries that need to read the scene
+    count as misses.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the shared index, creating it and its callbacks on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.install_callbacks()
+        return cls._instance
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._joints = None              # HandleMap {joint: joint handle}, None until built
+        self._hierarchy = None           # (names, parent_indices), None when stale
+        self._shapes = HandleMap()       # {transform: [shape MObjectHandle, ...]}
+        self._shape_parents = HandleMap()  # {shape: transform MObjectHandle}
+        self._callback_ids = []
+        self.scene_listeners = []
+
+    # ------------------------------------------------------------------ API
+    def joints(self):
+        """Return full paths of every joint in the scene, parents first.
+
+        Returns:
+            list[str]: Joint DAG paths.
+        """
+        return list(self.joint_hierarchy()[0])
+
+    def joint_hierarchy(self):
+        """Return every joint with its parent index.
+
+        Returns:
+            tuple[list[str], numpy.ndarray]: Full paths ordered parents first,
+            and for each the index of its parent joint (-1 if none).
+        """
+        if self._hierarchy is not None and self._joints is not None:
+            self.hits += 1
+            return self._hierarchy
+
+        self.misses += 1
+        if self._joints is None:
+            self._joints = self._scan_joints()
+
+        names = []
+        for handle in self._joints.values():
+            if not handle.isValid():
+                continue
+            names.append(om2.MFnDagNode(handle.object()).fullPathName())
+        names.sort(key=lambda name: name.count("|"))
+
+        index_map = {name: index for index, name in enumerate(names)}
+        parent_indices = np.array([index_map.get(name.rpartition("|")[0], -1) for name in names],
+                                  dtype=np.int64)
+        self._hierarchy = (names, parent_indices)
+        return self._hierarchy
+
+    def shapes(self, nodes):
+        """Return the shape children of the given transforms.
+
+        Args:
+            nodes (Iterable[str | om2.MObject | om2.MObjectHandle]): Transform
+                names, DAG paths or objects. Handles, e.g. from a
+                SelectionSnapshot, are looked up without resolving any name.
+
+        Returns:
+            list[str]: Full paths of the shapes directly under the transforms.
+        """
+        shapes = []
+        for handle in self._handles(nodes):
+            if not handle.isValid() or not handle.object().hasFn(om2.MFn.kTransform):
+                continue
+
+            handles = self._shapes.get(handle)
+            if handles is None:
+                self.misses += 1
+                handles = self._scan_shapes(handle.object())
+                self._shapes.set(handle, handles)
+                for shape in handles:
+                    self._shape_parents.set(shape, handle)
+            else:
+                self.hits += 1
+
+            shapes.extend(om2.MFnDagNode(shape.object()).fullPathName()
+                          for shape in handles if shape.isValid())
+        return shapes
+
+    def invalidate(self):
+        """Drop every cached answer; the next queries rebuild what they need."""
+        self._joints = None
+        self._hierarchy = None
+        self._shapes.clear()
+        self._shape_parents.clear()
+
+    def rebuild(self):
+        """Invalidate and immediately rebuild the joint index."""
+        self.invalidate()
+        self.joint_hierarchy()
+
+    def add_scene_listener(self, listener):
+        """Call listener() after a scene is opened or a new one created, e.g. to drop other caches."""
+        if listener not in self.scene_listeners:
+            self.scene_listeners.append(listener)
+
+    def remove_scene_listener(self, listener):
+        """Stop calling a listener added with add_scene_listener."""
+        if listener in self.scene_listeners:
+            self.scene_listeners.remove(listener)
+
+    def stats(self):
+        """Return hit/miss counters and cache sizes.
+
+        Returns:
+            dict: hits, misses, joints and transforms counts.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "joints": len(self._joints or ()),
+            "transforms": len(self._shapes),
+        }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------ callbacks
+    def install_callbacks(self):
+        """Register the DG/DAG/scene callbacks that keep the index fresh."""
+        if self._callback_ids:
+            return
+
+        self._callback_ids = [
+            om2.MDGMessage.addNodeAddedCallback(self._on_joint_added, "joint"),
+            om2.MDGMessage.addNodeRemovedCallback(self._on_joint_removed, "joint"),
+            om2.MDGMessage.addNodeRemovedCallback(self._on_shape_removed, "shape"),
+            om2.MDGMessage.addNodeRemovedCallback(self._on_transform_removed, "transform"),
+            om2.MDagMessage.addParentAddedCallback(self._on_parent_changed),
+            om2.MDagMessage.addParentRemovedCallback(self._on_parent_changed),
+            om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj, self._on_name_changed),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, self._on_scene_changed),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, self._on_scene_changed),
+        ]
+
+    def remove_callbacks(self):
+        """Remove every callback registered by install_callbacks."""
+        if self._callback_ids:
+            om2.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
+
+    def _on_joint_added(self, node, client_data=None):
+        if self._joints is not None:
+            handle = om2.MObjectHandle(node)
+            self._joints.set(handle, handle)
+        self._hierarchy = None
+
+    def _on_joint_removed(self, node, client_data=None):
+        if self._joints is not None:
+            self._joints.pop(om2.MObjectHandle(node))
+        self._hierarchy = None
+
+    def _on_shape_removed(self, node, client_data=None):
+        parent = self._shape_parents.pop(om2.MObjectHandle(node))
+        if parent is not None:
+            self._shapes.pop(parent)
+
+    def _on_transform_removed(self, node, client_data=None):
+        self._shapes.pop(om2.MObjectHandle(node))
+
+    def _on_parent_changed(self, child, parent, client_data=None):
+        child_node = child.node()
+        if child_node.hasFn(om2.MFn.kShape):
+            self._shapes.pop(om2.MObjectHandle(parent.node()))
+            self._shape_parents.pop(om2.MObjectHandle(child_node))
+        elif child_node.hasFn(om2.MFn.kTransform):
+            # Reparenting any transform can change the paths of joints below it.
+            self._hierarchy = None
+
+    def _on_name_changed(self, node, previous_name, client_data=None):
+        if node.hasFn(om2.MFn.kTransform):
+            self._hierarchy = None
+
+    def _on_scene_changed(self, client_data=None):
+        self.invalidate()
+        for listener in list(self.scene_listeners):
+            listener()
+
+    # ---------------------------------------------------------------- scans
+    @staticmethod
+    def _handles(nodes):
+        selection = om2.MSelectionList()
+        for node in nodes:
+            if isinstance(node, om2.MObjectHandle):
+                yield node
+            elif isinstance(node, om2.MObject):
+                yield om2.MObjectHandle(node)
+            else:
+                selection.clear()
+                try:
+                    selection.add(node)
+                except RuntimeError:
+                    continue
+                yield om2.MObjectHandle(selection.getDependNode(0))
+
+    @staticmethod
+    def _scan_joints():
+        joints = HandleMap()
+        iterator = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kJoint)
+        while not iterator.isDone():
+            handle = om2.MObjectHandle(iterator.currentItem())
+            joints.set(handle, handle)
+            iterator.next()
+        return joints
+
+    @staticmethod
+    def _scan_shapes(transform):
+        dag_fn = om2.MFnDagNode(transform)
+        handles = []
+        for index in range(dag_fn.childCount()):
+            child = dag_fn.child(index)
+            if child.hasFn(om2.MFn.kShape):
+                handles.append(om2.MObjectHandle(child))
+        return handles
@@ -0,0 +1,192 @@
+"""Shared snapshot of the active selection, kept current by a selection callback.
+
+Helpers used to call cmds.ls(selection=True, ...) on their own, often several
+times per click. SelectionService reads the active selection list once per
+selection change, sorts it into joints, transforms and shapes, and hands the
+same immutable SelectionSnapshot to every caller until the selection changes
+again. Listeners (e.g. the docks' selection counts) are told about every
+change, so nothing has to poll. It requires running inside Autodesk Maya.
+"""
+
+import maya.api.OpenMaya as om2
+
+
+class SelectionSnapshot:
+    """Immutable, typed view of the active selection at one moment.
+
+    Nodes are stored as MObjectHandles and DAG paths, so names are resolved
+    when asked for and stay right across renames and reparenting; nodes
+    deleted since the snapshot was taken are skipped.
+
+    Attributes:
+        nodes (tuple[tuple[om2.MObjectHandle, om2.MDagPath], ...]): Selected
+            DAG nodes, in selection order.
+        joints (tuple): The selected joints.
+        transforms (tuple): The selected transforms, joints included (as
+            cmds.ls(type="transform") returns them).
+        shapes (tuple): The selected shapes.
+    """
+
+    __slots__ = ("nodes", "joints", "transforms", "shapes")
+
+    KINDS = ("joints", "transforms", "shapes")
+
+    def __init__(self, nodes):
+        self.nodes = tuple(nodes)
+        self.joints = tuple(node for node in self.nodes if node[0].object().hasFn(om2.MFn.kJoint))
+        self.transforms = tuple(node for node in self.nodes if node[0].object().hasFn(om2.MFn.kTransform))
+        self.shapes = tuple(node for node in self.nodes if node[0].object().hasFn(om2.MFn.kShape))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @classmethod
+    def from_selection_list(cls, selection):
+        """Build a snapshot from an MSelectionList, ignoring non-DAG items.
+
+        Args:
+            selection (om2.MSelectionList): The selection to capture.
+
+        Returns:
+            SelectionSnapshot: The snapshot.
+        """
+        nodes = []
+        for index in range(selection.length()):
+            obj = selection.getDependNode(index)
+            if obj.hasFn(om2.MFn.kDagNode):
+                nodes.append((om2.MObjectHandle(obj), selection.getDagPath(index)))
+        return cls(nodes)
+
+    def names(self, kind="nodes"):
+        """Return the current full paths of one kind of selected node.
+
+        Args:
+            kind (str): 'nodes', 'joints', 'transforms' or 'shapes'.
+
+        Returns:
+            list[str]: Full DAG paths, in selection order.
+        """
+        return [om2.MFnDagNode(handle.object()).fullPathName()
+                for handle, _ in getattr(self, kind) if handle.isValid()]
+
+    def counts(self):
+        """Return how many joints, transforms and shapes are selected.
+
+        Returns:
+            dict[str, int]: Count per kind in KINDS.
+        """
+        return {kind: len(getattr(self, kind)) for kind in self.KINDS}
+
+
+class SelectionService:
+    """Callback-maintained selection snapshot shared by every tool.
+
+    Use SelectionService.instance() to get the shared service. Snapshots
+    served without reading Maya's selection count as hits, rebuilt ones as
+    misses.
+
+    Attributes:
+        listeners (list[Callable[[SelectionSnapshot], None]]): Called with
+            the new snapshot after every selection change.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the shared service, creating it and its callbacks on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.install_callbacks()
+        return cls._instance
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.listeners = []
+
+        self._snapshot = None        # SelectionSnapshot, None when stale
+        self._callback_ids = []
+
+    # ------------------------------------------------------------------ API
+    def snapshot(self):
+        """Return the snapshot of the active selection.
+
+        Returns:
+            SelectionSnapshot: The current selection.
+        """
+        if self._snapshot is not None:
+            self.hits += 1
+            return self._snapshot
+
+        self.misses += 1
+        self._snapshot = SelectionSnapshot.from_selection_list(om2.MGlobal.getActiveSelectionList())
+        return self._snapshot
+
+    def joints(self):
+        """Return full paths of the selected joints."""
+        return self.snapshot().names("joints")
+
+    def transforms(self):
+        """Return full paths of the selected transforms, joints included."""
+        return self.snapshot().names("transforms")
+
+    def shapes(self):
+        """Return full paths of the selected shapes."""
+        return self.snapshot().names("shapes")
+
+    def invalidate(self):
+        """Drop the snapshot; the next query reads the selection again."""
+        self._snapshot = None
+
+    def add_listener(self, listener):
+        """Call listener with the new snapshot after every selection change."""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop calling a listener added with add_listener."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def stats(self):
+        """Return hit/miss counters and the size of the current snapshot.
+
+        Returns:
+            dict: hits, misses and selected node count (None when stale).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "selected": None if self._snapshot is None else len(self._snapshot),
+        }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------ callbacks
+    def install_callbacks(self):
+        """Register the selection and scene callbacks that keep the snapshot fresh."""
+        if self._callback_ids:
+            return
+
+        self._callback_ids = [
+            om2.MModelMessage.addCallback(om2.MModelMessage.kActiveListModified, self._on_selection_changed),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, self._on_selection_changed),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, self._on_selection_changed),
+        ]
+
+    def remove_callbacks(self):
+        """Remove every callback registered by install_callbacks."""
+        if self._callback_ids:
+            om2.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
+
+    def _on_selection_changed(self, client_data=None):
+        self._snapshot = None
+        if self.listeners:
+            snapshot = self.snapshot()
+            for listener in list(self.listeners):
+                listener(snapshot)
@@ -0,0 +1,214 @@
+"""Typed, immutable tool settings, persisted between Maya sessions.
+
+Each tool describes its options once, as a ToolSettings subclass listing the
+fields with their defaults and allowed values. Settings objects are validated
+when built and never change afterwards: replace() returns a changed copy. A
+tool reads its widgets once per change into a new settings object (see
+CustomDialog.refresh_settings), and its actions only read that object, so
+they never poll widgets or see a half-edited state.
+
+Settings are saved as one JSON optionVar per tool, so scripts and batch jobs
+can use the same settings without building any widgets:
+
+Example:
+    settings = OrienterSettings.load()
+    JointHelper.orient_joints(joints, settings.orient_order, settings.secondary_axis,
+                              settings.auto_orient, children=settings.target_hierarchy)
+"""
+
+import json
+
+import maya.cmds as cmds
+
+from core.constants import MIRROR_MATCH_MODES, NORMAL_AXES, ORIENT_ORDERS, PROXY_WIDTH_RATIO
+from core.orient import OrientSolver
+
+
+class ToolSettings:
+    """Base class of immutable, validated tool settings.
+
+    Subclasses list their FIELDS; every field is then a read-only attribute.
+    The type of a field is the type of its default (ints are accepted for
+    floats, lists for tuples of the same length).
+    """
+
+    # (name, default, allowed values or None) per field.
+    FIELDS = ()
+    # Name of the optionVar holding the saved settings.
+    OPTION_VAR = None
+
+    __slots__ = ("_values",)
+
+    def __init__(self, **values):
+        """Build settings from field values; missing fields get their defaults.
+
+        Raises:
+            TypeError: If a field name is unknown.
+            ValueError: If a value has the wrong type or is not allowed.
+        """
+        unknown = set(values).difference(name for name, _, _ in self.FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown {type(self).__name__} field(s): {', '.join(sorted(unknown))}")
+
+        checked = {}
+        for name, default, choices in self.FIELDS:
+            checked[name] = self._check(name, values.get(name, default), default, choices)
+        object.__setattr__(self, "_values", checked)
+        self.validate()
+
+    @staticmethod
+    def _check(name, value, default, choices):
+        kind = type(default)
+        if kind is float and type(value) is int:
+            value = float(value)
+        elif kind is tuple and type(value) in (list, tuple):
+            if len(value) != len(default):
+                raise ValueError(f"{name} must have {len(default)} items, got {value!r}")
+            value = tuple(float(item) if type(item) is int and type(part) is float else item
+                          for item, part in zip(value, default))
+        if type(value) is not kind:
+            raise ValueError(f"{name} must be a {kind.__name__}, got {value!r}")
+        if choices is not None and value not in choices:
+            raise ValueError(f"{name} must be one of {', '.join(map(str, choices))}, got {value!r}")
+        return value
+
+    def validate(self):
+        """Check combinations of fields; raise ValueError if they conflict."""
+        pass
+
+    def __getattr__(self, name):
+        if name != "_values" and name in self._values:
+            return self._values[name]
+        raise AttributeError(f"{type(self).__name__} has no field {name!r}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._values == self._values
+
+    def __hash__(self):
+        return hash((type(self), tuple(self._values.items())))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+        return f"{type(self).__name__}({fields})"
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed.
+
+        Args:
+            **changes: New field values.
+
+        Returns:
+            ToolSettings: The changed copy.
+        """
+        return type(self)(**{**self._values, **changes})
+
+    def to_dict(self):
+        """Return the field values as a JSON-friendly dict."""
+        return dict(self._values)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build settings from a dict, e.g. saved by an older version of the tool.
+
+        Unknown keys are ignored and invalid values replaced by defaults.
+
+        Args:
+            data (dict): Field values.
+
+        Returns:
+            ToolSettings: The settings.
+        """
+        values = {}
+        for name, default, choices in cls.FIELDS:
+            if name in data:
+                try:
+                    values[name] = cls._check(name, data[name], default, choices)
+                except ValueError:
+                    pass
+        try:
+            return cls(**values)
+        except ValueError:
+            return cls()
+
+    @classmethod
+    def load(cls):
+        """Return the saved settings, or the defaults if none were saved.
+
+        Returns:
+            ToolSettings: The settings.
+        """
+        if not cmds.optionVar(exists=cls.OPTION_VAR):
+            return cls()
+        try:
+            data = json.loads(cmds.optionVar(query=cls.OPTION_VAR))
+        except (TypeError, ValueError):
+            return cls()
+        return cls.from_dict(data) if isinstance(data, dict) else cls()
+
+    def save(self):
+        """Save the settings for the next session."""
+        cmds.optionVar(stringValue=(self.OPTION_VAR, json.dumps(self.to_dict())))
+
+    @classmethod
+    def clear(cls):
+        """Forget the saved settings, so load() returns the defaults."""
+        cmds.optionVar(remove=cls.OPTION_VAR)
+
+
+class OrienterSettings(ToolSettings):
+    """Settings of the Orienter tool."""
+
+    __slots__ = ()
+
+    FIELDS = (
+        ("target_hierarchy", True, None),
+        ("aim_axis", "x", tuple(OrientSolver.AXES)),
+        ("up_axis", "y", tuple(OrientSolver.AXES)),
+        ("world_up_axis", "y", tuple(OrientSolver.AXES)),
+        ("world_up_reverse", False, None),
+        ("auto_orient", True, None),
+        ("tweak_angles", (90.0, 90.0, 90.0), None),
+        ("mirror_match", "name", MIRROR_MATCH_MODES),
+        ("mirror_axis", "x", tuple(OrientSolver.AXES)),
+        ("mirror_from_positive", True, None),
+        ("mirror_behavior", True, None),
+    )
+    OPTION_VAR = "maksOrienterSettings"
+
+    # (aim, up) -> orient order, e.g. ('x', 'y') -> 'xyz'.
+    ORIENT_ORDERS = {(order[0], order[1]): order for order in ORIENT_ORDERS}
+
+    def validate(self):
+        """Reject equal aim and up axes."""
+        if self.aim_axis == self.up_axis:
+            raise ValueError(f"aim_axis and up_axis must differ, both are {self.aim_axis!r}")
+
+    @property
+    def orient_order(self):
+        """str: Aim, up and third axis for JointHelper.orient_joints, e.g. 'xyz'."""
+        return self.ORIENT_ORDERS[(self.aim_axis, self.up_axis)]
+
+    @property
+    def secondary_axis(self):
+        """str: World up direction for JointHelper.orient_joints, e.g. 'yup'."""
+        return self.world_up_axis + ("down" if self.world_up_reverse else "up")
+
+
+class SpawnerSettings(ToolSettings):
+    """Settings of the Spawner tool; shape is '' until one is picked."""
+
+    __slots__ = ()
+
+    FIELDS = (
+        ("shape", "", None),
+        ("size", 1.0, None),
+        ("normal", "x", NORMAL_AXES),
+        ("color_enabled", True, None),
+        ("color", (1.0, 0.85, 0.1), None),
+        ("width_ratio", PROXY_WIDTH_RATIO, None),
+        ("all_joints", False, None),
+    )
+    OPTION_VAR = "maksSpawnerSettings"
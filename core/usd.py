@@ -0,0 +1,264 @@
+"""Streaming reads and writes of polygon meshes in USD files, e.g. for ZBrush.
+
+UsdMeshReader yields one MeshData per mesh prim. Points, face counts and face
+indices are taken from the USD value arrays through the buffer protocol, so
+NumPy shares their memory instead of copying it, and each mesh can be built
+and released before the next one is read. Polygroups are read from an integer
+per-face primvar or, failing that, from face GeomSubsets.
+
+UsdMeshWriter does the reverse: NumPy arrays are handed to Vt arrays with
+FromNumpy, a single C++ copy per array, and polygroups are written as an
+integer per-face primvar plus a matching indexed displayColor.
+
+It needs the pxr (USD) Python modules, which ship with Maya's USD plug-in; it
+does not import Maya itself, so files can also be parsed in worker processes
+(see cache_file).
+"""
+
+import os
+
+import numpy as np
+from pxr import Gf, Sdf, Tf, Usd, UsdGeom, Vt
+
+from core.meshcache import MeshCache
+from core.meshdata import MeshData, Polygroups
+
+
+class UsdMeshReader:
+    """Reads meshes from a USD stage as NumPy arrays."""
+
+    # Per-face integer primvars holding polygroup IDs, in order of preference.
+    POLYGROUP_PRIMVARS = ("polygroups", "polygroup", "polyGroup", "zbrush:polygroup")
+
+    FILE_EXTENSIONS = (".usd", ".usda", ".usdc", ".usdz")
+    FILE_FILTER = f"USD ({' '.join('*' + extension for extension in FILE_EXTENSIONS)})"
+
+    @classmethod
+    def find_files(cls, folder):
+        """Return the USD files directly inside a folder, largest first.
+
+        Starting the largest files first keeps a worker pool busy until the
+        end instead of waiting on one big file started last.
+
+        Args:
+            folder (str): Folder to search.
+
+        Returns:
+            list[str]: File paths.
+        """
+        paths = [entry.path for entry in os.scandir(folder)
+                 if entry.is_file() and os.path.splitext(entry.name)[1].lower() in cls.FILE_EXTENSIONS]
+        return sorted(paths, key=lambda path: (-os.path.getsize(path), path))
+
+    @classmethod
+    def cache_file(cls, path, cache_root, options):
+        """Parse a USD file into a MeshCache entry, e.g. in a worker process.
+
+        The meshes are not returned: the caller maps them from the cache, so
+        no mesh data is copied between processes.
+
+        Args:
+            path (str): USD file path.
+            cache_root (str): MeshCache directory.
+            options (dict): Keyword arguments for read.
+
+        Returns:
+            tuple[str, int]: The path and the number of meshes it holds.
+        """
+        cache = MeshCache(cache_root)
+        return path, sum(1 for _ in cache.read(path, cls.read, **options))
+
+    @classmethod
+    def read(cls, path, up_axis="y", meters_per_unit=0.01):
+        """Yield every mesh in a USD file, one at a time.
+
+        Args:
+            path (str): USD file path.
+            up_axis (str): Up axis of the destination scene, 'y' or 'z'.
+            meters_per_unit (float): Linear unit of the destination scene,
+                e.g. MeshHelper.scene_meters_per_unit() (0.01 for centimeters).
+
+        Yields:
+            MeshData: One mesh per mesh prim, its matrix placing it in the
+            destination scene's up axis and units.
+
+        Raises:
+            ValueError: If the file cannot be opened as a USD stage.
+        """
+        stage = Usd.Stage.Open(path)
+        if stage is None:
+            raise ValueError(f"Cannot open {path} as a USD stage")
+
+        conversion = cls.stage_conversion(stage, up_axis, meters_per_unit)
+        xform_cache = UsdGeom.XformCache()
+        for prim in stage.Traverse():
+            if not prim.IsA(UsdGeom.Mesh):
+                continue
+            mesh_data = cls.read_mesh(UsdGeom.Mesh(prim))
+            if mesh_data is None:
+                continue
+            world = np.array(xform_cache.GetLocalToWorldTransform(prim), dtype=np.float64)
+            mesh_data.matrix = world @ conversion
+            yield mesh_data
+
+    @classmethod
+    def read_mesh(cls, mesh):
+        """Read one mesh prim's topology and polygroups.
+
+        Args:
+            mesh (UsdGeom.Mesh): The mesh prim.
+
+        Returns:
+            MeshData | None: The mesh in its local space, or None if it has no
+            faces.
+        """
+        points = mesh.GetPointsAttr().Get()
+        face_counts = mesh.GetFaceVertexCountsAttr().Get()
+        face_indices = mesh.GetFaceVertexIndicesAttr().Get()
+        if not points or not face_counts or not face_indices:
+            return None
+
+        mesh_data = MeshData(mesh.GetPrim().GetName(), np.asarray(points), np.asarray(face_counts),
+                             np.asarray(face_indices), cls.read_polygroups(mesh, len(face_counts)))
+        if mesh.GetOrientationAttr().Get() == UsdGeom.Tokens.leftHanded:
+            mesh_data.reverse_winding()
+        return mesh_data
+
+    @classmethod
+    def read_polygroups(cls, mesh, face_count):
+        """Return the polygroup ID of every face, if the mesh has any.
+
+        Args:
+            mesh (UsdGeom.Mesh): The mesh prim.
+            face_count (int): Number of faces of the mesh.
+
+        Returns:
+            numpy.ndarray | None: (F,) int32 IDs, or None without polygroups.
+        """
+        primvars = UsdGeom.PrimvarsAPI(mesh)
+        for name in cls.POLYGROUP_PRIMVARS:
+            primvar = primvars.GetPrimvar(name)
+            if not primvar or primvar.GetInterpolation() != UsdGeom.Tokens.uniform:
+                continue
+            values = primvar.ComputeFlattened()
+            if values is not None and len(values) == face_count:
+                return np.asarray(values, dtype=np.int32)
+
+        subsets = [subset for subset in UsdGeom.Subset.GetAllGeomSubsets(mesh)
+                   if subset.GetElementTypeAttr().Get() == UsdGeom.Tokens.face]
+        if not subsets:
+            return None
+
+        # Faces outside every subset keep group 0; subsets are numbered from 1.
+        polygroups = np.zeros(face_count, dtype=np.int32)
+        for group_id, subset in enumerate(subsets, 1):
+            indices = np.asarray(subset.GetIndicesAttr().Get(), dtype=np.int64)
+            polygroups[indices[(indices >= 0) & (indices < face_count)]] = group_id
+        return polygroups
+
+    @staticmethod
+    def stage_conversion(stage, up_axis, meters_per_unit):
+        """Return the matrix taking stage space to the destination up axis and units.
+
+        Args:
+            stage (Usd.Stage): Source stage.
+            up_axis (str): Destination up axis, 'y' or 'z'.
+            meters_per_unit (float): Destination linear unit.
+
+        Returns:
+            numpy.ndarray: (4, 4) row-vector matrix.
+        """
+        conversion = np.identity(4)
+        conversion[:3, :3] *= UsdGeom.GetStageMetersPerUnit(stage) / meters_per_unit
+
+        stage_up_axis = UsdGeom.GetStageUpAxis(stage).lower()
+        if stage_up_axis != up_axis.lower():
+            # Z-up to Y-up is -90 degrees about X, Y-up to Z-up the reverse.
+            sign = -1.0 if stage_up_axis == "z" else 1.0
+            rotation = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, sign], [0.0, -sign, 0.0]])
+            conversion[:3, :3] = conversion[:3, :3] @ rotation
+        return conversion
+
+
+class UsdMeshWriter:
+    """Writes MeshData to a new USD stage."""
+
+    POLYGROUP_PRIMVAR = UsdMeshReader.POLYGROUP_PRIMVARS[0]
+
+    @classmethod
+    def write(cls, path, meshes, up_axis="y", meters_per_unit=0.01):
+        """Write meshes to a new USD file, one mesh prim each under the root.
+
+        Args:
+            path (str): Destination file; overwritten if it exists.
+            meshes (Iterable[MeshData]): Meshes to write, e.g. a generator
+                reading them from Maya one at a time.
+            up_axis (str): Up axis of the meshes' scene, 'y' or 'z'.
+            meters_per_unit (float): Linear unit of the meshes' matrices, e.g.
+                MeshHelper.scene_meters_per_unit().
+
+        Returns:
+            list[str]: Paths of the written mesh prims.
+        """
+        stage = Usd.Stage.CreateNew(path) if not os.path.exists(path) else Usd.Stage.Open(path)
+        stage.GetRootLayer().Clear()
+        UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z if up_axis.lower() == "z" else UsdGeom.Tokens.y)
+        UsdGeom.SetStageMetersPerUnit(stage, meters_per_unit)
+
+        written = []
+        for mesh_data in meshes:
+            written.append(cls.write_mesh(stage, mesh_data))
+            # Drop this mesh before the next one is read.
+            del mesh_data
+
+        if written:
+            stage.SetDefaultPrim(stage.GetPrimAtPath(written[0]))
+        stage.GetRootLayer().Save()
+        return written
+
+    @classmethod
+    def write_mesh(cls, stage, mesh_data):
+        """Define one mesh prim from MeshData.
+
+        Args:
+            stage (Usd.Stage): Destination stage.
+            mesh_data (MeshData): The mesh.
+
+        Returns:
+            str: Path of the mesh prim.
+        """
+        mesh_data.validate()
+        prim_path = cls.unique_path(stage, Sdf.Path.absoluteRootPath.AppendChild(
+            Tf.MakeValidIdentifier(mesh_data.name or "mesh")))
+        mesh = UsdGeom.Mesh.Define(stage, prim_path)
+
+        mesh.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(mesh_data.points))
+        mesh.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(mesh_data.face_counts))
+        mesh.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(mesh_data.face_indices))
+        mesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
+        if len(mesh_data.points):
+            mesh.CreateExtentAttr(Vt.Vec3fArray.FromNumpy(
+                np.stack([mesh_data.points.min(axis=0), mesh_data.points.max(axis=0)])))
+
+        if not np.allclose(mesh_data.matrix, np.identity(4)):
+            mesh.MakeMatrixXform().Set(Gf.Matrix4d(mesh_data.matrix.tolist()))
+
+        if mesh_data.polygroups is not None:
+            primvars = UsdGeom.PrimvarsAPI(mesh)
+            primvars.CreatePrimvar(cls.POLYGROUP_PRIMVAR, Sdf.ValueTypeNames.IntArray,
+                                   UsdGeom.Tokens.uniform).Set(Vt.IntArray.FromNumpy(mesh_data.polygroups))
+            # An indexed primvar: one color per polygroup plus one index per face.
+            palette, palette_indices = Polygroups.to_colors(mesh_data.polygroups)
+            display_color = mesh.CreateDisplayColorPrimvar(UsdGeom.Tokens.uniform)
+            display_color.Set(Vt.Vec3fArray.FromNumpy(palette))
+            display_color.SetIndices(Vt.IntArray.FromNumpy(palette_indices))
+        return str(prim_path)
+
+    @staticmethod
+    def unique_path(stage, path):
+        """Return path, suffixed with a number if a prim already exists there."""
+        candidate, index = path, 1
+        while stage.GetPrimAtPath(candidate):
+            candidate = path.ReplaceName(f"{path.name}{index}")
+            index += 1
+        return candidate
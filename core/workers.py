@@ -0,0 +1,105 @@
+"""Process pools that can be started from inside a Maya session.
+
+Inside the Maya GUI, sys.executable is the Maya application itself, so worker
+processes have to be started with mayapy instead. WorkerPool.create returns a
+concurrent.futures process pool set up that way; the work submitted to it
+must be importable without maya.cmds (e.g. USD parsing into a MeshCache).
+"""
+
+import concurrent.futures
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.spawn
+import os
+import sys
+import threading
+
+
+class WorkerPool:
+    """Creates process pools whose workers run a plain Python interpreter."""
+
+    MAX_WORKERS = 8
+
+    @staticmethod
+    def worker_executable():
+        """Return the interpreter for worker processes.
+
+        In Maya that is mayapy: in $MAYA_LOCATION/bin, or found from the Maya
+        executable (bin/maya.exe on Windows, bin/maya.bin on Linux,
+        Contents/MacOS/Maya on macOS). Elsewhere it is sys.executable.
+
+        Raises:
+            RuntimeError: If running in Maya and mayapy cannot be found.
+        """
+        executable = sys.executable
+        name = os.path.basename(executable).lower()
+        if not name.startswith("maya") or name.startswith("mayapy"):
+            return executable
+
+        mayapy = "mayapy.exe" if sys.platform == "win32" else "mayapy"
+        folder = os.path.dirname(executable)
+        candidates = [os.path.join(folder, mayapy), os.path.join(os.path.dirname(folder), "bin", mayapy)]
+        if os.environ.get("MAYA_LOCATION"):
+            candidates.insert(0, os.path.join(os.environ["MAYA_LOCATION"], "bin", mayapy))
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return candidate
+        raise RuntimeError(f"Cannot find mayapy to start worker processes, looked for {', '.join(candidates)}")
+
+    @classmethod
+    def default_workers(cls, jobs=None):
+        """Return how many workers to start: one per core, leaving one for Maya, capped by MAX_WORKERS and jobs."""
+        workers = min(max((os.cpu_count() or 2) - 1, 1), cls.MAX_WORKERS)
+        return min(workers, jobs) if jobs else workers
+
+    @classmethod
+    def create(cls, max_workers=None):
+        """Start a process pool.
+
+        Args:
+            max_workers (int | None): Number of worker processes; defaults to
+                default_workers().
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor: The pool. Shut it down
+            when done.
+
+        Raises:
+            RuntimeError: If running in Maya and mayapy cannot be found.
+        """
+        context = _WorkerContext(cls.worker_executable())
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or cls.default_workers(),
+                                                      mp_context=context)
+
+
+class _WorkerContext(multiprocessing.context.SpawnContext):
+    """Spawn context starting its processes with its own interpreter.
+
+    multiprocessing keeps the spawn executable in a global; each process of
+    this context sets it only while it starts, so other pools and
+    multiprocessing users in the session keep theirs.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, executable):
+        super().__init__()
+        self.executable = executable
+
+    def Process(self, *args, **kwargs):
+        process = _WorkerProcess(*args, **kwargs)
+        process.executable = self.executable
+        return process
+
+
+class _WorkerProcess(multiprocessing.context.SpawnProcess):
+    executable = None
+
+    def start(self):
+        with _WorkerContext._lock:
+            previous = multiprocessing.spawn.get_executable()
+            multiprocessing.spawn.set_executable(self.executable)
+            try:
+                super().start()
+            finally:
+                multiprocessing.spawn.set_executable(previous)
@@ -1,43 +1,56 @@
 """MAKS Tools: a collection of Maya utilities with a dockable UI.
 
-This entry-point module assembles the available tools (Orienter, Colorizer) into
-one tabbed window that can be docked inside Autodesk Maya.
+This entry-point module assembles the available tools (Orienter, Colorizer, PolyPorter, Spawner) into
+one tabbed window that can be docked inside Autodesk Maya. Tools are imported
+and built the first time their tab is shown.
 """
 
+import importlib
+
 from PySide6 import QtWidgets
 
 from ui.widgets import CustomDialog
-from tools.orienter import OrienterWidget
-from tools.colorizer import ColorizerWidget
 
 import maya.cmds as cmds
 
 
 class MainToolsWidget(CustomDialog):
-    """The main host window for the MAKS tools suite (Orienter + Colorizer)."""
+    """The main host window for the MAKS tools suite (Orienter + Colorizer + PolyPorter + Spawner)."""
 
     OBJECT_NAME = "MAKS Tools"
 
+    # (tab label, module path, widget class name, attribute holding the instance)
+    TOOL_TABS = (
+        ("Orienter", "tools.orienter", "OrienterWidget", "orient_tool_widget"),
+        ("Colorizer", "tools.colorizer", "ColorizerWidget", "colorizer_tool_widget"),
+        ("PolyPorter", "tools.polyporter", "PolyporterWidget", "polyporter_tool_widget"),
+        ("Spawner", "tools.spawner", "SpawnerWidget", "spawner_tool_widget"),
+    )
+
     def __init__(self):
-        """Construct the tabbed tools window and initialize child tools."""
+        """Construct the tabbed tools window; tools are built on first use."""
         super().__init__()
         self.setObjectName(self.OBJECT_NAME)
 
         self.orient_tool_widget = None
         self.colorizer_tool_widget = None
+        self.polyporter_tool_widget = None
+        self.spawner_tool_widget = None
 
         self.tab_widget = None
+        self.tab_containers = []
 
         self.setup_ui()
 
     def create_widgets(self):
-        """Create tool widgets and the tab container."""
-        self.orient_tool_widget = OrienterWidget()
-        self.colorizer_tool_widget = ColorizerWidget()
-
+        """Create the tab container with an empty placeholder per tool."""
         self.tab_widget = QtWidgets.QTabWidget()
-        self.tab_widget.addTab(self.orient_tool_widget, "Orienter")
-        self.tab_widget.addTab(self.colorizer_tool_widget, "Colorizer")
+        for label, _, _, _ in self.TOOL_TABS:
+            container = QtWidgets.QWidget()
+            container_layout = QtWidgets.QVBoxLayout(container)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_containers.append(container)
+            self.tab_widget.addTab(container, label)
 
     def create_layout(self):
         """Create the layouts and arrange widgets."""
@@ -45,12 +58,27 @@ class MainToolsWidget(CustomDialog):
         main_layout.addWidget(self.tab_widget)
 
     def create_connections(self):
-        """Connect widget signals to slots (reserved for future use)."""
-        pass
+        """Connect widget signals to slots and build the initially visible tool."""
+        self.tab_widget.currentChanged.connect(self.on_current_index_changed)
+        self.on_current_index_changed(self.tab_widget.currentIndex())
 
     def on_current_index_changed(self, index):
-        """Handle the current tab index change (reserved)."""
-        pass
+        """Import and build the tool of the newly shown tab if not done yet.
+
+        Args:
+            index (int): Index of the current tab.
+        """
+        if not 0 <= index < len(self.TOOL_TABS):
+            return
+
+        _, module_path, class_name, attribute = self.TOOL_TABS[index]
+        if getattr(self, attribute) is not None:
+            return
+
+        widget_class = getattr(importlib.import_module(module_path), class_name)
+        widget = widget_class()
+        self.tab_containers[index].layout().addWidget(widget)
+        setattr(self, attribute, widget)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""Maya plug-in registering the commands used internally by MAKS Tools.
+
+It is loaded on demand by core.attribute.AttributeWriter and does not need to
+be added to the Plug-in Manager by hand.
+"""
+
+import maya.api.OpenMaya as om2
+
+from core.attribute import CommitModifierCommand
+
+
+def maya_useNewAPI():
+    """Tell Maya this plug-in uses the Python API 2.0."""
+    pass
+
+
+def initializePlugin(plugin):
+    """Register the plug-in commands."""
+    plugin_fn = om2.MFnPlugin(plugin, "MAKS Tools")
+    plugin_fn.registerCommand(CommitModifierCommand.COMMAND_NAME, CommitModifierCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    """Deregister the plug-in commands."""
+    plugin_fn = om2.MFnPlugin(plugin)
+    plugin_fn.deregisterCommand(CommitModifierCommand.COMMAND_NAME)
@@ -0,0 +1,34 @@
+"""Maya plug-in registering the viewport overlay used by the Orienter preview.
+
+It is loaded on demand by ui.preview.OrientPreview and does not need to be
+added to the Plug-in Manager by hand.
+"""
+
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaRender as omr
+
+from ui.preview import AxisPreviewLocator, AxisPreviewDrawOverride
+
+
+def maya_useNewAPI():
+    """Tell Maya this plug-in uses the Python API 2.0."""
+    pass
+
+
+def initializePlugin(plugin):
+    """Register the preview locator and its draw override."""
+    plugin_fn = om2.MFnPlugin(plugin, "MAKS Tools")
+    plugin_fn.registerNode(AxisPreviewLocator.NODE_NAME, AxisPreviewLocator.TYPE_ID,
+                           AxisPreviewLocator.creator, AxisPreviewLocator.initialize,
+                           om2.MPxNode.kLocatorNode, AxisPreviewLocator.DRAW_CLASSIFICATION)
+    omr.MDrawRegistry.registerDrawOverrideCreator(AxisPreviewLocator.DRAW_CLASSIFICATION,
+                                                  AxisPreviewLocator.DRAW_REGISTRANT_ID,
+                                                  AxisPreviewDrawOverride.creator)
+
+
+def uninitializePlugin(plugin):
+    """Deregister the preview locator and its draw override."""
+    plugin_fn = om2.MFnPlugin(plugin)
+    omr.MDrawRegistry.deregisterDrawOverrideCreator(AxisPreviewLocator.DRAW_CLASSIFICATION,
+                                                    AxisPreviewLocator.DRAW_REGISTRANT_ID)
+    plugin_fn.deregisterNode(AxisPreviewLocator.TYPE_ID)
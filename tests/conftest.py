@@ -0,0 +1,21 @@
+"""Shared pytest setup.
+
+The tests run with a plain Python interpreter: the repository root is put on
+sys.path and, when Maya cannot be imported, the headless stand-in from
+benchmarks.fake_maya is installed so modules importing maya load. Pure NumPy
+modules such as core.orient need neither.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+try:
+    import maya.cmds  # noqa: F401
+except ImportError:
+    from benchmarks import fake_maya
+
+    fake_maya.install()
@@ -0,0 +1,75 @@
+"""Tests for AttributeWriter against the headless Maya stand-in."""
+
+import numpy as np
+import pytest
+
+import maya.cmds as cmds
+
+from benchmarks import fake_maya
+from core.attribute import AttributeWriter
+
+
+@pytest.fixture
+def transforms():
+    scene = fake_maya.new_scene()
+    return [scene.create_node("transform", f"node{index}").full_path() for index in range(3)]
+
+
+@pytest.mark.parametrize("value", [np.float32(2.5), np.int64(3), np.bool_(True), 4])
+def test_set_many_broadcasts_scalars(transforms, value):
+    writer = AttributeWriter()
+    assert writer.set_many(transforms, "translateX", value) == len(transforms)
+    writer.commit()
+    assert [cmds.getAttr(f"{node}.translateX") for node in transforms] == pytest.approx([float(value)] * 3)
+
+
+def test_commit_is_one_undo_step(transforms):
+    writer = AttributeWriter()
+    writer.set_many(transforms, "translate", np.arange(9.0).reshape(3, 3))
+    writer.commit()
+    assert cmds.getAttr(f"{transforms[2]}.translate") == [(6.0, 7.0, 8.0)]
+
+    cmds.undo()
+    assert [cmds.getAttr(f"{node}.translate") for node in transforms] == [[(0.0, 0.0, 0.0)]] * 3
+
+
+def test_undo_and_redo_replay_the_written_values(transforms):
+    writer = AttributeWriter()
+    writer.set_many(transforms, "rotateY", [10.0, 20.0, 30.0])
+    writer.set_many(transforms, "visibility", False)
+    writer.set_many(transforms, "overrideColor", 13)
+    assert writer.commit() == 9
+
+    def values():
+        return [(cmds.getAttr(f"{node}.rotateY"), cmds.getAttr(f"{node}.visibility"),
+                 cmds.getAttr(f"{node}.overrideColor")) for node in transforms]
+
+    written = values()
+    assert [value[0] for value in written] == pytest.approx([10.0, 20.0, 30.0])
+    assert all(value[1:] == (False, 13) for value in written)
+
+    cmds.undo()
+    assert values() == [(0.0, True, 0)] * 3
+    cmds.redo()
+    assert values() == written
+
+
+def test_commit_command_refuses_direct_calls(transforms):
+    AttributeWriter.load_plugin()
+    with pytest.raises(RuntimeError, match="AttributeWriter.commit"):
+        cmds.maksCommitModifier()
+
+
+def test_read_many_returns_setattr_units_and_live_handles(transforms):
+    writer = AttributeWriter()
+    writer.set_many(transforms, "rotateZ", [15.0, 30.0, 45.0])
+    writer.commit()
+    cmds.delete(transforms[1])
+
+    states = AttributeWriter().read_many(transforms + ["missing"], "rotateZ")
+    assert states[1] is None and states[3] is None
+    assert [state[1] for state in (states[0], states[2])] == pytest.approx([15.0, 45.0])
+    # The handle of a node read before it was deleted goes stale.
+    handle = AttributeWriter().read_many(transforms[2:], "visibility")[0][0]
+    cmds.delete(transforms[2])
+    assert not handle.isValid()
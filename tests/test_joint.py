@@ -0,0 +1,49 @@
+"""Tests for the orient cache of JointHelper against the headless Maya stand-in."""
+
+import pytest
+
+import maya.cmds as cmds
+
+from benchmarks import fake_maya
+from core.joint import JointHelper
+from core.scene import SceneIndex
+
+
+@pytest.fixture
+def chains():
+    scene = fake_maya.new_scene()
+    JointHelper.clear_orient_cache()
+    roots = []
+    for chain in range(3):
+        parent = None
+        for index in range(3):
+            joint = scene.create_node("joint", f"chain{chain}_{index}", parent=parent)
+            if parent is not None:
+                cmds.setAttr(f"{joint.full_path()}.translate", 1.0 + chain, 0.5 * index, 0.0)
+            parent = joint
+        roots.append(scene.find(f"chain{chain}_0").full_path())
+    yield JointHelper.walk_hierarchy(roots).names
+    JointHelper.clear_orient_cache()
+
+
+def test_orient_cache_skips_unchanged_chains(chains):
+    assert JointHelper.orient_joints(chains, "xyz", "yup") == 9
+    assert JointHelper.orient_joints(chains, "xyz", "yup") == 0
+
+    cmds.setAttr(f"{chains[4]}.translateY", 2.0)
+    assert JointHelper.orient_joints(chains, "xyz", "yup") == 3
+    assert JointHelper.orient_joints(chains, "yzx", "yup") == 9
+
+
+def test_orient_cache_is_capped(chains, monkeypatch):
+    monkeypatch.setattr(JointHelper, "ORIENT_CACHE_SIZE", 2)
+    JointHelper.orient_joints(chains, "xyz", "yup")
+    assert list(JointHelper._orient_cache) == [chains[3], chains[6]]
+    # The evicted chain is oriented again, the others are skipped.
+    assert JointHelper.orient_joints(chains, "xyz", "yup") == 3
+
+
+def test_orient_cache_is_cleared_with_the_scene(chains):
+    JointHelper.orient_joints(chains, "xyz", "yup")
+    SceneIndex.instance()._on_scene_changed()
+    assert not JointHelper._orient_cache
@@ -0,0 +1,72 @@
+"""Tests for MeshCache with synthetic meshes."""
+
+import os
+
+import numpy as np
+import pytest
+
+from core.meshcache import MeshCache
+from core.meshdata import MeshData
+
+
+def quad_strip(polygroups):
+    points = np.array([[x, y, 0.0] for x in range(len(polygroups) + 1) for y in (0, 1)], dtype=np.float32)
+    face_indices = np.array([[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] for i in range(len(polygroups))])
+    return MeshData("strip", points, np.full(len(polygroups), 4), face_indices.reshape(-1), polygroups)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "strip.usd"
+    path.write_text("v1")
+    return str(path)
+
+
+def reader(groups):
+    return lambda path, **options: iter([quad_strip(groups)])
+
+
+def test_regrouping_writes_only_polygroups_under_a_new_name(tmp_path, source):
+    cache = MeshCache(str(tmp_path / "cache"))
+    first = list(cache.read(source, reader([0, 0, 1])))
+    assert not cache.last_hit
+
+    os.utime(source, ns=(0, 0))
+    with open(source, "w") as handle:
+        handle.write("v2")
+    second = list(cache.read(source, reader([0, 1, 1])))
+    assert cache.refreshed == [("strip", "polygroups")]
+    np.testing.assert_array_equal(second[0].polygroups, [0, 1, 1])
+    del first, second
+
+    mapped = list(cache.read(source, reader([9, 9, 9])))
+    assert cache.last_hit
+    np.testing.assert_array_equal(mapped[0].polygroups, [0, 1, 1])
+    assert len(os.listdir(cache.entry_path(source))) == len(MeshCache.ARRAYS) + 1
+
+
+def test_mapped_files_are_never_replaced(tmp_path, source, monkeypatch):
+    cache = MeshCache(str(tmp_path / "cache"))
+    list(cache.read(source, reader([0, 0, 1])))
+    mapped = list(cache.read(source, reader([0, 0, 1])))
+    assert cache.last_hit
+
+    # Windows refuses to replace or delete a file that is still mapped.
+    remove = os.remove
+
+    def remove_unmapped(path):
+        if path.endswith(".npy"):
+            raise PermissionError(path)
+        remove(path)
+
+    monkeypatch.setattr(os, "remove", remove_unmapped)
+    with open(source, "w") as handle:
+        handle.write("v2")
+    list(cache.read(source, reader([1, 1, 1])))
+    np.testing.assert_array_equal(mapped[0].polygroups, [0, 0, 1])
+
+    monkeypatch.undo()
+    del mapped
+    assert cache.load_meshes(source, cache.load_manifest(source))[0].polygroups.tolist() == [1, 1, 1]
+    list(cache.read(source, reader([1, 1, 1])))
+    assert len(os.listdir(cache.entry_path(source))) == len(MeshCache.ARRAYS) + 1
@@ -0,0 +1,37 @@
+"""Tests for the NumPy polygroup colors in core.meshdata."""
+
+import numpy as np
+
+from core.meshdata import Polygroups
+
+
+def face_colors(polygroups):
+    palette, palette_indices = Polygroups.to_colors(polygroups)
+    # Maya stores colors as float32 RGBA; alpha is ignored on the way back.
+    return np.column_stack([palette[palette_indices], np.ones(len(polygroups), dtype=np.float32)])
+
+
+def test_from_colors_round_trips_with_known_ids():
+    polygroups = np.random.default_rng(0).choice([3, 17, 42, 1000], size=500)
+    ids = np.unique(polygroups)
+    np.testing.assert_array_equal(Polygroups.from_colors(face_colors(polygroups), ids), polygroups)
+
+
+def test_from_colors_snaps_slightly_off_colors():
+    polygroups = np.array([0, 1, 2, 1])
+    colors = face_colors(polygroups)
+    colors[:, :3] += 0.01
+    np.testing.assert_array_equal(Polygroups.from_colors(colors, [0, 1, 2]), polygroups)
+
+
+def test_from_colors_numbers_unknown_colors_after_known_ids():
+    colors = face_colors(np.array([4, 9, 4]))
+    painted = np.array([[0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
+    result = Polygroups.from_colors(np.vstack([colors, painted, painted[:1]]), [4, 9])
+    np.testing.assert_array_equal(result, [4, 9, 4, 10, 11, 10])
+
+
+def test_from_colors_without_ids_groups_equal_colors():
+    result = Polygroups.from_colors(face_colors(np.array([7, 7, 2, 7, 2])))
+    assert len(np.unique(result)) == 2
+    assert result[0] == result[1] == result[3] != result[2] == result[4]
@@ -0,0 +1,76 @@
+"""Tests for the name and position matching in core.mirror."""
+
+import numpy as np
+import pytest
+
+from core.mirror import MirrorMatcher
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("|root|L_arm|L_elbow", "|root|R_arm|R_elbow"),
+    ("|root|R_arm|R_elbow", "|root|L_arm|L_elbow"),
+    ("leftArm", "rightArm"),
+    ("arm_L1", "arm_R1"),
+    ("char:Lf_hand", "char:Rt_hand"),
+    ("Lung|BLAH_legs", "Lung|BLAH_legs"),
+    ("spine_01", "spine_01"),
+])
+def test_mirror_name(name, expected):
+    assert MirrorMatcher.mirror_name(name) == expected
+
+
+def test_match_names_pairs_each_side_once():
+    names = ["|root", "|root|L_arm", "|root|R_arm", "|root|L_arm|twist", "|root|R_arm|twist",
+             "|root|L_leg", "|root|left_hand", "|root|right_hand"]
+    sources, targets = MirrorMatcher.match_names(names)
+    # The twist joints have no side token of their own; L_leg has no counterpart.
+    assert list(zip(sources.tolist(), targets.tolist())) == [(1, 2), (6, 7)]
+
+    sources, targets = MirrorMatcher.match_names(names, from_left=False)
+    assert list(zip(sources.tolist(), targets.tolist())) == [(2, 1), (7, 6)]
+
+
+def test_match_names_without_pairs_returns_int_arrays():
+    sources, targets = MirrorMatcher.match_names(["|root", "|root|spine"])
+    assert sources.dtype == targets.dtype == np.int64
+    assert len(sources) == len(targets) == 0
+
+
+@pytest.mark.parametrize("axis", ["x", "y", "z"])
+@pytest.mark.parametrize("from_positive", [True, False])
+def test_match_positions_finds_shuffled_counterparts(axis, from_positive):
+    random = np.random.default_rng(0)
+    axis_index = "xyz".index(axis)
+    sign = 1.0 if from_positive else -1.0
+    sources = random.uniform(-50, 50, (500, 3))
+    sources[:, axis_index] = sign * random.uniform(1, 50, 500)
+    counterparts = sources.copy()
+    counterparts[:, axis_index] *= -1.0
+    counterparts += random.uniform(-0.002, 0.002, counterparts.shape)
+    center = random.uniform(-50, 50, (20, 3))
+    center[:, axis_index] = 0.0
+
+    positions = np.concatenate([sources, counterparts, center])
+    order = random.permutation(len(positions))
+    positions = positions[order]
+    rank = np.argsort(order)
+
+    matched, found = MirrorMatcher.match_positions(positions, axis, from_positive)
+    np.testing.assert_array_equal(np.sort(matched), np.sort(rank[:500]))
+    np.testing.assert_array_equal(found[np.argsort(matched)], rank[500:1000][np.argsort(rank[:500])])
+
+
+def test_match_positions_uses_each_counterpart_once():
+    # Both sources are within tolerance of the same counterpart; the closer one keeps it.
+    positions = np.array([[1.0, 0.0, 0.0], [1.004, 0.0, 0.0], [-1.003, 0.0, 0.0]])
+    sources, targets = MirrorMatcher.match_positions(positions, tolerance=0.01)
+    assert sources.tolist() == [1]
+    assert targets.tolist() == [2]
+
+
+def test_match_positions_respects_tolerance_far_from_the_origin():
+    positions = np.array([[-5000.0, 3000.0, 10.0], [5000.02, 3000.0, 10.0], [5000.0, -3000.0, 0.0],
+                          [-5000.0, -3000.0, 0.005]])
+    sources, targets = MirrorMatcher.match_positions(positions, tolerance=0.01)
+    assert sources.tolist() == [2]
+    assert targets.tolist() == [3]
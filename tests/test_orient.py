@@ -0,0 +1,209 @@
+"""Tests for the NumPy orientation math in core.orient."""
+
+import numpy as np
+import pytest
+
+from core.orient import OrientSolver
+
+
+def rotation_x(degrees):
+    c, s = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    return np.array([[1, 0, 0], [0, c, s], [0, -s, c]])
+
+
+def rotation_y(degrees):
+    c, s = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    return np.array([[c, 0, -s], [0, 1, 0], [s, 0, c]])
+
+
+def rotation_z(degrees):
+    c, s = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    return np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+
+
+def random_rotations(count, seed=0):
+    angles = np.random.default_rng(seed).uniform([-179, -89, -179], [179, 89, 179], (count, 3))
+    return OrientSolver.euler_to_matrix(angles)
+
+
+def chain(points):
+    """Return positions and parent indices of a single chain through points."""
+    positions = np.asarray(points, dtype=float)
+    return positions, np.arange(len(positions)) - 1
+
+
+def assert_rotations(frames):
+    frames = np.asarray(frames)
+    np.testing.assert_allclose(frames @ np.transpose(frames, (0, 2, 1)), np.broadcast_to(np.eye(3), frames.shape),
+                               atol=1e-9)
+    np.testing.assert_allclose(np.linalg.det(frames), 1.0, atol=1e-9)
+
+
+def test_euler_to_matrix_matches_xyz_row_vector_convention():
+    angles = np.array([[30.0, -45.0, 60.0]])
+    expected = rotation_x(30.0) @ rotation_y(-45.0) @ rotation_z(60.0)
+    np.testing.assert_allclose(OrientSolver.euler_to_matrix(angles)[0], expected, atol=1e-12)
+
+
+def test_euler_round_trip():
+    angles = np.random.default_rng(1).uniform([-179, -89, -179], [179, 89, 179], (500, 3))
+    matrices = OrientSolver.euler_to_matrix(angles)
+    assert_rotations(matrices)
+    np.testing.assert_allclose(OrientSolver.matrix_to_euler(matrices), angles, atol=1e-9)
+
+
+def test_matrix_to_euler_at_gimbal_lock_reproduces_the_matrix():
+    matrices = OrientSolver.euler_to_matrix([[25.0, 90.0, 40.0], [-10.0, -90.0, 5.0]])
+    angles = OrientSolver.matrix_to_euler(matrices)
+    np.testing.assert_allclose(OrientSolver.euler_to_matrix(angles), matrices, atol=1e-9)
+
+
+def test_joint_orients_rebuild_frames_under_parents():
+    frames = random_rotations(50, seed=2)
+    parent_frames = random_rotations(50, seed=3)
+    orients = OrientSolver.joint_orients(frames, parent_frames)
+    np.testing.assert_allclose(OrientSolver.euler_to_matrix(orients) @ parent_frames, frames, atol=1e-9)
+
+
+def test_compensated_child_keeps_its_world_frame():
+    # A child that is not re-oriented folds the parent's change into its jointOrient.
+    child_orients = np.random.default_rng(4).uniform(-60, 60, (20, 3))
+    old_parents = random_rotations(20, seed=5)
+    new_parents = random_rotations(20, seed=6)
+    world = OrientSolver.euler_to_matrix(child_orients) @ old_parents
+
+    compensated = OrientSolver.matrix_to_euler(OrientSolver.euler_to_matrix(child_orients)
+                                               @ old_parents @ np.transpose(new_parents, (0, 2, 1)))
+    np.testing.assert_allclose(OrientSolver.euler_to_matrix(compensated) @ new_parents, world, atol=1e-9)
+
+
+@pytest.mark.parametrize("direction, expected", [
+    ("yup", [0, 1, 0]), ("zdown", [0, 0, -1]), ("xup", [1, 0, 0]), ("none", None), ("nonedown", None)])
+def test_axis_vector(direction, expected):
+    vector = OrientSolver.axis_vector(direction)
+    if expected is None:
+        assert vector is None
+    else:
+        np.testing.assert_array_equal(vector, expected)
+
+
+def test_first_children_and_depths():
+    parent_indices = np.array([-1, 0, 1, 0, -1, 4])
+    np.testing.assert_array_equal(OrientSolver.first_children(parent_indices), [1, 2, -1, -1, 5, -1])
+    np.testing.assert_array_equal(OrientSolver.depths(parent_indices), [0, 1, 2, 1, 0, 1])
+
+
+@pytest.mark.parametrize("orient_order", ["xyz", "xzy", "yzx", "yxz", "zxy", "zyx"])
+def test_aim_frames_aim_and_up_axes(orient_order):
+    positions, parent_indices = chain([[0, 0, 0], [2, 1, 0], [4, 0, 1]])
+    frames = OrientSolver.aim_frames(positions, parent_indices, [0, 1], orient_order, "yup")
+    assert_rotations(frames)
+
+    aim_axis, up_axis, _ = (OrientSolver.AXES.index(axis) for axis in orient_order)
+    bones = OrientSolver.normalize(positions[1:] - positions[:-1])
+    np.testing.assert_allclose(frames[:, aim_axis], bones, atol=1e-12)
+    # The up axis is world up with the bone direction removed, so it stays on the +Y side.
+    assert np.all(frames[:, up_axis, 1] > 0)
+    np.testing.assert_allclose(np.einsum("ij,ij->i", frames[:, up_axis], bones), 0.0, atol=1e-12)
+
+
+def test_aim_frames_fall_back_when_up_is_parallel_to_the_bone():
+    positions, parent_indices = chain([[0, 0, 0], [0, 3, 0]])
+    frames = OrientSolver.aim_frames(positions, parent_indices, [0], "xyz", "yup")
+    assert_rotations(frames)
+    np.testing.assert_allclose(frames[0, 0], [0, 1, 0], atol=1e-12)
+
+
+def test_auto_orient_keeps_the_up_axis_in_the_chain_plane():
+    # An arm bending in the XZ plane: the up axis stays in that plane, the third axis is its normal.
+    positions, parent_indices = chain([[0, 0, 0], [2, 0, -1], [4, 0, 0]])
+    frames = OrientSolver.aim_frames(positions, parent_indices, [0, 1], "xyz", "yup", auto_orient=True)
+    assert_rotations(frames)
+    np.testing.assert_allclose(frames[:, 1, 1], 0.0, atol=1e-12)
+    # Both joints keep the normal on the same side, so the chain does not flip.
+    np.testing.assert_allclose(np.abs(frames[:, 2, 1]), 1.0, atol=1e-12)
+    np.testing.assert_allclose(frames[0, 2], frames[1, 2], atol=1e-12)
+
+
+def test_orient_frames_leaf_inherits_parent_frame_and_gets_a_zero_joint_orient():
+    positions, parent_indices = chain([[0, 0, 0], [1, 1, 0], [2, 1, 1]])
+    rotations = random_rotations(3, seed=7)
+    parent_rotations = np.broadcast_to(np.eye(3), (3, 3, 3))
+    frames = OrientSolver.orient_frames(positions, parent_indices, rotations, parent_rotations,
+                                        np.ones(3, dtype=bool), "xyz", "yup")
+
+    np.testing.assert_allclose(frames[2], frames[1], atol=1e-12)
+    parent_frames = OrientSolver.parent_frames(frames, parent_indices, parent_rotations)
+    np.testing.assert_allclose(OrientSolver.joint_orients(frames, parent_frames)[2], 0.0, atol=1e-9)
+
+
+def test_orient_frames_none_zeroes_every_joint_orient():
+    positions, parent_indices = chain([[0, 0, 0], [1, 1, 0], [2, 1, 1]])
+    rotations = random_rotations(3, seed=8)
+    parent_rotations = np.broadcast_to(rotation_z(30.0), (3, 3, 3))
+    frames = OrientSolver.orient_frames(positions, parent_indices, rotations, parent_rotations,
+                                        np.ones(3, dtype=bool), "none", "yup")
+
+    np.testing.assert_allclose(frames, parent_rotations, atol=1e-12)
+    parent_frames = OrientSolver.parent_frames(frames, parent_indices, parent_rotations)
+    np.testing.assert_allclose(OrientSolver.joint_orients(frames, parent_frames), 0.0, atol=1e-9)
+
+
+def test_orient_frames_keeps_untargeted_joints():
+    positions, parent_indices = chain([[0, 0, 0], [1, 1, 0], [2, 1, 1]])
+    rotations = random_rotations(3, seed=9)
+    targets = np.array([True, False, False])
+    frames = OrientSolver.orient_frames(positions, parent_indices, rotations, rotations, targets, "xyz", "yup")
+    np.testing.assert_array_equal(frames[1:], rotations[1:])
+
+
+def test_local_translations_keep_world_positions():
+    positions, parent_indices = chain([[0, 0, 0], [1, 2, 3], [2, 2, 5]])
+    frames = random_rotations(3, seed=10)
+    scales = np.array([[1.0, 2.0, 0.5]] * 3)
+    translations = OrientSolver.local_translations(positions, parent_indices, frames[[0, 0, 1]], scales)
+
+    assert np.isnan(translations[0]).all()
+    rebuilt = positions[[0, 1]] + np.einsum("ni,nij->nj", translations[1:] * scales[1:], frames[[0, 1]])
+    np.testing.assert_allclose(rebuilt, positions[1:], atol=1e-9)
+
+
+def test_unflip_frames_turns_flipped_sub_chains():
+    # Joints 1 and 2 are both flipped; each is checked against its already corrected parent.
+    parent_indices = np.array([-1, 0, 1])
+    frames = np.broadcast_to(np.eye(3), (3, 3, 3)).copy()
+    frames[1:] = np.diag([1.0, -1.0, -1.0])
+
+    turned = OrientSolver.unflip_frames(frames, parent_indices, np.ones(3, dtype=bool), 0, 1)
+    np.testing.assert_array_equal(turned, [False, True, True])
+    np.testing.assert_allclose(frames, np.broadcast_to(np.eye(3), (3, 3, 3)))
+
+
+def test_mirror_frames_behavior_keeps_local_rotations():
+    # Mirrored children under mirrored parents get the same local rotation, so poses mirror symmetrically.
+    parents = random_rotations(20, seed=11)
+    children = random_rotations(20, seed=12)
+    for axis in OrientSolver.AXES:
+        mirrored_parents = OrientSolver.mirror_frames(parents, axis)
+        mirrored_children = OrientSolver.mirror_frames(children, axis)
+        assert_rotations(mirrored_children)
+        np.testing.assert_allclose(OrientSolver.joint_orients(mirrored_children, mirrored_parents),
+                                   OrientSolver.joint_orients(children, parents), atol=1e-9)
+
+
+def test_mirror_frames_behavior_reflects_every_axis_and_negates_it():
+    frames = random_rotations(10, seed=13)
+    mirrored = OrientSolver.mirror_frames(frames, "x")
+    np.testing.assert_allclose(mirrored, -(frames * [-1.0, 1.0, 1.0]), atol=1e-12)
+    # An aim axis along +X on the left stays along +X on the right, pointing back to the center.
+    np.testing.assert_allclose(OrientSolver.mirror_frames(np.eye(3)[None], "x")[0, 0], [1, 0, 0])
+    np.testing.assert_allclose(OrientSolver.mirror_frames(mirrored, "x"), frames, atol=1e-12)
+
+
+def test_mirror_frames_orientation_mode_copies_the_frames():
+    frames = random_rotations(5, seed=14)
+    original = frames.copy()
+    mirrored = OrientSolver.mirror_frames(frames, "z", behavior=False)
+    np.testing.assert_array_equal(mirrored, original)
+    mirrored[:] = 0.0
+    np.testing.assert_array_equal(frames, original)
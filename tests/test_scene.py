@@ -0,0 +1,48 @@
+"""Tests for SceneIndex against the headless Maya stand-in."""
+
+import pytest
+
+import maya.api.OpenMaya as om2
+
+from benchmarks import fake_maya
+from core.scene import SceneIndex
+
+
+@pytest.fixture
+def rig():
+    scene = fake_maya.new_scene()
+    transforms, shapes = [], []
+    for index in range(3):
+        transform = scene.create_node("transform", f"ctrl{index}")
+        shape = scene.create_node("nurbsCurve", f"ctrl{index}Shape", parent=transform)
+        transforms.append(transform.full_path())
+        shapes.append(shape.full_path())
+    return transforms, shapes
+
+
+def handles(names):
+    selection = om2.MSelectionList()
+    for name in names:
+        selection.add(name)
+    return [om2.MObjectHandle(selection.getDependNode(index)) for index in range(len(names))]
+
+
+def test_shapes_accepts_names_and_handles(rig):
+    transforms, shapes = rig
+    index = SceneIndex()
+    assert index.shapes(transforms) == shapes
+    assert index.shapes(handles(transforms)) == shapes
+    assert (index.misses, index.hits) == (3, 3)
+
+
+def test_shapes_survive_hash_code_collisions(rig, monkeypatch):
+    # Hash codes are not unique; nodes sharing one must still be told apart.
+    monkeypatch.setattr(om2.MObjectHandle, "hashCode", lambda self: 7)
+    transforms, shapes = rig
+    index = SceneIndex()
+    assert index.shapes(transforms) == shapes
+    assert [index.shapes([transform]) for transform in reversed(transforms)] == [[shape] for shape in reversed(shapes)]
+
+    index._on_transform_removed(handles(transforms[:1])[0].object())
+    assert index.shapes(transforms) == shapes
+    assert index.misses == 4
@@ -0,0 +1,96 @@
+"""Tests for the immutable tool settings in core.settings."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import maya.cmds as cmds
+
+from core.settings import OrienterSettings, SpawnerSettings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def clean_option_vars():
+    for settings in (OrienterSettings, SpawnerSettings):
+        settings.clear()
+    yield
+    for settings in (OrienterSettings, SpawnerSettings):
+        settings.clear()
+
+
+def test_defaults_and_derived_values():
+    settings = OrienterSettings()
+    assert settings.orient_order == "xyz"
+    assert settings.secondary_axis == "yup"
+    assert settings.replace(aim_axis="y", up_axis="z", world_up_reverse=True).orient_order == "yzx"
+    assert settings.replace(world_up_reverse=True).secondary_axis == "ydown"
+
+
+def test_settings_are_immutable_and_hashable():
+    settings = SpawnerSettings()
+    with pytest.raises(AttributeError):
+        settings.size = 2.0
+    changed = settings.replace(size=2)
+    assert changed.size == 2.0 and type(changed.size) is float
+    assert settings.size == 1.0
+    assert changed == SpawnerSettings(size=2.0)
+    assert len({settings, changed, SpawnerSettings()}) == 2
+
+
+@pytest.mark.parametrize("values, error", [
+    ({"normal": "w"}, ValueError),
+    ({"size": "big"}, ValueError),
+    ({"color": (1.0, 0.5)}, ValueError),
+    ({"colour": (1.0, 0.5, 0.0)}, TypeError),
+])
+def test_invalid_fields_are_rejected(values, error):
+    with pytest.raises(error):
+        SpawnerSettings(**values)
+
+
+def test_validate_rejects_equal_aim_and_up_axes():
+    with pytest.raises(ValueError):
+        OrienterSettings(aim_axis="y", up_axis="y")
+
+
+def test_lists_become_tuples_with_float_items():
+    settings = SpawnerSettings(color=[1, 0, 0.5])
+    assert settings.color == (1.0, 0.0, 0.5)
+    assert all(type(item) is float for item in settings.color)
+
+
+def test_from_dict_drops_unknown_and_invalid_values():
+    settings = SpawnerSettings.from_dict({"size": 3, "normal": "w", "removed_option": True})
+    assert settings == SpawnerSettings(size=3.0)
+    # Values that are valid one by one but conflict fall back to the defaults.
+    assert OrienterSettings.from_dict({"aim_axis": "z", "up_axis": "x"}).orient_order == "zxy"
+    assert OrienterSettings.from_dict({"aim_axis": "y"}) == OrienterSettings()
+
+
+def test_save_and_load_round_trip():
+    assert OrienterSettings.load() == OrienterSettings()
+    settings = OrienterSettings(mirror_match="position", tweak_angles=(45.0, 0.0, 0.0))
+    settings.save()
+    assert OrienterSettings.load() == settings
+
+    OrienterSettings.clear()
+    assert OrienterSettings.load() == OrienterSettings()
+
+
+@pytest.mark.parametrize("saved", ["not json", json.dumps([1, 2]), json.dumps({"size": "big"})])
+def test_load_ignores_broken_saved_settings(saved):
+    cmds.optionVar(stringValue=(SpawnerSettings.OPTION_VAR, saved))
+    assert SpawnerSettings.load() == SpawnerSettings()
+
+
+def test_importing_settings_does_not_load_the_helpers():
+    script = ("import sys; sys.path.insert(0, sys.argv[1]); "
+              "from benchmarks import fake_maya; fake_maya.install(); import core.settings; "
+              "print(sorted({'core.control', 'core.mirror', 'core.proxy', 'core.mesh'} & set(sys.modules)))")
+    output = subprocess.run([sys.executable, "-c", script, ROOT], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "[]"
@@ -0,0 +1,62 @@
+"""Tests for the mayapy worker pools in core.workers."""
+
+import multiprocessing.spawn
+import os
+import sys
+
+import pytest
+
+from core.workers import WorkerPool
+
+
+def make_file(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "w").close()
+    return str(path)
+
+
+@pytest.mark.parametrize("platform, maya, mayapy", [
+    ("win32", "Maya2025/bin/maya.exe", "Maya2025/bin/mayapy.exe"),
+    ("linux", "maya2025/bin/maya.bin", "maya2025/bin/mayapy"),
+    ("darwin", "Maya.app/Contents/MacOS/Maya", "Maya.app/Contents/bin/mayapy"),
+])
+def test_worker_executable_finds_mayapy_next_to_maya(tmp_path, monkeypatch, platform, maya, mayapy):
+    monkeypatch.delenv("MAYA_LOCATION", raising=False)
+    monkeypatch.setattr(sys, "platform", platform)
+    monkeypatch.setattr(sys, "executable", make_file(tmp_path / maya))
+    expected = make_file(tmp_path / mayapy)
+    assert WorkerPool.worker_executable() == expected
+
+
+def test_worker_executable_prefers_maya_location(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(sys, "executable", make_file(tmp_path / "bin" / "maya.bin"))
+    make_file(tmp_path / "bin" / "mayapy")
+    monkeypatch.setenv("MAYA_LOCATION", str(tmp_path / "location"))
+    expected = make_file(tmp_path / "location" / "bin" / "mayapy")
+    assert WorkerPool.worker_executable() == expected
+
+
+def test_worker_executable_raises_without_mayapy(tmp_path, monkeypatch):
+    monkeypatch.delenv("MAYA_LOCATION", raising=False)
+    monkeypatch.setattr(sys, "executable", make_file(tmp_path / "bin" / "maya.bin"))
+    with pytest.raises(RuntimeError, match="mayapy"):
+        WorkerPool.worker_executable()
+
+
+def test_worker_executable_outside_maya_is_this_interpreter():
+    assert WorkerPool.worker_executable() == sys.executable
+
+
+def interpreter():
+    return sys.executable
+
+
+def test_pool_starts_workers_with_its_executable_only(tmp_path, monkeypatch):
+    link = str(tmp_path / "worker-python")
+    os.symlink(sys.executable, link)
+    monkeypatch.setattr(WorkerPool, "worker_executable", staticmethod(lambda: link))
+    previous = multiprocessing.spawn.get_executable()
+    with WorkerPool.create(1) as executor:
+        assert executor.submit(interpreter).result(timeout=60) == link
+    assert multiprocessing.spawn.get_executable() == previous
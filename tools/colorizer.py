@@ -2,15 +2,20 @@
 
 This module provides a dockable UI that lets you pick among Maya's 32 index
 colors and apply them to the currently selected shapes. It also allows restoring
-Maya defaults and resetting all meshes in the scene.
+Maya defaults and resetting all meshes in the scene, and applying true RGB
+colors or RGB gradients (by hierarchy depth or along a chain) to a selection.
 """
 
-from ui.widgets import CustomPushButton, CustomDialog, QtWidgets
+from ui.widgets import (ColorSwatch, CustomPushButton, CustomDialog, SelectionCountLabel, TaskProgressBar,
+                        QtWidgets, QtGui)
+from ui.scheduler import ChunkedTask
 from core.color import ColorHelper, cmds, om
+from core.attribute import AttributeWriter
+from core.profiling import profiled
 
 
 class ColorizerWidget(CustomDialog):
-    """Dockable UI for applying legacy index colors to selected shapes."""
+    """Dockable UI for applying index or RGB colors to selected shapes."""
 
     OBJECT_NAME = "Colorizer"
 
@@ -21,12 +26,21 @@ class ColorizerWidget(CustomDialog):
 
         self.selected_index = -1
         self.color_buttons = []
-        self.base_styles = []
 
         self.palette_widget = None
+        self.palette_btn_grp = None
         self.grid_layout = None
         self.default_button = None
 
+        self.rgb_start_swatch = None
+        self.rgb_end_swatch = None
+        self.gradient_mode_cmb = None
+        self.apply_rgb_btn = None
+        self.apply_gradient_btn = None
+
+        self.task_progress_bar = None
+        self.selection_count_lbl = None
+
         self.setup_ui()
 
     def create_widgets(self):
@@ -37,25 +51,13 @@ class ColorizerWidget(CustomDialog):
         self.grid_layout.setContentsMargins(0, 0, 0, 0)
 
         columns = ColorHelper.MAX_OVERRIDE_COLORS // 4  # 16 columns, 2 rows
-        color_swatch_size = 30
-
-        for index in range(ColorHelper.MAX_OVERRIDE_COLORS):
-            button = QtWidgets.QPushButton(self.palette_widget)
-            button.setFlat(True)
-            button.setFixedSize(color_swatch_size, color_swatch_size)
-
-            if index == 0:
-                color = [0.6, 0.6, 0.6]
-            else:
-                color = cmds.colorIndex(index, query=True)
 
-            r = int(color[0] * 255)
-            g = int(color[1] * 255)
-            b = int(color[2] * 255)
+        self.palette_btn_grp = QtWidgets.QButtonGroup(self.palette_widget)
+        self.palette_btn_grp.setExclusive(True)
 
-            base_style = f"background-color: rgb({r}, {g}, {b}); border: none;"
-            button.setStyleSheet(base_style)
-            self.base_styles.append(base_style)
+        for index, color in enumerate(ColorHelper.get_palette()):
+            button = ColorSwatch(color, self.palette_widget)
+            self.palette_btn_grp.addButton(button, index)
 
             button.clicked.connect(lambda checked=False, i=index: self.select_color(i))
 
@@ -67,6 +69,30 @@ class ColorizerWidget(CustomDialog):
 
         self.default_button = CustomPushButton("Set to Default")
 
+        # --- RGB Colors ---
+        self.rgb_start_swatch = ColorSwatch((1.0, 0.25, 0.25))
+        self.rgb_start_swatch.setCheckable(False)
+        self.rgb_start_swatch.setToolTip("Click to pick the RGB color (gradient start)")
+        self.rgb_end_swatch = ColorSwatch((0.25, 0.25, 1.0))
+        self.rgb_end_swatch.setCheckable(False)
+        self.rgb_end_swatch.setToolTip("Click to pick the gradient end color")
+
+        self.gradient_mode_cmb = QtWidgets.QComboBox()
+        self.gradient_mode_cmb.addItem("By Depth", "depth")
+        self.gradient_mode_cmb.addItem("Along Chain", "chain")
+        self.gradient_mode_cmb.setToolTip(
+            "Ramp by hierarchy depth, or by distance along the selection order")
+
+        self.apply_rgb_btn = CustomPushButton("Apply RGB")
+        self.apply_gradient_btn = CustomPushButton("Apply Gradient")
+
+        self.task_progress_bar = TaskProgressBar()
+        self.selection_count_lbl = SelectionCountLabel(("transforms",))
+        # Keep the fixed-size dialog's room for the bar while it is hidden.
+        size_policy = self.task_progress_bar.sizePolicy()
+        size_policy.setRetainSizeWhenHidden(True)
+        self.task_progress_bar.setSizePolicy(size_policy)
+
     def create_layout(self):
         """Lay out the palette and action buttons."""
 
@@ -78,15 +104,48 @@ class ColorizerWidget(CustomDialog):
         shape_colorizer_grp = QtWidgets.QGroupBox("Shape Colorizer")
         shape_colorizer_grp.setLayout(shape_colorizer_layout)
 
+        rgb_swatch_layout = QtWidgets.QHBoxLayout()
+        rgb_swatch_layout.addWidget(QtWidgets.QLabel("Start:"))
+        rgb_swatch_layout.addWidget(self.rgb_start_swatch)
+        rgb_swatch_layout.addWidget(QtWidgets.QLabel("End:"))
+        rgb_swatch_layout.addWidget(self.rgb_end_swatch)
+        rgb_swatch_layout.addStretch()
+        rgb_swatch_layout.addWidget(self.gradient_mode_cmb)
+
+        rgb_button_layout = QtWidgets.QHBoxLayout()
+        rgb_button_layout.addWidget(self.apply_rgb_btn)
+        rgb_button_layout.addWidget(self.apply_gradient_btn)
+
+        rgb_colorizer_layout = QtWidgets.QVBoxLayout()
+        rgb_colorizer_layout.addLayout(rgb_swatch_layout)
+        rgb_colorizer_layout.addLayout(rgb_button_layout)
+
+        rgb_colorizer_grp = QtWidgets.QGroupBox("RGB Colorizer")
+        rgb_colorizer_grp.setLayout(rgb_colorizer_layout)
+
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(shape_colorizer_grp)
+        main_layout.addWidget(rgb_colorizer_grp)
+        main_layout.addWidget(self.task_progress_bar)
+        main_layout.addWidget(self.selection_count_lbl)
 
         self.adjustSize()
         self.setFixedSize(self.size())
 
     def create_connections(self):
         """Connect button clicks to actions."""
-        self.default_button.clicked.connect(self.use_defaults)
+        self.default_button.clicked.connect(lambda: self.use_defaults())
+
+        self.rgb_start_swatch.clicked.connect(lambda: self.pick_rgb_color(self.rgb_start_swatch))
+        self.rgb_end_swatch.clicked.connect(lambda: self.pick_rgb_color(self.rgb_end_swatch))
+        self.apply_rgb_btn.clicked.connect(lambda: self.colorize_rgb())
+        self.apply_gradient_btn.clicked.connect(lambda: self.colorize_gradient())
+
+    def showEvent(self, event):
+        """Refresh swatch colors in case Maya's color preferences changed."""
+        for button, color in zip(self.color_buttons, ColorHelper.get_palette()):
+            button.set_color(color)
+        super().showEvent(event)
 
     def select_color(self, index):
         """Set the currently selected color index and update button highlight.
@@ -94,31 +153,49 @@ class ColorizerWidget(CustomDialog):
         Also, immediately applies the color to the current selection.
         """
         self.selected_index = index
-        # Highlight the selected button
-        for i, btn in enumerate(self.color_buttons):
-            if i == index:
-                selected_style = self.base_styles[i].replace("border: none;", "border: 2px solid white;")
-                btn.setStyleSheet(selected_style)
-            else:
-                btn.setStyleSheet(self.base_styles[i])
+        # The exclusive button group only repaints the old and new swatches
+        self.color_buttons[index].setChecked(True)
         # Immediately apply the selected color
         self.colorize()
 
+    @profiled()
     def colorize(self):
         """Apply the selected color index to currently selected shapes."""
-        cmds.undoInfo(openChunk=True)
         if self.selected_index != -1:
             ColorHelper.override_color(self.selected_index)
-        cmds.undoInfo(closeChunk=True)
+
+    def pick_rgb_color(self, swatch):
+        """Open a color dialog and store the chosen color on a swatch.
+
+        Args:
+            swatch (ColorSwatch): The swatch to update.
+        """
+        initial = QtGui.QColor.fromRgbF(*swatch.color())
+        color = QtWidgets.QColorDialog.getColor(initial, self, "Pick RGB Color")
+        if color.isValid():
+            swatch.set_color((color.redF(), color.greenF(), color.blueF()))
+
+    @profiled()
+    def colorize_rgb(self):
+        """Apply the start RGB color to currently selected shapes."""
+        ColorHelper.override_rgb_color(self.rgb_start_swatch.color())
+
+    @profiled()
+    def colorize_gradient(self):
+        """Apply an RGB gradient between the start and end colors to selected shapes."""
+        ColorHelper.override_gradient(self.rgb_start_swatch.color(), self.rgb_end_swatch.color(),
+                                      mode=self.gradient_mode_cmb.currentData())
 
     def keyPressEvent(self, e):
         """Reserved for keyboard shortcut overrides (optional)."""
         pass
 
-    @staticmethod
-    def use_defaults():
+    @profiled()
+    def use_defaults(self):
         """Disable draw overrides on selected shapes, restoring Maya defaults.
 
+        Large selections are processed in chunks with a cancellable progress bar.
+
         Returns:
             bool | None: False if nothing to operate on, otherwise None.
         """
@@ -127,11 +204,17 @@ class ColorizerWidget(CustomDialog):
             om.MGlobal.displayWarning("No shapes nodes selected")
             return False
 
-        for shape in shapes:
-            try:
-                cmds.setAttr(f"{shape}.overrideEnabled", False)
-            except RuntimeError:
-                om.MGlobal.displayWarning(f"Failed to restore defaults: {shape}")
+        if len(shapes) >= ChunkedTask.MIN_ITEMS:
+            task = ChunkedTask.write_attribute(shapes, "overrideEnabled", False,
+                                               failure_message="Failed to restore defaults",
+                                               label="Restoring defaults", parent=self)
+            self.task_progress_bar.run(task)
+            return None
+
+        writer = AttributeWriter()
+        writer.set_many(shapes, "overrideEnabled", False)
+        writer.commit()
+        writer.report_failures("Failed to restore defaults")
         return None
 
 if __name__ == "__main__":
@@ -8,15 +8,28 @@ orient selected joints consistently. It supports:
 - Batch orientation on selected joints or across a hierarchy
 - Manual local axis tweak and freezing
 - Local axis display toggling for selection, hierarchy, or the entire scene
+- Optional live preview of the resulting axes while settings change
+- Orientation check listing flipped, mis-aimed or skewed joints, with a batched fix
+- Mirroring orientations to the other side, matching joints by name or position
+- Settings restored in the next session (see OrienterSettings)
 """
 
+from core.analysis import OrientAnalyzer
 from core.joint import JointHelper, cmds, om
-from ui.widgets import CustomPushButton, CustomLabel, CustomSpinBox, CustomDialog, QtWidgets
+from core.mirror import MirrorHelper
+from core.profiling import profiled
+from core.rules import OrientRules
+from core.settings import OrienterSettings
+from ui.widgets import (CustomPushButton, CustomLabel, CustomSpinBox, CustomDialog, SelectionCountLabel,
+                        TaskProgressBar, QtWidgets, QtCore, signals_blocked)
+from ui.preview import OrientPreview
+from ui.scheduler import ChunkedTask
 
 
 class OrienterWidget(CustomDialog):
     """Dockable UI for orienting joints and adjusting their local axes."""
     OBJECT_NAME = "Orienter"
+    SETTINGS_CLASS = OrienterSettings
 
     def __init__(self):
         super().__init__()
@@ -43,9 +56,13 @@ class OrienterWidget(CustomDialog):
         self.world_up_reverse_cb = None
 
         self.auto_orient_up_axis_cb = None
+        self.live_preview_cb = None
+        self.orient_preview = None
 
         self.orient_joint_btn = None
         self.orient_joint_to_world_btn = None
+        self.save_rules_btn = None
+        self.batch_orient_btn = None
 
         self.local_axis_tweak_x_label = None
         self.local_axis_tweak_y_label = None
@@ -68,6 +85,20 @@ class OrienterWidget(CustomDialog):
         self.show_all_local_axis_btn = None
         self.hide_all_local_axis_btn = None
 
+        self.analyze_btn = None
+        self.fix_issues_btn = None
+        self.issues_list = None
+        self.analyzed_joints = []
+
+        self.mirror_match_cmb = None
+        self.mirror_plane_cmb = None
+        self.mirror_direction_cmb = None
+        self.mirror_behavior_cb = None
+        self.mirror_btn = None
+
+        self.task_progress_bar = None
+        self.selection_count_lbl = None
+
         self.setup_ui()
 
     def create_widgets(self):
@@ -118,9 +149,19 @@ class OrienterWidget(CustomDialog):
         self.auto_orient_up_axis_cb.setToolTip(
             "Guess the Up Axis based on the average Up Vector of the selected joints.")
 
+        # --- Live Preview ---
+        self.live_preview_cb = QtWidgets.QCheckBox("Live Preview")
+        self.live_preview_cb.setToolTip(
+            "Draw the resulting axes in the viewport while settings change, without editing the joints.")
+        self.orient_preview = OrientPreview(self)
+
         # --- Action Button ---
         self.orient_joint_btn = CustomPushButton("Orient Joints")
         self.orient_joint_to_world_btn = CustomPushButton("Orient Joints to World")
+        self.save_rules_btn = CustomPushButton("Add to Rules...")
+        self.save_rules_btn.setToolTip("Save the current settings as a rule for each selected chain root")
+        self.batch_orient_btn = CustomPushButton("Batch Orient...")
+        self.batch_orient_btn.setToolTip("Orient the whole rig from a rules file")
 
         # --- Local Axis Tweaks ---
         self.local_axis_tweak_x_label = CustomLabel("X", "#FF7474")
@@ -145,6 +186,43 @@ class OrienterWidget(CustomDialog):
         self.show_all_local_axis_btn = CustomPushButton("Show All")
         self.hide_all_local_axis_btn = CustomPushButton("Hide All")
 
+        # --- Orientation Check ---
+        self.analyze_btn = CustomPushButton("Analyze")
+        self.analyze_btn.setToolTip("Check the target joints (or the whole scene) for flipped up axes, "
+                                    "mis-aimed joints and scale/shear")
+        self.fix_issues_btn = CustomPushButton("Fix Issues")
+        self.fix_issues_btn.setToolTip("Re-aim mis-aimed joints and turn flipped joints back with the current "
+                                       "settings, in one undo step")
+        self.fix_issues_btn.setEnabled(False)
+        self.issues_list = QtWidgets.QListWidget()
+        self.issues_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.issues_list.setMaximumHeight(120)
+        self.issues_list.hide()
+
+        # --- Mirror Orientation ---
+        self.mirror_match_cmb = QtWidgets.QComboBox()
+        self.mirror_match_cmb.addItem("By Name", "name")
+        self.mirror_match_cmb.addItem("By Position", "position")
+        self.mirror_match_cmb.setToolTip("Pair joints by side tokens (L_/R_, left/right...) "
+                                         "or by mirrored world position")
+        self.mirror_plane_cmb = QtWidgets.QComboBox()
+        self.mirror_plane_cmb.addItem("YZ", "x")
+        self.mirror_plane_cmb.addItem("XZ", "y")
+        self.mirror_plane_cmb.addItem("XY", "z")
+        self.mirror_direction_cmb = QtWidgets.QComboBox()
+        self.mirror_direction_cmb.addItem("Left (+) to Right (-)", True)
+        self.mirror_direction_cmb.addItem("Right (-) to Left (+)", False)
+        self.mirror_behavior_cb = QtWidgets.QCheckBox("Behavior")
+        self.mirror_behavior_cb.setChecked(True)
+        self.mirror_behavior_cb.setToolTip("Mirror like Maya's Mirror Joint behavior option: the same rotation "
+                                           "turns both sides in opposite directions")
+        self.mirror_btn = CustomPushButton("Mirror Orientation")
+        self.mirror_btn.setToolTip("Orient the counterparts of the target joints (or of every source-side joint "
+                                   "when nothing is selected) as their mirror images, in one undo step")
+
+        self.task_progress_bar = TaskProgressBar()
+        self.selection_count_lbl = SelectionCountLabel(("joints",))
+
     def create_layout(self):
         """Create the layouts and arrange widgets."""
 
@@ -182,9 +260,15 @@ class OrienterWidget(CustomDialog):
         orientation_layout.addRow("Up Axis:", up_layout)
         orientation_layout.addRow("World Up Dir:", world_up_layout)
         orientation_layout.addRow("", self.auto_orient_up_axis_cb)
+        orientation_layout.addRow("", self.live_preview_cb)
         orientation_layout.addRow(self.orient_joint_btn)
         orientation_layout.addRow(self.orient_joint_to_world_btn)
 
+        rules_layout = QtWidgets.QHBoxLayout()
+        rules_layout.addWidget(self.save_rules_btn)
+        rules_layout.addWidget(self.batch_orient_btn)
+        orientation_layout.addRow(rules_layout)
+
         orientation_grp = QtWidgets.QGroupBox("Orientation Settings")
         orientation_grp.setLayout(orientation_layout)
 
@@ -219,6 +303,33 @@ class OrienterWidget(CustomDialog):
         visibility_grp = QtWidgets.QGroupBox("Local Axis Visibility")
         visibility_grp.setLayout(local_axis_visibility_layout)
 
+        # --- Orientation Check ---
+        orientation_check_button_layout = QtWidgets.QHBoxLayout()
+        orientation_check_button_layout.addWidget(self.analyze_btn)
+        orientation_check_button_layout.addWidget(self.fix_issues_btn)
+
+        orientation_check_layout = QtWidgets.QVBoxLayout()
+        orientation_check_layout.addLayout(orientation_check_button_layout)
+        orientation_check_layout.addWidget(self.issues_list)
+
+        orientation_check_grp = QtWidgets.QGroupBox("Orientation Check")
+        orientation_check_grp.setLayout(orientation_check_layout)
+
+        # --- Mirror Orientation ---
+        mirror_options_layout = QtWidgets.QHBoxLayout()
+        mirror_options_layout.addWidget(self.mirror_match_cmb)
+        mirror_options_layout.addWidget(QtWidgets.QLabel("Plane:"))
+        mirror_options_layout.addWidget(self.mirror_plane_cmb)
+        mirror_options_layout.addWidget(self.mirror_behavior_cb)
+
+        mirror_layout = QtWidgets.QVBoxLayout()
+        mirror_layout.addLayout(mirror_options_layout)
+        mirror_layout.addWidget(self.mirror_direction_cmb)
+        mirror_layout.addWidget(self.mirror_btn)
+
+        mirror_grp = QtWidgets.QGroupBox("Mirror Orientation")
+        mirror_grp.setLayout(mirror_layout)
+
         # --- Main Vertical Layout ---
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -226,6 +337,10 @@ class OrienterWidget(CustomDialog):
         main_layout.addWidget(orientation_grp)
         main_layout.addWidget(local_axis_tweak_grp)
         main_layout.addWidget(visibility_grp)
+        main_layout.addWidget(orientation_check_grp)
+        main_layout.addWidget(mirror_grp)
+        main_layout.addWidget(self.task_progress_bar)
+        main_layout.addWidget(self.selection_count_lbl)
 
     def create_connections(self):
         """Connect widget signals to slots."""
@@ -238,8 +353,13 @@ class OrienterWidget(CustomDialog):
         self.up_y_rb.toggled.connect(self.handle_axis_orientation_toggle)
         self.up_z_rb.toggled.connect(self.handle_axis_orientation_toggle)
 
+        self.settings_changed.connect(self.update_preview)
+        self.live_preview_cb.toggled.connect(self.toggle_live_preview)
+
         self.orient_joint_btn.clicked.connect(lambda: self.orient_joints(reset_to_world=False))
         self.orient_joint_to_world_btn.clicked.connect(lambda: self.orient_joints(reset_to_world=True))
+        self.save_rules_btn.clicked.connect(lambda: self.save_rules())
+        self.batch_orient_btn.clicked.connect(lambda: self.batch_orient())
 
         # --- local axis tweaks ---
         self.local_axis_tweak_add_x_btn.clicked.connect(lambda: self.rotate_local_axis_joint("x", 1))
@@ -265,190 +385,321 @@ class OrienterWidget(CustomDialog):
         self.hide_all_local_axis_btn.clicked.connect(
             lambda: self.toggle_local_axis_visibility(scope="all", visible=False))
 
+        # --- Orientation Check ---
+        self.analyze_btn.clicked.connect(lambda: self.analyze_orientation())
+        self.fix_issues_btn.clicked.connect(lambda: self.fix_orientation_issues())
+        self.issues_list.itemSelectionChanged.connect(self.select_issue_joints)
+
+        # --- Mirror Orientation ---
+        self.mirror_btn.clicked.connect(lambda: self.mirror_orientation())
+
     # ----------------------------------ORIENTATION SETTINGS-------------------------------------------------
-    def get_axis_orientation_settings(self):
+    def settings_widgets(self):
+        """Return the widgets whose values make up the OrienterSettings."""
+        return [self.target_hierarchy_rb, self.aim_btn_grp, self.up_btn_grp, self.world_up_btn_grp,
+                self.world_up_reverse_cb, self.auto_orient_up_axis_cb,
+                self.local_axis_tweak_x_sb, self.local_axis_tweak_y_sb, self.local_axis_tweak_z_sb,
+                self.mirror_match_cmb, self.mirror_plane_cmb, self.mirror_direction_cmb, self.mirror_behavior_cb]
+
+    def read_settings(self):
         """
-        Get the axis orientation settings based on the current state of the widgets.
-        :return str: The axis orientation settings to be used for joint's orientation.
+        Reads the widgets into new settings.
+        :return OrienterSettings: The settings shown by the widgets.
         """
-
-        aim_up_map = {
-            ('X', 'Y'): 'xyz',
-            ('X', 'Z'): 'xzy',
-            ('Y', 'Z'): 'yzx',
-            ('Y', 'X'): 'yxz',
-            ('Z', 'X'): 'zxy',
-            ('Z', 'Y'): 'zyx'
-        }
-
-        aim = self.aim_btn_grp.checkedButton().text()
-        up = self.up_btn_grp.checkedButton().text()
-
-        return aim_up_map.get((aim, up), '')
-
-    def get_world_up_settings(self):
+        return OrienterSettings(
+            target_hierarchy=self.target_hierarchy_rb.isChecked(),
+            aim_axis=self.aim_btn_grp.checkedButton().text().lower(),
+            up_axis=self.up_btn_grp.checkedButton().text().lower(),
+            world_up_axis=self.world_up_btn_grp.checkedButton().text().lower(),
+            world_up_reverse=self.world_up_reverse_cb.isChecked(),
+            auto_orient=self.auto_orient_up_axis_cb.isChecked(),
+            tweak_angles=(self.local_axis_tweak_x_sb.value(), self.local_axis_tweak_y_sb.value(),
+                          self.local_axis_tweak_z_sb.value()),
+            mirror_match=self.mirror_match_cmb.currentData(),
+            mirror_axis=self.mirror_plane_cmb.currentData(),
+            mirror_from_positive=self.mirror_direction_cmb.currentIndex() == 0,
+            mirror_behavior=self.mirror_behavior_cb.isChecked())
+
+    def write_settings(self, settings):
         """
-        Get the world up settings based on the current state of the widgets.
-        :return str: The world up axis direction in either positive or negative value.
+        Shows settings in the widgets.
+        :param OrienterSettings settings: The settings to show.
         """
-
-        for btn, axis in [(self.world_up_x_btn, 'x'),
-                          (self.world_up_y_btn, 'y'),
-                          (self.world_up_z_btn, 'z')]:
-            if btn.isChecked():
-                return axis + ('down' if self.world_up_reverse_cb.isChecked() else 'up')
-        return 'none' + ('down' if self.world_up_reverse_cb.isChecked() else 'up')
+        self.target_hierarchy_rb.setChecked(settings.target_hierarchy)
+        self.target_selected_rb.setChecked(not settings.target_hierarchy)
+        for group, axis in ((self.aim_btn_grp, settings.aim_axis),
+                            (self.up_btn_grp, settings.up_axis),
+                            (self.world_up_btn_grp, settings.world_up_axis)):
+            for button in group.buttons():
+                if button.text().lower() == axis:
+                    button.setChecked(True)
+        self.world_up_reverse_cb.setChecked(settings.world_up_reverse)
+        self.auto_orient_up_axis_cb.setChecked(settings.auto_orient)
+
+        for spin_box, angle in zip((self.local_axis_tweak_x_sb, self.local_axis_tweak_y_sb,
+                                    self.local_axis_tweak_z_sb), settings.tweak_angles):
+            spin_box.setValue(angle)
+
+        self.mirror_match_cmb.setCurrentIndex(self.mirror_match_cmb.findData(settings.mirror_match))
+        self.mirror_plane_cmb.setCurrentIndex(self.mirror_plane_cmb.findData(settings.mirror_axis))
+        self.mirror_direction_cmb.setCurrentIndex(0 if settings.mirror_from_positive else 1)
+        self.mirror_behavior_cb.setChecked(settings.mirror_behavior)
 
     def handle_axis_orientation_toggle(self):
         """
         If Aim and Up axes are set to the same value, automatically
         adjust the other axis to prevent an invalid state.
         """
-        sender = self.sender()
-
-        self.disconnect_axis_signals()
-
-        axis_cycle = {'X': 'Y', 'Y': 'Z', 'Z': 'X'}
-
         aim_axis = self.aim_btn_grp.checkedButton().text()
         up_axis = self.up_btn_grp.checkedButton().text()
+        if aim_axis != up_axis:
+            return
 
-        if aim_axis == up_axis:
-            if sender in self.aim_btn_grp.buttons():
-                new_up_axis = axis_cycle[up_axis]
-                if new_up_axis == 'X':
-                    self.up_x_rb.setChecked(True)
-                elif new_up_axis == 'Y':
-                    self.up_y_rb.setChecked(True)
-                else:
-                    self.up_z_rb.setChecked(True)
-            else:
-                new_aim_axis = axis_cycle[aim_axis]
-                if new_aim_axis == 'X':
-                    self.aim_x_rb.setChecked(True)
-                elif new_aim_axis == 'Y':
-                    self.aim_y_rb.setChecked(True)
-                else:
-                    self.aim_z_rb.setChecked(True)
-
-        self.reconnect_axis_signals()
-
-    def disconnect_axis_signals(self):
-        """Disconnects all axis-toggled signals to prevent recursion."""
-        for button in self.aim_btn_grp.buttons() + self.up_btn_grp.buttons():
-            button.toggled.disconnect(self.handle_axis_orientation_toggle)
-
-    def reconnect_axis_signals(self):
-        """Reconnects all axis-toggled signals."""
-        for button in self.aim_btn_grp.buttons() + self.up_btn_grp.buttons():
-            button.toggled.connect(self.handle_axis_orientation_toggle)
+        # Move the axis the user did not just pick to the next free one.
+        group = self.up_btn_grp if self.sender() in self.aim_btn_grp.buttons() else self.aim_btn_grp
+        next_axis = {'X': 'Y', 'Y': 'Z', 'Z': 'X'}[aim_axis]
+        with signals_blocked(group, *group.buttons()):
+            for button in group.buttons():
+                if button.text() == next_axis:
+                    button.setChecked(True)
+        self.refresh_settings()
 
+    @profiled()
     def orient_joints(self, reset_to_world=False):
         """
         Orients all selected joints based on the selected options.
         """
-        cmds.undoInfo(openChunk=True)
+        settings = self.settings()
+        axis_orientation_settings = 'none' if reset_to_world else settings.orient_order
 
-        select_children = False
-        if self.target_hierarchy_rb.isChecked():
-            select_children = True
+        selected_joints = JointHelper.get_joints(hierarchy=False)
+        if not selected_joints:
+            om.MGlobal.displayWarning("Please select one or more joints to orient.")
+            return
 
-        auto_orient_enable = False
-        orient_tip = False
-        if self.auto_orient_up_axis_cb.isChecked():
-            auto_orient_enable = True
-        else:
-            orient_tip = True
+        try:
+            # Leaf joints always end up with a zeroed jointOrient, which covers
+            # the "orient tip" behaviour when auto orient is disabled.
+            JointHelper.orient_joints(selected_joints,
+                                      orient_order=axis_orientation_settings,
+                                      secondary_axis=settings.secondary_axis,
+                                      auto_orient=settings.auto_orient,
+                                      children=settings.target_hierarchy)
+        except RuntimeError as e:
+            om.MGlobal.displayWarning(f"Orientation failed: {str(e)}.")
 
-        if reset_to_world:
-            axis_orientation_settings = 'none'
-        else:
-            axis_orientation_settings = self.get_axis_orientation_settings()
+        self.orient_preview.invalidate()
 
-        selected_joints = JointHelper.get_joints(hierarchy=False)
+    # ----------------------------------RULES-------------------------------------------------
+    def save_rules(self):
+        """
+        Adds a rule with the current settings for every selected joint (as a chain
+        root) to a rules file, creating the file if needed.
+        """
+        selected_joints = JointHelper.get_joints()
         if not selected_joints:
-            om.MGlobal.displayWarning("Please select one or more joints to orient.")
-            cmds.undoInfo(closeChunk=True)
+            om.MGlobal.displayWarning("Please select the root joint of each chain to add.")
+            return
+
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Add to Rules File", "orient_rules.json",
+                                                        "JSON (*.json)",
+                                                        options=QtWidgets.QFileDialog.Option.DontConfirmOverwrite)
+        if not path:
             return
-        JointHelper.freeze_joint_orientation(selected_joints)
 
         try:
-            if selected_joints:
-                cmds.joint(selected_joints, edit=True,
-                           orientJoint=axis_orientation_settings,
-                           secondaryAxisOrient=self.get_world_up_settings(),
-                           autoOrientSecondaryAxis=auto_orient_enable,
-                           children=select_children,
-                           zeroScaleOrient=True)
-                if orient_tip:
-                    joint_list = cmds.ls(selection=True, type='joint')
-                    joint_tip = cmds.listRelatives(joint_list, allDescendents=True)[0]
-                    cmds.setAttr(f"{joint_tip}.jointOrient", 0, 0, 0)
-            else:
-                om.MGlobal.displayWarning("Please select a joint.")
-                cmds.undoInfo(closeChunk=True)
-                return
+            rules = OrientRules.load(path)
+        except FileNotFoundError:
+            rules = OrientRules()
+        except ValueError as e:
+            om.MGlobal.displayError(str(e))
+            return
 
-        except RuntimeError as e:
-            om.MGlobal.displayWarning(
-                f"Orientation failed: {str(e)}. Select multiple joints or enable 'Auto Orient Up Axis'.")
-            cmds.undoInfo(closeChunk=True)
+        settings = self.settings()
+        for joint in selected_joints:
+            rules.add_rule(settings.orient_order, settings.secondary_axis, settings.auto_orient,
+                           root=joint.rpartition("|")[2])
+        rules.save(path)
+        om.MGlobal.displayInfo(f"Added {len(selected_joints)} rule(s) to {path}")
+
+    @profiled()
+    def batch_orient(self):
+        """
+        Orients every joint in the scene matched by a rules file, in one undo step.
+        """
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Batch Orient from Rules", "", "JSON (*.json)")
+        if not path:
             return
-        finally:
-            cmds.undoInfo(closeChunk=True)
+
+        try:
+            written = OrientRules.load(path).apply()
+        except (ValueError, RuntimeError) as e:
+            om.MGlobal.displayError(f"Batch orient failed: {str(e)}.")
+            return
+
+        om.MGlobal.displayInfo(f"Batch oriented {written} joints.")
+        self.orient_preview.invalidate()
+
+    # ----------------------------------LIVE PREVIEW-------------------------------------------------
+    def toggle_live_preview(self, enabled):
+        """
+        Turns the viewport orientation preview on or off.
+
+        Args:
+            enabled (bool): True to start previewing the selected joints.
+        """
+        self.orient_preview.set_enabled(enabled)
+        self.update_preview()
+
+    def update_preview(self, *args):
+        """
+        Requests a new preview for the selected joints with the current settings.
+        The request is debounced and solved off the UI thread by OrientPreview.
+        """
+        if not self.orient_preview.enabled:
+            return
+
+        settings = self.settings()
+        self.orient_preview.request(JointHelper.get_joints(),
+                                    orient_order=settings.orient_order,
+                                    secondary_axis=settings.secondary_axis,
+                                    auto_orient=settings.auto_orient,
+                                    children=settings.target_hierarchy)
+
+    def hideEvent(self, event):
+        """Stop previewing when the tool is hidden so the overlay never lingers."""
+        self.live_preview_cb.setChecked(False)
+        super().hideEvent(event)
 
     # ----------------------------------LOCAL AXIS TWEAKS-------------------------------------------------
+    @profiled()
     def rotate_local_axis_joint(self, axis, direction):
         """
         Rotates all selected joints around a specified local axis by a value.
-        The new rotation is then frozen.
+        The new rotation is then frozen; child joints keep their world transforms.
 
         Args:
             axis (str): The local axis to rotate around ('x', 'y', or 'z').
             direction (int): The direction of rotation (1 for adding, -1 for subtracting).
         """
 
-        if self.target_hierarchy_rb.isChecked():
-            selected_joints = JointHelper.get_joints(hierarchy=True)
-        else:
-            selected_joints = JointHelper.get_joints()
-
+        settings = self.settings()
+        selected_joints = JointHelper.get_joints(hierarchy=settings.target_hierarchy)
         if not selected_joints:
             om.MGlobal.displayWarning("Please select one or more joints to rotate.")
             return
 
-        cmds.undoInfo(openChunk=True)
+        axis_index = "xyz".index(axis)
+        apply_rotation = [0, 0, 0]
+        apply_rotation[axis_index] = settings.tweak_angles[axis_index] * direction
+
+        JointHelper.rotate_local_axes(selected_joints, apply_rotation)
+        self.orient_preview.invalidate()
+
+    # ----------------------------------ORIENTATION CHECK-------------------------------------------------
+    @profiled()
+    def analyze_orientation(self):
+        """
+        Checks the target joints, or every joint when nothing is selected, and lists
+        and selects the offenders.
+        """
+        joints = JointHelper.get_joints(hierarchy=self.settings().target_hierarchy)
+        if not joints:
+            joints = JointHelper.get_joints(all_joints=True)
+        if not joints:
+            om.MGlobal.displayWarning("No joints to analyze.")
+            return
+
+        self.analyzed_joints = joints
+        report = OrientAnalyzer.analyze(joints, self.settings().orient_order)
+        self.show_report(report)
+
+    def show_report(self, report):
+        """
+        Lists the offenders of an analysis and selects them in the scene.
+
+        Args:
+            report (OrientReport): The analysis to show.
+        """
+        self.issues_list.clear()
+        for index in report.offenders.nonzero()[0]:
+            name = report.arrays.names[index]
+            item = QtWidgets.QListWidgetItem(f"{name.rpartition('|')[2]}: {', '.join(report.issues(index))}")
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, name)
+            item.setToolTip(name)
+            self.issues_list.addItem(item)
+
+        offenders = report.offender_names
+        self.issues_list.setVisible(bool(offenders))
+        self.fix_issues_btn.setEnabled(bool((report.flipped | report.misaimed).any()))
+        if offenders:
+            cmds.select(offenders, replace=True)
+            om.MGlobal.displayWarning(report.summary())
+        else:
+            om.MGlobal.displayInfo(report.summary())
+
+    def select_issue_joints(self):
+        """Selects the joints of the highlighted issues."""
+        names = [item.data(QtCore.Qt.ItemDataRole.UserRole) for item in self.issues_list.selectedItems()]
+        names = [name for name in names if cmds.objExists(name)]
+        if names:
+            cmds.select(names, replace=True)
+
+    @profiled()
+    def fix_orientation_issues(self):
+        """
+        Fixes flipped and mis-aimed joints found by the last analysis in one undo step,
+        then analyzes them again.
+        """
+        joints = [joint for joint in self.analyzed_joints if cmds.objExists(joint)]
+        if not joints:
+            om.MGlobal.displayWarning("Run Analyze first.")
+            return
+
+        settings = self.settings()
+        _, written = OrientAnalyzer.fix(joints, settings.orient_order, settings.secondary_axis, settings.auto_orient)
+
+        om.MGlobal.displayInfo(f"Fixed {written} joints.")
+        self.show_report(OrientAnalyzer.analyze(joints, settings.orient_order))
+
+    # ----------------------------------MIRROR ORIENTATION-------------------------------------------------
+    @profiled()
+    def mirror_orientation(self):
+        """
+        Orients the counterparts of the target joints as their mirror images. Pairs are
+        searched among every joint in the scene; with nothing selected, every joint on
+        the source side is mirrored.
+        """
+        settings = self.settings()
+        selected_joints = JointHelper.get_joints(hierarchy=settings.target_hierarchy)
+        all_joints = JointHelper.get_joints(all_joints=True)
+        if not all_joints:
+            om.MGlobal.displayWarning("No joints to mirror.")
+            return
 
         try:
-            apply_rotation = (0, 0, 0)
-            if axis == "x":
-                rotation_value = self.local_axis_tweak_x_sb.value()
-                apply_rotation = (rotation_value * direction, 0, 0)
-            elif axis == "y":
-                rotation_value = self.local_axis_tweak_y_sb.value()
-                apply_rotation = (0, rotation_value * direction, 0)
-            elif axis == "z":
-                rotation_value = self.local_axis_tweak_z_sb.value()
-                apply_rotation = (0, 0, rotation_value * direction)
-
-            for joint in selected_joints:
-                cmds.xform(joint, relative=True, objectSpace=True, rotateAxis=apply_rotation)
-                JointHelper.freeze_joint_orientation(joint)
-        finally:
-            cmds.undoInfo(closeChunk=True)
+            MirrorHelper.mirror_orientations(all_joints,
+                                             axis=settings.mirror_axis,
+                                             match=settings.mirror_match,
+                                             from_positive=settings.mirror_from_positive,
+                                             behavior=settings.mirror_behavior,
+                                             sources=selected_joints or None)
+        except RuntimeError as e:
+            om.MGlobal.displayWarning(f"Mirroring failed: {str(e)}.")
+
+        self.orient_preview.invalidate()
 
     # ----------------------------------JOINTS VISIBILITY-------------------------------------------------
-    @staticmethod
-    def toggle_local_axis_visibility(scope, visible):
+    @profiled()
+    def toggle_local_axis_visibility(self, scope, visible):
         """
         Shows or hides the local axis of joints based on the specified scope.
+        Large sets of joints are processed in chunks with a cancellable progress bar.
 
         Args:
             scope (str): The scope of joints to affect ("selected", "hierarchy", or "all").
             visible (bool): The visibility state to set (True for show, False for hide).
         """
-        cmds.undoInfo(stateWithoutFlush=False)
-
         joints_to_affect = []
 
         if scope == "selected":
@@ -462,10 +713,15 @@ class OrienterWidget(CustomDialog):
             om.MGlobal.displayWarning("No joints selected.")
             return
 
-        for joint in joints_to_affect:
-            cmds.setAttr(f"{joint}.displayLocalAxis", visible)
+        if len(joints_to_affect) >= ChunkedTask.MIN_ITEMS:
+            # Display toggles stay out of the undo queue, like the direct path below.
+            task = ChunkedTask.write_attribute(joints_to_affect, "displayLocalAxis", visible, undoable=False,
+                                               failure_message="Failed to set local axis display",
+                                               label="Showing axes" if visible else "Hiding axes", parent=self)
+            self.task_progress_bar.run(task)
+            return
 
-        cmds.undoInfo(stateWithoutFlush=True)
+        JointHelper.set_local_axis_visibility(joints_to_affect, visible, undoable=False)
 
 
 if __name__ == "__main__":
@@ -4,15 +4,256 @@ This module provides functionality to export ZBrush polygons with polygroups to
 as polygons with vertex colors using USD (Universal Scene Description) as the
 intermediate format. The tool preserves polygroup information by converting it to
 vertex colors that can be manipulated in Maya.
+
+Meshes are streamed from the USD file one at a time as NumPy arrays and built
+with a single MFnMesh.create call each, so multi-million polygon sculpts import
+in time proportional to their size while holding about one copy of the mesh.
+Imported arrays are kept in a memory-mapped MeshCache, so importing the same
+file again skips parsing it and an edited file only rewrites the arrays that
+changed. A whole folder of subtools can be imported at once: the files are
+parsed into the cache by a pool of worker processes while Maya builds the
+meshes of each finished file, with progress and cancel in the dock.
+
+Exporting reads each selected mesh straight from MFnMesh into NumPy, turns its
+polygroup color set back into polygroup IDs and writes a USD file ZBrush can
+import, without building Python objects per vertex.
 """
 
+import shutil
+import tempfile
+
+from ui.widgets import CustomPushButton, CustomDialog, TaskProgressBar, QtWidgets
+from ui.scheduler import FutureTask
+from core.mesh import MeshHelper, cmds, om
+from core.meshcache import MeshCache
+from core.profiling import profiled
+from core.workers import WorkerPool
+
+
+class PolyporterWidget(CustomDialog):
+    """Dockable UI exchanging USD meshes with ZBrush, with polygroups as vertex colors."""
+
+    OBJECT_NAME = "PolyPorter"
+
+    def __init__(self, parent=None):
+        """Construct the UI and set up an internal state."""
+        super().__init__(parent)
+        self.setObjectName(self.OBJECT_NAME)
+
+        self.polygroup_colors_cb = None
+        self.use_cache_cb = None
+        self.import_btn = None
+        self.import_folder_btn = None
+        self.export_btn = None
+
+        self.task_progress_bar = None
+
+        self.mesh_cache = MeshCache()
+
+        self.setup_ui()
+
+    def create_widgets(self):
+        """Create the import/export options and buttons."""
+        self.polygroup_colors_cb = QtWidgets.QCheckBox("Polygroups as Vertex Colors")
+        self.polygroup_colors_cb.setChecked(True)
+        self.polygroup_colors_cb.setToolTip(f"Add a '{MeshHelper.POLYGROUP_COLOR_SET}' color set coloring "
+                                            f"each face by its polygroup")
+
+        self.use_cache_cb = QtWidgets.QCheckBox("Use Import Cache")
+        self.use_cache_cb.setChecked(True)
+        self.use_cache_cb.setToolTip(f"Re-import unchanged files from the binary cache in {self.mesh_cache.root}")
+
+        self.import_btn = CustomPushButton("Import USD...")
+        self.import_folder_btn = CustomPushButton("Import Folder...")
+        self.import_folder_btn.setToolTip("Import every USD file of a folder, parsing them in parallel")
+
+        self.export_btn = CustomPushButton("Export Selected...")
+        self.export_btn.setToolTip(f"Write the selected meshes to USD, turning the "
+                                   f"'{MeshHelper.POLYGROUP_COLOR_SET}' color set back into polygroups")
+
+        self.task_progress_bar = TaskProgressBar()
+
+    def create_layout(self):
+        """Lay out the import/export options and buttons."""
+        import_layout = QtWidgets.QVBoxLayout()
+        import_layout.addWidget(self.polygroup_colors_cb)
+        import_layout.addWidget(self.use_cache_cb)
+
+        import_button_layout = QtWidgets.QHBoxLayout()
+        import_button_layout.addWidget(self.import_btn)
+        import_button_layout.addWidget(self.import_folder_btn)
+        import_layout.addLayout(import_button_layout)
+
+        import_grp = QtWidgets.QGroupBox("Import")
+        import_grp.setLayout(import_layout)
+
+        main_layout = QtWidgets.QVBoxLayout(self)
+        export_layout = QtWidgets.QVBoxLayout()
+        export_layout.addWidget(self.export_btn)
+
+        export_grp = QtWidgets.QGroupBox("Export")
+        export_grp.setLayout(export_layout)
+
+        main_layout.addWidget(import_grp)
+        main_layout.addWidget(export_grp)
+        main_layout.addStretch()
+        main_layout.addWidget(self.task_progress_bar)
+
+    def create_connections(self):
+        """Connect button clicks to actions."""
+        self.import_btn.clicked.connect(lambda: self.import_usd())
+        self.import_folder_btn.clicked.connect(lambda: self.import_folder())
+        self.export_btn.clicked.connect(lambda: self.export_usd())
+
+    @profiled()
+    def import_usd(self):
+        """Import every mesh of a USD file picked by the user and select them."""
+        # pxr is only loaded with Maya's USD plug-in, so import the reader on demand.
+        try:
+            from core.usd import UsdMeshReader
+        except ImportError:
+            om.MGlobal.displayError("USD support is not available; load the mayaUsdPlugin and try again.")
+            return
+
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import USD", "", UsdMeshReader.FILE_FILTER)
+        if not path:
+            return
+
+        options = {"up_axis": cmds.upAxis(query=True, axis=True),
+                   "meters_per_unit": MeshHelper.scene_meters_per_unit()}
+        if self.use_cache_cb.isChecked():
+            source = self.mesh_cache.read(path, UsdMeshReader.read, **options)
+        else:
+            source = UsdMeshReader.read(path, **options)
+
+        try:
+            meshes = MeshHelper.create_meshes(source, self.polygroup_colors_cb.isChecked())
+        except (ValueError, OSError) as e:
+            om.MGlobal.displayError(str(e))
+            return
+
+        if not meshes:
+            om.MGlobal.displayWarning(f"No meshes found in {path}")
+            return
+        cmds.select(meshes, replace=True)
+        if self.use_cache_cb.isChecked() and self.mesh_cache.last_hit:
+            om.MGlobal.displayInfo(f"Imported {len(meshes)} mesh(es) from the cache of {path}")
+        else:
+            om.MGlobal.displayInfo(f"Imported {len(meshes)} mesh(es) from {path}")
+
+    @profiled()
+    def import_folder(self):
+        """Import every USD file of a folder picked by the user.
+
+        Worker processes parse the files into a MeshCache, largest first, and
+        the meshes of each parsed file are built on the main thread as soon as
+        it is ready. Cancelling deletes the meshes built so far.
+        """
+        try:
+            from core.usd import UsdMeshReader
+        except ImportError:
+            om.MGlobal.displayError("USD support is not available; load the mayaUsdPlugin and try again.")
+            return
+
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Import USD Folder")
+        if not folder:
+            return
+        paths = UsdMeshReader.find_files(folder)
+        if not paths:
+            om.MGlobal.displayWarning(f"No USD files found in {folder}")
+            return
+
+        try:
+            executor = WorkerPool.create(WorkerPool.default_workers(len(paths)))
+        except RuntimeError as e:
+            om.MGlobal.displayError(str(e))
+            return
+
+        # Workers hand meshes over through the cache; without it, use a throwaway one.
+        use_cache = self.use_cache_cb.isChecked()
+        cache = self.mesh_cache if use_cache else MeshCache(tempfile.mkdtemp(prefix="maks_polyporter_"))
+        options = {"up_axis": cmds.upAxis(query=True, axis=True),
+                   "meters_per_unit": MeshHelper.scene_meters_per_unit()}
+        polygroup_colors = self.polygroup_colors_cb.isChecked()
+
+        futures = [executor.submit(UsdMeshReader.cache_file, path, cache.root, options) for path in paths]
+        created = []
+
+        def process(future):
+            try:
+                path, _ = future.result()
+            except ValueError as e:
+                om.MGlobal.displayWarning(str(e))
+                return
+            except Exception as e:
+                # E.g. a worker without USD support: parse this file here instead.
+                path = paths[futures.index(future)]
+                om.MGlobal.displayWarning(f"Worker failed on {path} ({e}); importing it in Maya.")
+            try:
+                created.extend(MeshHelper.create_meshes(cache.read(path, UsdMeshReader.read, **options),
+                                                        polygroup_colors))
+            except (ValueError, OSError) as e:
+                om.MGlobal.displayWarning(str(e))
+
+        def clean_up():
+            if not use_cache:
+                shutil.rmtree(cache.root, ignore_errors=True)
+
+        def complete():
+            clean_up()
+            if created:
+                cmds.select(created, replace=True)
+            om.MGlobal.displayInfo(f"Imported {len(created)} mesh(es) from {len(paths)} file(s) in {folder}")
+
+        def rollback():
+            existing = [mesh for mesh in created if cmds.objExists(mesh)]
+            if existing:
+                cmds.delete(existing)
+            clean_up()
+
+        task = FutureTask(executor, futures, process, complete, rollback, label="Importing", parent=self)
+        self.task_progress_bar.run(task)
+
+    @profiled()
+    def export_usd(self):
+        """Export the selected meshes to a USD file picked by the user."""
+        try:
+            from core.usd import UsdMeshReader, UsdMeshWriter
+        except ImportError:
+            om.MGlobal.displayError("USD support is not available; load the mayaUsdPlugin and try again.")
+            return
+
+        shapes = cmds.ls(selection=True, dag=True, type="mesh", noIntermediate=True, long=True)
+        if not shapes:
+            om.MGlobal.displayWarning("Please select at least one mesh to export.")
+            return
+
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export USD", "", UsdMeshReader.FILE_FILTER)
+        if not path:
+            return
+
+        # Read each mesh only when the writer asks for it, so one mesh is held at a time.
+        meters_per_unit = MeshHelper.scene_meters_per_unit()
+        meshes = (MeshHelper.read_mesh(shape, meters_per_unit=meters_per_unit) for shape in shapes)
+        try:
+            written = UsdMeshWriter.write(path, meshes, up_axis=cmds.upAxis(query=True, axis=True),
+                                          meters_per_unit=meters_per_unit)
+        except (ValueError, RuntimeError) as e:
+            om.MGlobal.displayError(str(e))
+            return
+        om.MGlobal.displayInfo(f"Exported {len(written)} mesh(es) to {path}")
+
+    def keyPressEvent(self, e):
+        """Reserved for keyboard shortcut overrides (optional)."""
+        pass
+
+
+if __name__ == "__main__":
+    workspace_control_name = f"{PolyporterWidget.OBJECT_NAME}WorkspaceControl"
 
-class PolyporterWidget:
-    """Handles polygon data exchange between ZBrush and Maya using USD format.
+    if cmds.workspaceControl(workspace_control_name, exists=True):
+        cmds.workspaceControl(workspace_control_name, edit=True, close=True)
+        cmds.deleteUI(workspace_control_name)
 
-    This class will provide methods to:
-    - Export ZBrush polygons with polygroups to USD
-    - Import USD files into Maya with preserved polygroup data as vertex colors
-    - Convert between polygroups and vertex color representations
-    """
-    pass
+    polyporter_tool = PolyporterWidget()
+    polyporter_tool.show(dockable=True)
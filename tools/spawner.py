@@ -3,15 +3,239 @@
 This module provides functionality to create various utility objects such as
 control curves and visualization cubes that are commonly used in rigging tasks.
 These objects help in manipulating and visualizing the rig's behavior and structure.
+
+Control curves come from a shape library loaded once from
+data/control_shapes.json. One click spawns a control for every selected
+transform or joint, matched to its world transform through offsetParentMatrix
+and optionally colored, in a single batched, undoable pass.
+
+Skin proxies visualize skinned mesh behavior: one combined mesh holding a
+bone-aligned box per joint, rigidly skinned so each box follows its joint.
+
+The picked shape and options are restored in the next session (see
+SpawnerSettings).
 """
 
+from ui.widgets import ColorSwatch, CustomPushButton, CustomDialog, SelectionCountLabel, QtWidgets, QtCore, QtGui
+from core.constants import NORMAL_AXES, PROXY_WIDTH_RATIO
+from core.control import ControlHelper, ControlShapes, cmds, om
+from core.joint import JointHelper
+from core.profiling import profiled
+from core.proxy import ProxyHelper
+from core.selection import SelectionService
+from core.settings import SpawnerSettings
+
+
+class SpawnerWidget(CustomDialog):
+    """Dockable UI spawning control curves from the shape library."""
+
+    OBJECT_NAME = "Spawner"
+    SETTINGS_CLASS = SpawnerSettings
+
+    def __init__(self, parent=None):
+        """Construct the UI and set up an internal state."""
+        super().__init__(parent)
+        self.setObjectName(self.OBJECT_NAME)
+
+        self.shape_list = None
+        self.size_sb = None
+        self.normal_btn_grp = None
+        self.color_cb = None
+        self.color_swatch = None
+        self.spawn_btn = None
+        self.width_ratio_sb = None
+        self.all_joints_cb = None
+        self.proxy_btn = None
+        self.selection_count_lbl = None
+
+        self.setup_ui()
+
+    def create_widgets(self):
+        """Create the shape list, options and spawn button."""
+        self.shape_list = QtWidgets.QListWidget()
+        self.shape_list.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
+        self.shape_list.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.shape_list.setMovement(QtWidgets.QListView.Movement.Static)
+        self.shape_list.setGridSize(QtCore.QSize(72, 28))
+        try:
+            shape_names = ControlShapes.names()
+        except (OSError, ValueError) as e:
+            om.MGlobal.displayError(f"Could not load the control shapes: {e}")
+            shape_names = []
+        for name in shape_names:
+            self.shape_list.addItem(name)
+        if shape_names:
+            self.shape_list.setCurrentRow(0)
+
+        self.size_sb = QtWidgets.QDoubleSpinBox()
+        self.size_sb.setRange(0.01, 1000.0)
+        self.size_sb.setDecimals(2)
+        self.size_sb.setSingleStep(0.5)
+        self.size_sb.setValue(1.0)
+
+        self.normal_btn_grp = QtWidgets.QButtonGroup(self)
+        for index, axis in enumerate(NORMAL_AXES):
+            button = QtWidgets.QRadioButton(axis.upper())
+            button.setChecked(axis == "x")
+            self.normal_btn_grp.addButton(button, index)
+
+        self.color_cb = QtWidgets.QCheckBox("Color")
+        self.color_cb.setChecked(True)
+        self.color_swatch = ColorSwatch((1.0, 0.85, 0.1))
+        self.color_swatch.setCheckable(False)
+        self.color_swatch.setToolTip("Click to pick the control color")
+
+        self.spawn_btn = CustomPushButton("Spawn Controls")
+        self.spawn_btn.setToolTip("Create one control per selected transform or joint, "
+                                  "or one at the origin if nothing is selected")
+
+        self.width_ratio_sb = QtWidgets.QDoubleSpinBox()
+        self.width_ratio_sb.setRange(0.01, 2.0)
+        self.width_ratio_sb.setDecimals(2)
+        self.width_ratio_sb.setSingleStep(0.05)
+        self.width_ratio_sb.setValue(PROXY_WIDTH_RATIO)
+        self.width_ratio_sb.setToolTip("Box width relative to the bone length")
+
+        self.all_joints_cb = QtWidgets.QCheckBox("All Joints")
+        self.all_joints_cb.setToolTip("Use every joint in the scene instead of the selected hierarchies")
+
+        self.proxy_btn = CustomPushButton("Create Skin Proxy")
+        self.proxy_btn.setToolTip("Create one mesh with a box per joint, rigidly skinned to the joints")
+
+        self.selection_count_lbl = SelectionCountLabel(("transforms", "joints"))
+
+    def create_layout(self):
+        """Lay out the shape list, options and spawn button."""
+        options_layout = QtWidgets.QHBoxLayout()
+        options_layout.addWidget(QtWidgets.QLabel("Size:"))
+        options_layout.addWidget(self.size_sb)
+        options_layout.addSpacing(8)
+        options_layout.addWidget(QtWidgets.QLabel("Normal:"))
+        for button in self.normal_btn_grp.buttons():
+            options_layout.addWidget(button)
+        options_layout.addStretch()
+        options_layout.addWidget(self.color_cb)
+        options_layout.addWidget(self.color_swatch)
+
+        controls_layout = QtWidgets.QVBoxLayout()
+        controls_layout.addWidget(self.shape_list)
+        controls_layout.addLayout(options_layout)
+        controls_layout.addWidget(self.spawn_btn)
+
+        controls_grp = QtWidgets.QGroupBox("Control Curves")
+        controls_grp.setLayout(controls_layout)
+
+        proxy_options_layout = QtWidgets.QHBoxLayout()
+        proxy_options_layout.addWidget(QtWidgets.QLabel("Width Ratio:"))
+        proxy_options_layout.addWidget(self.width_ratio_sb)
+        proxy_options_layout.addStretch()
+        proxy_options_layout.addWidget(self.all_joints_cb)
+
+        proxy_layout = QtWidgets.QVBoxLayout()
+        proxy_layout.addLayout(proxy_options_layout)
+        proxy_layout.addWidget(self.proxy_btn)
+
+        proxy_grp = QtWidgets.QGroupBox("Skin Proxy")
+        proxy_grp.setLayout(proxy_layout)
+
+        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout.addWidget(controls_grp)
+        main_layout.addWidget(proxy_grp)
+        main_layout.addWidget(self.selection_count_lbl)
+        main_layout.addStretch()
+
+    def create_connections(self):
+        """Connect widget signals to actions."""
+        self.color_cb.toggled.connect(self.color_swatch.setEnabled)
+        self.color_swatch.clicked.connect(lambda: self.pick_color())
+        self.shape_list.itemDoubleClicked.connect(lambda: self.spawn_controls())
+        self.spawn_btn.clicked.connect(lambda: self.spawn_controls())
+        self.proxy_btn.clicked.connect(lambda: self.create_skin_proxy())
+
+    def settings_widgets(self):
+        """Return the widgets whose values make up the SpawnerSettings (the swatch is read on pick)."""
+        return [self.shape_list, self.size_sb, self.normal_btn_grp, self.color_cb, self.width_ratio_sb,
+                self.all_joints_cb]
+
+    def read_settings(self):
+        """Read the widgets into new settings.
+
+        Returns:
+            SpawnerSettings: The settings shown by the widgets.
+        """
+        item = self.shape_list.currentItem()
+        return SpawnerSettings(shape=item.text() if item is not None else "",
+                               size=self.size_sb.value(),
+                               normal=NORMAL_AXES[self.normal_btn_grp.checkedId()],
+                               color_enabled=self.color_cb.isChecked(),
+                               color=self.color_swatch.color(),
+                               width_ratio=self.width_ratio_sb.value(),
+                               all_joints=self.all_joints_cb.isChecked())
+
+    def write_settings(self, settings):
+        """Show settings in the widgets.
+
+        Args:
+            settings (SpawnerSettings): The settings to show; a shape missing
+                from the library leaves the current pick.
+        """
+        items = self.shape_list.findItems(settings.shape, QtCore.Qt.MatchFlag.MatchExactly)
+        if items:
+            self.shape_list.setCurrentItem(items[0])
+        self.size_sb.setValue(settings.size)
+        self.normal_btn_grp.button(NORMAL_AXES.index(settings.normal)).setChecked(True)
+        self.color_cb.setChecked(settings.color_enabled)
+        self.color_swatch.setEnabled(settings.color_enabled)
+        self.color_swatch.set_color(settings.color)
+        self.width_ratio_sb.setValue(settings.width_ratio)
+        self.all_joints_cb.setChecked(settings.all_joints)
+
+    def pick_color(self):
+        """Open a color dialog and store the chosen control color."""
+        initial = QtGui.QColor.fromRgbF(*self.color_swatch.color())
+        color = QtWidgets.QColorDialog.getColor(initial, self, "Pick Control Color")
+        if color.isValid():
+            self.color_swatch.set_color((color.redF(), color.greenF(), color.blueF()))
+            self.refresh_settings()
+
+    @profiled()
+    def spawn_controls(self):
+        """Spawn the selected shape on every selected transform and select the new controls."""
+        settings = self.settings()
+        if not settings.shape:
+            om.MGlobal.displayWarning("Please pick a control shape.")
+            return
+
+        targets = SelectionService.instance().transforms()
+        color = settings.color if settings.color_enabled else None
+        controls = ControlHelper.spawn_controls(settings.shape, targets, settings.size, settings.normal, color)
+        cmds.select(controls, replace=True)
+
+    @profiled()
+    def create_skin_proxy(self):
+        """Create a skin proxy for the selected joint hierarchies, or all joints, and select it."""
+        settings = self.settings()
+        all_joints = settings.all_joints
+        joints = JointHelper.get_joints(hierarchy=not all_joints, all_joints=all_joints)
+        if not joints:
+            om.MGlobal.displayWarning("Please select joints, or check All Joints.")
+            return
+
+        proxy = ProxyHelper.create_proxy(joints, settings.width_ratio)
+        if proxy:
+            cmds.select(proxy, replace=True)
+
+    def keyPressEvent(self, e):
+        """Reserved for keyboard shortcut overrides (optional)."""
+        pass
+
+
+if __name__ == "__main__":
+    workspace_control_name = f"{SpawnerWidget.OBJECT_NAME}WorkspaceControl"
+
+    if cmds.workspaceControl(workspace_control_name, exists=True):
+        cmds.workspaceControl(workspace_control_name, edit=True, close=True)
+        cmds.deleteUI(workspace_control_name)
 
-class SpawnerWidget:
-    """Handles creation of utility objects for Maya rigging.
-    
-    This class will provide methods to:
-    - Spawn control curves of different shapes for rig manipulation
-    - Create cube objects for visualizing skinned mesh behavior
-    - Generate other utility objects needed for rigging tasks
-    """
-    pass
+    spawner_tool = SpawnerWidget()
+    spawner_tool.show(dockable=True)
@@ -0,0 +1,315 @@
+"""Live joint orientation preview drawn as a viewport overlay.
+
+OrientPreview recomputes joint orientations while the user changes settings in
+the Orienter and draws the resulting axes in the viewport without editing any
+joint. The solve runs on a worker thread from Qt's global thread pool, and
+rapid setting changes are coalesced with a debounce timer. The preview follows
+the joint selection through a SelectionService listener.
+
+Joint data has to be read on the main thread, since the Maya API is not
+thread-safe. It is read once per set of joints and reused while only the
+settings change; a selection change, an undo/redo or an edit made by the
+Orienter (see invalidate()) reads it again.
+
+Viewport 2.0 only draws for DAG nodes, so the axes are drawn by one helper
+locator, maksAxisPreview, whose draw override reads the latest result. The
+locator exists only while the preview is on: it is hidden in the Outliner,
+flagged so it is never written to a file, created and deleted outside the undo
+queue, and deleted before every scene save (and created again afterwards).
+"""
+
+import os
+
+import numpy as np
+from PySide6 import QtCore
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaUI as om2ui
+import maya.api.OpenMayaRender as omr
+
+from core.joint import JointHelper
+from core.orient import OrientSolver
+from core.selection import SelectionService
+
+
+class AxisPreviewLocator(om2ui.MPxLocatorNode):
+    """Empty locator node whose only purpose is to host the preview draw override."""
+
+    NODE_NAME = "maksAxisPreview"
+    TYPE_ID = om2.MTypeId(0x0007F3A1)
+    DRAW_CLASSIFICATION = "drawdb/geometry/maksAxisPreview"
+    DRAW_REGISTRANT_ID = "MaksAxisPreview"
+
+    @classmethod
+    def creator(cls):
+        return cls()
+
+    @classmethod
+    def initialize(cls):
+        pass
+
+    def isBounded(self):
+        return False
+
+
+class AxisPreviewDrawOverride(omr.MPxDrawOverride):
+    """Draws the axis segments stored in `segments` as colored line lists."""
+
+    # Same hues as the X/Y/Z labels in the Orienter.
+    AXIS_COLORS = (om2.MColor((1.0, 0.455, 0.455)),
+                   om2.MColor((0.455, 1.0, 0.455)),
+                   om2.MColor((0.455, 0.455, 1.0)))
+    LINE_WIDTH = 2.0
+
+    # (3, 2 * N, 3) array: for each axis, start/end point pairs.
+    segments = None
+
+    def __init__(self, obj):
+        super().__init__(obj, None, True)
+
+    @classmethod
+    def creator(cls, obj):
+        return cls(obj)
+
+    def supportedDrawAPIs(self):
+        return omr.MRenderer.kAllDevices
+
+    def isBounded(self, obj_path, camera_path):
+        return False
+
+    def hasUIDrawables(self):
+        return True
+
+    def prepareForDraw(self, obj_path, camera_path, frame_context, old_data):
+        return None
+
+    def addUIDrawables(self, obj_path, draw_manager, frame_context, data):
+        segments = AxisPreviewDrawOverride.segments
+        if segments is None or not segments.shape[1]:
+            return
+
+        draw_manager.beginDrawable()
+        draw_manager.setLineWidth(self.LINE_WIDTH)
+        for color, points in zip(self.AXIS_COLORS, segments):
+            draw_manager.setColor(color)
+            draw_manager.lineList(om2.MPointArray(points.tolist()), False)
+        draw_manager.endDrawable()
+
+
+class _SolveSignals(QtCore.QObject):
+    """Signals emitted by _SolveTask; delivered on the main thread."""
+
+    finished = QtCore.Signal(int, object)
+
+
+class _SolveTask(QtCore.QRunnable):
+    """Solve orientations for a snapshot of plain arrays on a worker thread."""
+
+    def __init__(self, generation, signals, arrays, settings):
+        super().__init__()
+        self.generation = generation
+        self.signals = signals
+        self.arrays = arrays
+        self.settings = settings
+
+    def run(self):
+        positions, parent_indices, rotations, parent_rotations, targets = self.arrays
+        frames = OrientSolver.orient_frames(positions, parent_indices, rotations, parent_rotations,
+                                            targets, *self.settings)
+        segments = OrientPreview.axis_segments(positions, parent_indices, frames, targets)
+        self.signals.finished.emit(self.generation, segments)
+
+
+class OrientPreview(QtCore.QObject):
+    """Debounced, threaded orientation preview for the Orienter.
+
+    Call request() whenever a setting changes; only the last request within
+    DEBOUNCE_MS is solved, and results from superseded requests are dropped.
+    """
+
+    DEBOUNCE_MS = 150
+    AXIS_LENGTH_RATIO = 0.3
+
+    PLUGIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "plugins", "maks_preview.py")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = False
+
+        self._request = None
+        self._settings = None        # Settings of the last request, replayed on selection changes.
+        self._snapshot = None        # ((joints, children), arrays) of the last read.
+        self._generation = 0
+        self._node = None
+        self._callback_ids = []
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._start_solve)
+
+        self._signals = _SolveSignals()
+        self._signals.finished.connect(self._on_solved)
+
+    @classmethod
+    def load_plugin(cls):
+        """Load the plug-in registering the preview locator if needed."""
+        if not cmds.pluginInfo(cls.PLUGIN_PATH, query=True, loaded=True):
+            cmds.loadPlugin(cls.PLUGIN_PATH, quiet=True)
+
+    def set_enabled(self, enabled):
+        """Turn the preview on or off, creating or deleting the overlay node."""
+        if enabled == self.enabled:
+            return
+
+        self.enabled = enabled
+        if enabled:
+            self._create_node()
+            self._install_callbacks()
+        else:
+            self._remove_callbacks()
+            self._timer.stop()
+            self._request = None
+            self._settings = None
+            self._snapshot = None
+            self._generation += 1
+            AxisPreviewDrawOverride.segments = None
+            self._delete_node()
+
+    def request(self, joints, orient_order, secondary_axis, auto_orient=False, children=False):
+        """Schedule a preview for joints with the given orientation settings.
+
+        Args are the same as JointHelper.orient_joints.
+        """
+        if not self.enabled:
+            return
+        self._settings = (orient_order, secondary_axis, auto_orient, children)
+        self._request = (list(joints), *self._settings)
+        self._timer.start()
+
+    def invalidate(self):
+        """Read the joints again on the next solve, e.g. after they were edited."""
+        self._snapshot = None
+        if self.enabled and self._request is None and self._settings is not None:
+            self._request = (SelectionService.instance().joints(), *self._settings)
+            self._timer.start()
+
+    @classmethod
+    def axis_segments(cls, positions, parent_indices, frames, targets):
+        """Build line segments for the axes of the targeted joints.
+
+        Axis length is a fraction of the distance to the first child; leaf
+        joints use the median length of the other joints.
+
+        Returns:
+            numpy.ndarray: (3, 2 * N, 3) start/end points for each axis.
+        """
+        indices = np.flatnonzero(targets)
+        first_child = OrientSolver.first_children(parent_indices)[indices]
+        has_child = first_child >= 0
+
+        lengths = np.full(len(indices), np.nan)
+        lengths[has_child] = np.linalg.norm(positions[first_child[has_child]] - positions[indices[has_child]],
+                                            axis=-1) * cls.AXIS_LENGTH_RATIO
+        default_length = np.median(lengths[has_child]) if has_child.any() else 1.0
+        lengths[~has_child] = default_length
+
+        starts = positions[indices]
+        segments = np.empty((3, 2 * len(indices), 3))
+        for axis in range(3):
+            segments[axis, 0::2] = starts
+            segments[axis, 1::2] = starts + frames[indices, axis] * lengths[:, None]
+        return segments
+
+    def _start_solve(self):
+        if not self._request:
+            return
+
+        joints, orient_order, secondary_axis, auto_orient, children = self._request
+        self._request = None
+        self._generation += 1
+
+        key = (tuple(joints), children)
+        if self._snapshot is None or self._snapshot[0] != key:
+            # The only Maya read on the GUI thread; setting changes reuse it.
+            arrays, targets = JointHelper.read_orient_targets(joints, children)
+            self._snapshot = (key, (arrays.positions.copy(), arrays.parent_indices, arrays.rotations,
+                                    arrays.parent_rotations, targets))
+        task = _SolveTask(self._generation, self._signals, self._snapshot[1],
+                          (orient_order, secondary_axis, auto_orient))
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_solved(self, generation, segments):
+        if not self.enabled or generation != self._generation:
+            return
+        AxisPreviewDrawOverride.segments = segments
+        cmds.refresh(currentView=True)
+
+    def _on_selection_changed(self, snapshot):
+        if self._settings is not None:
+            self._snapshot = None
+            self._request = (snapshot.names("joints"), *self._settings)
+            self._timer.start()
+
+    def _on_before_save(self, client_data=None):
+        self._delete_node()
+
+    def _on_after_save(self, client_data=None):
+        if self.enabled:
+            self._create_node()
+
+    def _on_undo(self, client_data=None):
+        self.invalidate()
+
+    def _install_callbacks(self):
+        SelectionService.instance().add_listener(self._on_selection_changed)
+        self._callback_ids = [
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeSave, self._on_before_save),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterSave, self._on_after_save),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, self._on_after_save),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, self._on_after_save),
+            om2.MEventMessage.addEventCallback("Undo", self._on_undo),
+            om2.MEventMessage.addEventCallback("Redo", self._on_undo),
+        ]
+
+    def _remove_callbacks(self):
+        SelectionService.instance().remove_listener(self._on_selection_changed)
+        if self._callback_ids:
+            om2.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
+
+    def _create_node(self):
+        if self._node and cmds.objExists(self._node):
+            return
+
+        self.load_plugin()
+        undo_state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+        cmds.undoInfo(stateWithoutFlush=False)
+        try:
+            shape = cmds.createNode(AxisPreviewLocator.NODE_NAME, name=f"{AxisPreviewLocator.NODE_NAME}Shape",
+                                    skipSelect=True)
+            self._node = cmds.listRelatives(shape, parent=True, fullPath=True)[0]
+            cmds.setAttr(f"{self._node}.hiddenInOutliner", True)
+
+            selection = om2.MSelectionList()
+            selection.add(self._node)
+            selection.add(shape)
+            for index in range(selection.length()):
+                om2.MFnDependencyNode(selection.getDependNode(index)).setDoNotWrite(True)
+        finally:
+            cmds.undoInfo(stateWithoutFlush=undo_state)
+
+    def _delete_node(self):
+        if not self._node:
+            return
+
+        undo_state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+        cmds.undoInfo(stateWithoutFlush=False)
+        try:
+            if cmds.objExists(self._node):
+                cmds.delete(self._node)
+        finally:
+            cmds.undoInfo(stateWithoutFlush=undo_state)
+            self._node = None
@@ -0,0 +1,275 @@
+"""Chunked, cancellable execution of scene-wide operations.
+
+A ChunkedTask processes a long list of items a chunk at a time from zero-delay
+Qt timers, so Maya repaints and handles input between chunks instead of
+freezing until the whole list is done. Chunk sizes adapt to keep each step
+within FRAME_BUDGET_MS.
+
+Given an undo chunk name, a task keeps that undo chunk open from start() until
+it completes or is cancelled, and each chunk commits inside it. Edits the user
+makes while the task runs join the chunk in the order they happened, so one
+undo reverts the task and those edits together, newest first, and no edit is
+overwritten by values read before it.
+
+A FutureTask does the same for work running in a process or thread pool: it
+hands each result to the main thread as soon as it is ready.
+"""
+
+import time
+
+from PySide6 import QtCore
+
+import maya.cmds as cmds
+
+from core.attribute import AttributeWriter
+
+
+class ChunkedTask(QtCore.QObject):
+    """Run process(chunk) over items across event loop iterations.
+
+    Signals:
+        progress(int, int): Items processed so far and the total.
+        finished(bool): True when every item was processed, False if cancelled.
+    """
+
+    FRAME_BUDGET_MS = 16.0
+    INITIAL_CHUNK_SIZE = 500
+    MIN_CHUNK_SIZE = 50
+    MAX_CHUNK_SIZE = 50000
+
+    # Operations on fewer items than this are not worth chunking.
+    MIN_ITEMS = 5000
+
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal(bool)
+
+    def __init__(self, items, process, complete=None, rollback=None, label="", parent=None, undo_chunk=None):
+        """Prepare the task; call start() to run it.
+
+        Args:
+            items (Sequence): Items to process.
+            process (Callable[[Sequence], None]): Called with each chunk.
+            complete (Callable[[], None] | None): Called once every chunk ran.
+            rollback (Callable[[], None] | None): Called when cancelled.
+            label (str): Short description shown next to the progress bar.
+            parent (QObject | None): Parent object.
+            undo_chunk (str | None): Name of an undo chunk kept open while the
+                task runs; complete and rollback run inside it.
+        """
+        super().__init__(parent)
+        self.items = items
+        self.label = label
+        self.chunk_size = self.INITIAL_CHUNK_SIZE
+        self.position = 0
+        self.running = False
+
+        self._process = process
+        self._complete = complete
+        self._rollback = rollback
+        self._undo_chunk = undo_chunk
+        self._chunk_open = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_chunk)
+
+    @classmethod
+    def write_attribute(cls, nodes, attribute, value, undoable=True, failure_message="Failed to set attribute",
+                        label="", parent=None):
+        """Create a task setting one attribute on many nodes in chunks.
+
+        Each chunk is committed as it goes, inside one undo chunk unless
+        undoable is False (see the module docstring). Cancelling writes back
+        the values the nodes had before, skipping nodes deleted meanwhile.
+
+        Args:
+            nodes (Sequence[str]): Node names or DAG paths.
+            attribute (str): Attribute name.
+            value (bool | int | float): Value set on every node.
+            undoable (bool): Record the finished operation in the undo queue.
+            failure_message (str): Prefix of the warnings for unwritable nodes.
+            label (str): Short description shown next to the progress bar.
+            parent (QObject | None): Parent object.
+
+        Returns:
+            ChunkedTask: The task, not started yet.
+        """
+        writer = AttributeWriter()
+        # (node, (handle, value) or None) per processed node, for rollback.
+        previous = []
+
+        def process(chunk):
+            previous.extend(zip(chunk, writer.read_many(chunk, attribute)))
+            writer.set_many(chunk, attribute, value)
+            writer.commit(undoable)
+
+        def complete():
+            writer.report_failures(failure_message)
+
+        def rollback():
+            restore = AttributeWriter()
+            for node, state in previous:
+                if state is not None and state[0].isValid():
+                    restore.set(node, attribute, state[1])
+            restore.commit(undoable)
+
+        return cls(nodes, process, complete, rollback, label, parent,
+                   undo_chunk="maksChunkedTask" if undoable else None)
+
+    def start(self):
+        """Start processing on the next event loop iteration."""
+        if self._undo_chunk and not self._chunk_open:
+            cmds.undoInfo(openChunk=True, chunkName=self._undo_chunk)
+            self._chunk_open = True
+        self.running = True
+        self.progress.emit(self.position, len(self.items))
+        self._timer.start()
+
+    def cancel(self):
+        """Stop processing and roll back the chunks that already ran."""
+        if not self.running:
+            return
+        self._timer.stop()
+        self.running = False
+        try:
+            if self._rollback:
+                self._rollback()
+        finally:
+            self._close_undo_chunk()
+        self.finished.emit(False)
+
+    def _run_chunk(self):
+        if not self.running:
+            return
+
+        start = time.perf_counter()
+        chunk = self.items[self.position:self.position + self.chunk_size]
+        try:
+            self._process(chunk)
+        except Exception:
+            self.cancel()
+            raise
+        self.position += len(chunk)
+        self._tune_chunk_size((time.perf_counter() - start) * 1000.0, len(chunk))
+        self.progress.emit(self.position, len(self.items))
+
+        if self.position < len(self.items):
+            self._timer.start()
+            return
+
+        self.running = False
+        try:
+            if self._complete:
+                self._complete()
+        finally:
+            self._close_undo_chunk()
+        self.finished.emit(True)
+
+    def _close_undo_chunk(self):
+        if self._chunk_open:
+            cmds.undoInfo(closeChunk=True)
+            self._chunk_open = False
+
+    def _tune_chunk_size(self, elapsed_ms, processed):
+        if not processed or elapsed_ms <= 0:
+            return
+        # Aim the next chunk at the frame budget, changing by at most 2x per step.
+        target = processed * self.FRAME_BUDGET_MS / elapsed_ms
+        target = min(max(target, self.chunk_size / 2.0), self.chunk_size * 2.0)
+        self.chunk_size = int(min(max(target, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE))
+
+
+class FutureTask(QtCore.QObject):
+    """Handle the results of background futures on the main thread as they complete.
+
+    Work runs in a concurrent.futures executor; this task polls the futures
+    from a Qt timer and calls process(future) for each finished one, in
+    completion order, so the main thread works on early results while later
+    ones are still running. It has the same signals as ChunkedTask and can be
+    shown by a TaskProgressBar.
+
+    Signals:
+        progress(int, int): Futures processed so far and the total.
+        finished(bool): True when every future was processed, False if cancelled.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal(bool)
+
+    def __init__(self, executor, futures, process, complete=None, rollback=None, label="", parent=None):
+        """Prepare the task; call start() to run it.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor running the
+                futures; it is shut down when the task ends.
+            futures (Sequence[concurrent.futures.Future]): Futures to wait for.
+            process (Callable[[Future], None]): Called with each finished
+                future on the main thread; it should handle the future's
+                exception if it may have one.
+            complete (Callable[[], None] | None): Called once every future was processed.
+            rollback (Callable[[], None] | None): Called when cancelled.
+            label (str): Short description shown next to the progress bar.
+            parent (QObject | None): Parent object.
+        """
+        super().__init__(parent)
+        self.executor = executor
+        self.pending = list(futures)
+        self.total = len(self.pending)
+        self.label = label
+        self.running = False
+
+        self._process = process
+        self._complete = complete
+        self._rollback = rollback
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self):
+        """Start polling on the next event loop iteration."""
+        self.running = True
+        self.progress.emit(0, self.total)
+        self._timer.start(0)
+
+    def cancel(self):
+        """Cancel the futures not started yet, stop polling and roll back what was processed."""
+        if not self.running:
+            return
+        self._timer.stop()
+        self.running = False
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self._rollback:
+            self._rollback()
+        self.finished.emit(False)
+
+    def _poll(self):
+        if not self.running:
+            return
+
+        future = next((future for future in self.pending if future.done()), None)
+        if future is None:
+            self._timer.start(self.POLL_INTERVAL_MS)
+            return
+
+        # One future per timer event keeps Maya responsive between results.
+        self.pending.remove(future)
+        try:
+            self._process(future)
+        except Exception:
+            self.cancel()
+            raise
+        self.progress.emit(self.total - len(self.pending), self.total)
+
+        if self.pending:
+            self._timer.start(0)
+            return
+
+        self.running = False
+        self.executor.shutdown(wait=False)
+        if self._complete:
+            self._complete()
+        self.finished.emit(True)
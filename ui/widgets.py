@@ -2,14 +2,21 @@
 
 This module defines small widgets and a base dialog class suitable for creating
 Maya-dockable tools. All dialogs inherit MayaQWidgetDockableMixin to support
-workspace control docking inside Maya.
+workspace control docking inside Maya. Dialogs with a SETTINGS_CLASS keep an
+immutable settings object in sync with their widgets and restore it in the
+next session.
 """
 
-from PySide6 import QtWidgets, QtCore
+import contextlib
+
+from PySide6 import QtWidgets, QtCore, QtGui
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 import maya.OpenMaya as om
 import maya.cmds as cmds
 
+from core.profiling import Profiler
+from core.selection import SelectionService
+
 
 class CustomLabel(QtWidgets.QLabel):
     """Colored, center-aligned label used as an axis tag or badge."""
@@ -93,10 +100,299 @@ class CustomPushButton(QtWidgets.QPushButton):
         self.setFixedHeight(self.BUTTON_HEIGHT)
 
 
+class ColorSwatch(QtWidgets.QAbstractButton):
+    """Checkable, custom-painted color swatch.
+
+    Painting a flat rectangle avoids per-button stylesheets, so checking a
+    swatch only repaints that swatch and the one that was unchecked.
+    """
+
+    SWATCH_SIZE = 30
+    BORDER_WIDTH = 2
+    BORDER_COLOR = QtGui.QColor("white")
+
+    def __init__(self, color=(0.0, 0.0, 0.0), parent=None):
+        """Initialize the swatch.
+
+        Args:
+            color (Sequence[float]): RGB values in the 0-1 range.
+            parent (QWidget | None): Parent widget.
+        """
+        super().__init__(parent)
+        self.setCheckable(True)
+        self.setFixedSize(self.SWATCH_SIZE, self.SWATCH_SIZE)
+        self._color = QtGui.QColor()
+        self.set_color(color)
+
+    def set_color(self, color):
+        """Set the swatch color and repaint it if it changed.
+
+        Args:
+            color (Sequence[float]): RGB values in the 0-1 range.
+        """
+        new_color = QtGui.QColor.fromRgbF(*color[:3])
+        if new_color != self._color:
+            self._color = new_color
+            self.update()
+
+    def color(self):
+        """Return the swatch color.
+
+        Returns:
+            tuple[float, float, float]: RGB values in the 0-1 range.
+        """
+        return self._color.redF(), self._color.greenF(), self._color.blueF()
+
+    def sizeHint(self):
+        return QtCore.QSize(self.SWATCH_SIZE, self.SWATCH_SIZE)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), self._color)
+        if self.isChecked():
+            pen = QtGui.QPen(self.BORDER_COLOR, self.BORDER_WIDTH)
+            pen.setJoinStyle(QtCore.Qt.PenJoinStyle.MiterJoin)
+            painter.setPen(pen)
+            half_width = self.BORDER_WIDTH // 2
+            painter.drawRect(self.rect().adjusted(half_width, half_width, -half_width, -half_width))
+
+
+class TaskProgressBar(QtWidgets.QWidget):
+    """Progress bar with a Cancel button for a ChunkedTask or FutureTask; hidden while idle."""
+
+    def __init__(self, parent=None):
+        """Initialize the hidden progress bar.
+
+        Args:
+            parent (QWidget | None): Parent widget.
+        """
+        super().__init__(parent)
+        self.task = None
+
+        self.label = QtWidgets.QLabel()
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel)
+
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.label)
+        layout.addWidget(self.progress_bar, 1)
+        layout.addWidget(self.cancel_btn)
+
+        self.hide()
+
+    def run(self, task):
+        """Show progress for task and start it, cancelling any task still running.
+
+        Args:
+            task (ChunkedTask | FutureTask): The task to run.
+        """
+        self.cancel()
+        self.task = task
+        self.label.setText(task.label)
+        self.progress_bar.setValue(0)
+        task.progress.connect(self.set_progress)
+        task.finished.connect(self.on_finished)
+        self.show()
+        task.start()
+
+    def set_progress(self, done, total):
+        """Update the bar; connected to ChunkedTask.progress."""
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(done)
+
+    def cancel(self):
+        """Cancel the running task, rolling back what it already did."""
+        if self.task is not None and self.task.running:
+            self.task.cancel()
+
+    def on_finished(self, completed):
+        """Hide the bar once the task completed or was cancelled."""
+        if not completed:
+            om.MGlobal.displayWarning(f"{self.task.label or 'Operation'} cancelled; changes were rolled back.")
+        self.task = None
+        self.hide()
+
+
+@contextlib.contextmanager
+def signals_blocked(*objects):
+    """Block the signals of objects while the with block runs.
+
+    Args:
+        *objects (QtCore.QObject): Widgets, button groups...
+    """
+    blockers = [QtCore.QSignalBlocker(obj) for obj in objects]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+class SelectionCountLabel(QtWidgets.QLabel):
+    """Label showing live counts of the selected nodes a tool works on.
+
+    It listens to the shared SelectionService, so it updates on every
+    selection change without polling Maya.
+    """
+
+    def __init__(self, kinds=("joints",), parent=None):
+        """Initialize the label and start listening.
+
+        Args:
+            kinds (Sequence[str]): Kinds to count: 'joints', 'transforms'
+                and/or 'shapes'.
+            parent (QWidget | None): Parent widget.
+        """
+        super().__init__(parent)
+        self.kinds = tuple(kinds)
+        self.setEnabled(False)
+
+        service = SelectionService.instance()
+        listener = self.update_counts
+        service.add_listener(listener)
+        self.destroyed.connect(lambda: service.remove_listener(listener))
+        self.update_counts(service.snapshot())
+
+    def update_counts(self, snapshot):
+        """Show the counts of a selection snapshot.
+
+        Args:
+            snapshot (SelectionSnapshot): The current selection.
+        """
+        counts = snapshot.counts()
+        self.setText("Selected: " + ", ".join(f"{counts[kind]} {kind}" for kind in self.kinds))
+
+
+class TimingsPanel(QtWidgets.QDialog):
+    """Floating window listing recent profiled actions, opened from any CustomDialog.
+
+    Recording is off until "Record timings" is checked. Each top-level action
+    is one row; nested helper calls are listed below it.
+    """
+
+    OBJECT_NAME = "MAKS Timings"
+    COLUMNS = ("Action", "Time (ms)", "Commands", "Nodes")
+
+    panel_instance = None
+
+    @classmethod
+    def show_panel(cls, parent=None):
+        """Show the shared timings panel, creating it on first use."""
+        if not cls.panel_instance:
+            cls.panel_instance = cls(parent)
+        cls.panel_instance.show()
+        cls.panel_instance.raise_()
+        cls.panel_instance.activateWindow()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName(self.OBJECT_NAME)
+        self.setWindowTitle(self.OBJECT_NAME)
+        self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowType.Tool)
+
+        self.record_cb = None
+        self.timings_tree = None
+        self.clear_btn = None
+        self.export_btn = None
+
+        self.create_widgets()
+        self.create_layout()
+        self.create_connections()
+
+        for record in Profiler.records:
+            self.add_record(record)
+
+    def create_widgets(self):
+        """Create the record toggle, the timings tree and the action buttons."""
+        self.record_cb = QtWidgets.QCheckBox("Record timings")
+        self.record_cb.setChecked(Profiler.enabled)
+
+        self.timings_tree = QtWidgets.QTreeWidget()
+        self.timings_tree.setHeaderLabels(self.COLUMNS)
+        self.timings_tree.setColumnWidth(0, 260)
+        self.timings_tree.setMinimumWidth(480)
+
+        self.clear_btn = QtWidgets.QPushButton("Clear")
+        self.export_btn = QtWidgets.QPushButton("Export JSON...")
+
+    def create_layout(self):
+        """Stack the toggle, the tree and the buttons vertically."""
+        button_layout = QtWidgets.QHBoxLayout()
+        button_layout.addWidget(self.record_cb)
+        button_layout.addStretch()
+        button_layout.addWidget(self.clear_btn)
+        button_layout.addWidget(self.export_btn)
+
+        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout.addWidget(self.timings_tree)
+        main_layout.addLayout(button_layout)
+
+    def create_connections(self):
+        """Connect the controls and start listening for new records."""
+        self.record_cb.toggled.connect(Profiler.set_enabled)
+        self.clear_btn.clicked.connect(self.clear)
+        self.export_btn.clicked.connect(self.export)
+        listener = self.add_record
+        Profiler.listeners.append(listener)
+        self.destroyed.connect(lambda: TimingsPanel._forget(listener))
+
+    @classmethod
+    def _forget(cls, listener):
+        if listener in Profiler.listeners:
+            Profiler.listeners.remove(listener)
+        cls.panel_instance = None
+
+    def add_record(self, record):
+        """Insert a finished top-level record at the top of the tree."""
+        self.timings_tree.insertTopLevelItem(0, self._create_item(record))
+        while self.timings_tree.topLevelItemCount() > Profiler.MAX_RECORDS:
+            self.timings_tree.takeTopLevelItem(Profiler.MAX_RECORDS)
+
+    def clear(self):
+        """Clear the recorded actions and the tree."""
+        Profiler.clear()
+        self.timings_tree.clear()
+
+    def export(self):
+        """Ask for a file and write the recorded actions to it as JSON."""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Timings", "timings.json",
+                                                        "JSON (*.json)")
+        if not path:
+            return
+        count = Profiler.export(path)
+        om.MGlobal.displayInfo(f"Exported {count} timings to {path}")
+
+    def _create_item(self, record):
+        commands = ", ".join(f"{name} x{count}" for name, count in record["commands"].items())
+        item = QtWidgets.QTreeWidgetItem([record["name"],
+                                          f"{record['seconds'] * 1000:.1f}",
+                                          str(record["command_count"]),
+                                          str(record["nodes"])])
+        item.setToolTip(2, commands or "No Maya commands")
+        for column in range(1, len(self.COLUMNS)):
+            item.setTextAlignment(column, QtCore.Qt.AlignmentFlag.AlignRight)
+        for child in record["children"]:
+            item.addChild(self._create_item(child))
+        return item
+
+
 class CustomDialog(MayaQWidgetDockableMixin, QtWidgets.QDialog):
-    """Base dialog that supports Maya workspace docking and a standard setup flow."""
+    """Base dialog that supports Maya workspace docking and a standard setup flow.
+
+    Subclasses with a SETTINGS_CLASS also implement settings_widgets,
+    read_settings and write_settings. The dialog then reads its widgets once
+    per change into an immutable settings object, saves it, and emits
+    settings_changed; actions read settings() instead of the widgets.
+    """
 
     OBJECT_NAME = "CustomDialog"
+    # ToolSettings subclass holding this tool's settings, or None.
+    SETTINGS_CLASS = None
+
+    settings_changed = QtCore.Signal(object)
 
     dlg_instance = None
 
@@ -124,6 +420,7 @@ class CustomDialog(MayaQWidgetDockableMixin, QtWidgets.QDialog):
         calls it in their own __init__ if desired.
         """
         super().__init__(parent)
+        self._settings = None
 
     def create_widgets(self):
         """Create child widgets. To be implemented by subclasses."""
@@ -145,6 +442,80 @@ class CustomDialog(MayaQWidgetDockableMixin, QtWidgets.QDialog):
         self.create_layout()
         self.create_connections()
 
+        if self.SETTINGS_CLASS is not None:
+            self.set_settings(self.SETTINGS_CLASS.load())
+            for widget in self.settings_widgets():
+                self._change_signal(widget).connect(self.refresh_settings)
+
+    # ------------------------------------------------------------ settings
+    def settings_widgets(self):
+        """Return the widgets and button groups read by read_settings. To be implemented by subclasses."""
+        return []
+
+    def read_settings(self):
+        """Return a new SETTINGS_CLASS object read from the widgets. To be implemented by subclasses."""
+        return self.SETTINGS_CLASS()
+
+    def write_settings(self, settings):
+        """Show settings in the widgets. To be implemented by subclasses."""
+        pass
+
+    def settings(self):
+        """Return the current settings, read once per widget change.
+
+        Returns:
+            ToolSettings: The settings.
+        """
+        return self._settings
+
+    def set_settings(self, settings):
+        """Show settings in the widgets without triggering their slots.
+
+        settings_changed is emitted once afterwards if anything changed.
+
+        Args:
+            settings (ToolSettings): The settings to show.
+        """
+        widgets = self.settings_widgets()
+        buttons = [button for widget in widgets if isinstance(widget, QtWidgets.QButtonGroup)
+                   for button in widget.buttons()]
+        with signals_blocked(*widgets, *buttons):
+            self.write_settings(settings)
+        self.refresh_settings()
+
+    def refresh_settings(self, *args):
+        """Read the widgets into new settings, saving and announcing them if they changed."""
+        try:
+            settings = self.read_settings()
+        except ValueError:
+            # Widgets caught between two consistent states; the next change reads them again.
+            return
+        if settings == self._settings:
+            return
+        self._settings = settings
+        settings.save()
+        self.settings_changed.emit(settings)
+
+    @staticmethod
+    def _change_signal(widget):
+        if isinstance(widget, QtWidgets.QButtonGroup):
+            return widget.buttonToggled
+        if isinstance(widget, QtWidgets.QAbstractButton):
+            return widget.toggled
+        if isinstance(widget, QtWidgets.QComboBox):
+            return widget.currentIndexChanged
+        if isinstance(widget, QtWidgets.QListWidget):
+            return widget.currentRowChanged
+        if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            return widget.valueChanged
+        raise TypeError(f"No change signal known for {type(widget).__name__}")
+
+    def contextMenuEvent(self, event):
+        """Offer the opt-in timings panel from the dialog's context menu."""
+        menu = QtWidgets.QMenu(self)
+        menu.addAction("Show Timings...", lambda: TimingsPanel.show_panel(self))
+        menu.exec(event.globalPos())
+
     def keyPressEvent(self, e):
         """Override for keyboard shortcuts in derived tools (optional)."""
         pass